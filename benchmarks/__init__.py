@@ -0,0 +1,6 @@
+'''Benchmarks of the hot paths of the games, run with
+
+    python -m benchmarks [--save PATH] [--compare PATH] [names...]
+'''
+from .core import benchmark, get_benchmarks, run_benchmark  # noqa
+from . import dealer, imports, mahjong, poker, wordplate  # noqa
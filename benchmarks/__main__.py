@@ -0,0 +1,66 @@
+from __future__ import print_function
+
+import argparse
+import sys
+
+from . import get_benchmarks, run_benchmark
+from .core import compare, load_results, save_results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Benchmark the hot paths of the games'
+    )
+    parser.add_argument(
+        'names', nargs='*', help='run the benchmarks matching any of these'
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--scale', type=float, default=1.0, help='scale the corpus sizes'
+    )
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument(
+        '--no-memory', action='store_true', help='skip the memory pass'
+    )
+    parser.add_argument('--save', metavar='PATH', help='save results as JSON')
+    parser.add_argument(
+        '--compare', metavar='PATH', help='compare with a baseline JSON'
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=0.1,
+        help='slowdown ratio taken as a regression, default 0.1'
+    )
+    parser.add_argument('--list', action='store_true')
+    args = parser.parse_args(argv)
+
+    names = get_benchmarks(args.names)
+    if args.list:
+        for name in names:
+            print(name)
+        return 0
+
+    results = []
+    for name in names:
+        result = run_benchmark(
+            name, args.seed, args.scale, args.repeat, not args.no_memory
+        )
+        print(result)
+        results.append(result)
+
+    if args.save:
+        save_results(results, args.save)
+    if args.compare:
+        lines, regressions = compare(
+            results, load_results(args.compare), args.threshold
+        )
+        print('')
+        for line in lines:
+            print(line)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
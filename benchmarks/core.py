@@ -0,0 +1,169 @@
+import gc
+import json
+import random
+import sys
+from collections import OrderedDict
+from timeit import default_timer
+
+try:
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    tracemalloc = None
+
+__all__ = [
+    'benchmark', 'get_benchmarks', 'Result', 'run_benchmark', 'compare',
+    'load_results', 'save_results',
+]
+
+# name -> setup(ran, size) returning (func, corpus), in registering order
+REGISTRY = OrderedDict()
+
+
+def benchmark(name, size=1000):
+    '''Register a setup function which returns the function to measure and
+    the corpus to call it with, size is the default corpus size.
+    '''
+    def wrapper(setup):
+        REGISTRY[name] = (setup, size)
+        return setup
+    return wrapper
+
+
+def get_benchmarks(patterns=None):
+    names = list(REGISTRY)
+    if patterns:
+        names = [name for name in names
+                 if any(pattern in name for pattern in patterns)]
+    return names
+
+
+def percentile(values, percent):
+    '''Return the nearest rank percentile of sorted values'''
+    if not values:
+        return 0.0
+    idx = int(round(percent / 100.0 * (len(values) - 1)))
+    return values[idx]
+
+
+class Result(object):
+
+    FIELDS = (
+        'name', 'count', 'ops_per_sec', 'mean', 'p50', 'p90', 'p99', 'max',
+        'peak_memory', 'footprint',
+    )
+
+    def __init__(self, name, timings, peak_memory=None, footprint=None):
+        timings = sorted(timings)
+        total = sum(timings)
+        self.name = name
+        self.count = len(timings)
+        self.ops_per_sec = self.count / total if total else 0.0
+        self.mean = total / self.count if self.count else 0.0
+        self.p50 = percentile(timings, 50)
+        self.p90 = percentile(timings, 90)
+        self.p99 = percentile(timings, 99)
+        self.max = timings[-1] if timings else 0.0
+        self.peak_memory = peak_memory
+        self.footprint = footprint
+
+    def to_dict(self):
+        return OrderedDict(
+            (field, getattr(self, field)) for field in self.FIELDS
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        result = cls(data['name'], [])
+        for field in cls.FIELDS:
+            setattr(result, field, data.get(field))
+        return result
+
+    def __str__(self):
+        memory = '-' if self.peak_memory is None else \
+            '%.1fKB' % (self.peak_memory / 1024.0)
+        footprint = '-' if self.footprint is None else \
+            '%dB' % self.footprint
+        return '%-36s %12.1f ops/s  p50 %8.1fus  p90 %8.1fus  ' \
+            'p99 %8.1fus  peak %s  kept %s' % (
+                self.name, self.ops_per_sec, self.p50 * 1e6, self.p90 * 1e6,
+                self.p99 * 1e6, memory, footprint,
+            )
+    __repr__ = __unicode__ = __str__
+
+
+def run_benchmark(name, seed=0, scale=1.0, repeat=3, memory=True):
+    '''Run the named benchmark on its seeded corpus, every item is timed on
+    its own after a warm up pass which fills the lazy tables and caches, then
+    one more pass is traced if available for the peak memory and the memory
+    kept by the returned values per item.
+    '''
+    setup, size = REGISTRY[name]
+    func, corpus = setup(random.Random(seed), max(1, int(size * scale)))
+    for item in corpus:
+        func(item)
+
+    timings = []
+    timer = default_timer
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            for item in corpus:
+                begin = timer()
+                func(item)
+                timings.append(timer() - begin)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    peak_memory = footprint = None
+    if memory and tracemalloc is not None:
+        tracemalloc.start()
+        try:
+            # the results are only held to measure the memory they keep
+            kept = [func(item) for item in corpus]  # noqa: F841
+            current, peak_memory = tracemalloc.get_traced_memory()
+            del kept
+            footprint = (current - tracemalloc.get_traced_memory()[0]) // \
+                len(corpus)
+        finally:
+            tracemalloc.stop()
+    return Result(name, timings, peak_memory, footprint)
+
+
+def compare(results, baseline, threshold=0.1):
+    '''Compare the results with the baseline (name -> Result), return the
+    report lines and the names which are slower than the baseline by more
+    than threshold.
+    '''
+    lines = []
+    regressions = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None or not base.ops_per_sec:
+            lines.append('%-36s %12s' % (result.name, 'new'))
+            continue
+        ratio = result.ops_per_sec / base.ops_per_sec
+        flag = ''
+        if ratio < 1 - threshold:
+            flag = ' REGRESSION'
+            regressions.append(result.name)
+        lines.append('%-36s %11.2fx%s' % (result.name, ratio, flag))
+    return lines, regressions
+
+
+def save_results(results, path):
+    data = {
+        'python': sys.version.split()[0],
+        'results': [result.to_dict() for result in results],
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def load_results(path):
+    with open(path) as f:
+        data = json.load(f)
+    return OrderedDict(
+        (item['name'], Result.from_dict(item)) for item in data['results']
+    )
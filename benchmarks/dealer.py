@@ -0,0 +1,48 @@
+from casino.dealer import Dealer, numpy
+from casino.mahjong import Tile, Deck, MahjongManager
+
+from .core import benchmark
+
+HAND_SIZES = [13] * 4
+
+
+def new_deck():
+    return Deck(Tile.create_tiles())
+
+
+def dealing(ran, dealer):
+    manager = MahjongManager()
+
+    def run(_):
+        deal = dealer.deal(1, HAND_SIZES)[0]
+        manager.reset(deal.deck, ran, shuffle=False)
+        dealer.release(deal.deck)
+        return deal.hands
+    return run
+
+
+@benchmark('dealer.fresh', 500)
+def fresh(ran, size):
+    manager = MahjongManager()
+
+    def run(_):
+        deck = new_deck()
+        manager.reset(deck, ran)
+        tiles = deck.tiles
+        hands = [tiles[idx:idx + 13] for idx in range(0, 52, 13)]
+        del tiles[:52]
+        return hands
+    return run, range(size)
+
+
+@benchmark('dealer.deal', 500)
+def deal(ran, size):
+    return dealing(ran, Dealer(new_deck, ran=ran)), range(size)
+
+
+@benchmark('dealer.numpy', 500)
+def deal_numpy(ran, size):
+    if numpy is None:
+        raise RuntimeError('numpy is not installed')
+    generator = numpy.random.default_rng(ran.getrandbits(32))
+    return dealing(ran, Dealer(new_deck, generator=generator)), range(size)
@@ -0,0 +1,63 @@
+import sys
+from importlib import import_module
+
+from .core import benchmark
+
+GAMES = ('casino.mahjong', 'casino.poker', 'casino.wordplate')
+
+
+def is_casino_module(name):
+    return name == 'casino' or name.startswith('casino.')
+
+
+def fresh_import(name):
+    '''Import name with every casino module unloaded, then put the loaded
+    modules back so the callers keep their classes. Return the names of the
+    casino modules the import loaded.
+    '''
+    saved = dict(
+        (key, module) for key, module in sys.modules.items()
+        if is_casino_module(key)
+    )
+    for key in saved:
+        del sys.modules[key]
+    try:
+        import_module(name)
+        return sorted(key for key in sys.modules if is_casino_module(key))
+    finally:
+        for key in [key for key in sys.modules if is_casino_module(key)]:
+            del sys.modules[key]
+        sys.modules.update(saved)
+
+
+def importing(name):
+    def run(_):
+        loaded = fresh_import(name)
+        others = [
+            game for game in GAMES
+            if game in loaded and not name.startswith(game)
+        ]
+        if others:
+            raise RuntimeError('import %s loaded %s' % (name, others))
+        return loaded
+    return run
+
+
+@benchmark('import.casino', 20)
+def import_casino(ran, size):
+    return importing('casino'), range(size)
+
+
+@benchmark('import.mahjong', 20)
+def import_mahjong(ran, size):
+    return importing('casino.mahjong'), range(size)
+
+
+@benchmark('import.poker', 20)
+def import_poker(ran, size):
+    return importing('casino.poker'), range(size)
+
+
+@benchmark('import.wordplate', 20)
+def import_wordplate(ran, size):
+    return importing('casino.wordplate'), range(size)
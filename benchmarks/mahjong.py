@@ -0,0 +1,129 @@
+from casino.mahjong import Tile, Deck, TileWall, CompactTileWall
+from casino.mahjong.manager import MahjongManager
+from casino.mahjong.patterns import Normal, Pairs
+from casino.mahjong.properties import combinations
+
+from .core import benchmark
+
+STANDARD_TILES = Tile.NUMERIC_TILES + Tile.WIND_TILES + Tile.DRAGON_TILES
+
+
+def make_complete_hand(ran, melds=4):
+    '''Return a sorted hand of melds and an eye, at most 4 of a kind'''
+    while True:
+        eye = ran.choice(STANDARD_TILES)
+        tiles = [eye, eye]
+        for _ in range(melds):
+            tile = ran.choice(STANDARD_TILES)
+            if tile.suit in Tile.NUMERIC_SUITS and tile.rank < 8 and \
+                    ran.random() < 0.6:
+                tiles.extend([tile, tile + 1, tile + 2])
+            else:
+                tiles.extend([tile, tile, tile])
+        if all(tiles.count(tile) <= 4 for tile in tiles):
+            return sorted(tiles)
+
+
+def make_hands(ran, size, count=14):
+    '''Half complete hands, half random hands of count tiles'''
+    wall = STANDARD_TILES * 4
+    hands = []
+    for idx in range(size):
+        if idx % 2:
+            hands.append(sorted(ran.sample(wall, count)))
+        else:
+            hands.append(make_complete_hand(ran, (count - 2) // 3))
+    return hands
+
+
+def make_manager(ran, with_joker=False):
+    manager = MahjongManager()
+    manager.register_patterns([Normal, Pairs])
+    if with_joker:
+        manager.set_joker_factory(
+            lambda deck: (Tile.from_mask(33), [Tile.from_mask(34)])
+        )
+    manager.reset(Deck(Tile.create_tiles()), ran)
+    return manager
+
+
+def with_jokers(ran, hands, joker):
+    '''Replace up to 2 tiles of every hand by the joker'''
+    results = []
+    for tiles in hands:
+        tiles = tiles[:]
+        for _ in range(ran.randint(0, 2)):
+            tiles[ran.randrange(len(tiles))] = joker
+        results.append(sorted(tiles))
+    return results
+
+
+@benchmark('mahjong.check_win')
+def check_win(ran, size):
+    manager = make_manager(ran)
+    return manager.check_win, make_hands(ran, size)
+
+
+@benchmark('mahjong.check_win.joker')
+def check_win_with_joker(ran, size):
+    manager = make_manager(ran, True)
+    hands = with_jokers(ran, make_hands(ran, size), Tile.from_mask(34))
+    return manager.check_win, hands
+
+
+@benchmark('mahjong.get_candidates')
+def get_candidates(ran, size):
+    manager = make_manager(ran)
+    hands = [tiles[:-1] for tiles in make_hands(ran, size)]
+    return lambda tiles: list(manager.get_candidates(tiles)), hands
+
+
+@benchmark('mahjong.get_candidates.joker')
+def get_candidates_with_joker(ran, size):
+    manager = make_manager(ran, True)
+    hands = with_jokers(
+        ran, [tiles[:-1] for tiles in make_hands(ran, size)],
+        Tile.from_mask(34)
+    )
+    return lambda tiles: list(manager.get_candidates(tiles)), hands
+
+
+@benchmark('mahjong.combinations', 500)
+def mahjong_combinations(ran, size):
+    return lambda tiles: list(combinations(tiles)), make_hands(ran, size)
+
+
+@benchmark('mahjong.combinations.joker', 200)
+def mahjong_combinations_with_joker(ran, size):
+    hands = []
+    for tiles in make_hands(ran, size, 11):
+        hands.append((tiles, ran.randint(1, 3)))
+    return lambda item: list(combinations(*item)), hands
+
+
+@benchmark('mahjong.get_pattern', 500)
+def get_pattern(ran, size):
+    manager = make_manager(ran)
+    hands = make_hands(ran, size)
+    return lambda tiles: manager.get_pattern(TileWall(tiles)), hands
+
+
+def deal_table(wall_class):
+    def deal(tiles):
+        return [wall_class(tiles[idx:idx + 13]) for idx in range(0, 52, 13)]
+    return deal
+
+
+@benchmark('mahjong.table', 200)
+def table(ran, size):
+    tiles = Tile.create_tiles()
+    return deal_table(TileWall), [ran.sample(tiles, 52) for _ in range(size)]
+
+
+@benchmark('mahjong.table.compact', 200)
+def compact_table(ran, size):
+    tiles = Tile.create_tiles()
+    return (
+        deal_table(CompactTileWall),
+        [ran.sample(tiles, 52) for _ in range(size)]
+    )
@@ -0,0 +1,124 @@
+from casino.poker import Card, HandCard, PokerManager
+from casino.poker.patterns import (
+    Single, Pair, Triplet, Pairs, Triplets, sort_patterns
+)
+from casino.poker.properties import get_properties
+from casino.poker.solver import Solver
+
+from .core import benchmark
+
+PATTERNS = [Single, Pair, Triplet, Pairs, Triplets]
+
+
+def make_play(ran, cards):
+    '''Return a sorted play, a valid pattern most of the time'''
+    by_rank = {}
+    for card in cards:
+        by_rank.setdefault(card.rank, []).append(card)
+    ranks = sorted(by_rank)
+    kind = ran.randrange(6)
+    if kind == 0:
+        return [ran.choice(cards)]
+    if kind in (1, 2):
+        rank = ran.choice(ranks)
+        return sorted(ran.sample(by_rank[rank], kind + 1))
+    if kind in (3, 4):
+        width = kind - 1
+        length = ran.randint(3 if width == 2 else 2, 5)
+        begin = ran.randrange(len(ranks) - length)
+        return sorted(
+            card for rank in ranks[begin:begin + length]
+            for card in ran.sample(by_rank[rank], width)
+        )
+    return sorted(ran.sample(cards, ran.randint(2, 8)))
+
+
+def make_hands(ran, size, count=17):
+    cards = Card.NORMAL_CARDS
+    return [sorted(ran.sample(cards, count)) for _ in range(size)]
+
+
+@benchmark('poker.get_properties')
+def poker_get_properties(ran, size):
+    return get_properties, make_hands(ran, size)
+
+
+@benchmark('poker.get_pattern')
+def get_pattern(ran, size):
+    manager = PokerManager()
+    manager.register_patterns(PATTERNS)
+    plays = [make_play(ran, Card.NORMAL_CARDS) for _ in range(size)]
+    return manager.get_pattern, plays
+
+
+@benchmark('poker.get_moves')
+def get_moves(ran, size):
+    manager = PokerManager()
+    manager.register_patterns(PATTERNS)
+    corpus = []
+    for cards in make_hands(ran, size, 20):
+        last = None
+        if ran.random() < 0.5:
+            last = manager.get_pattern(make_play(ran, Card.NORMAL_CARDS))
+        corpus.append((HandCard(cards), last))
+    return lambda item: manager.get_moves(*item), corpus
+
+
+@benchmark('poker.solve', 50)
+def solve(ran, size):
+    '''Endgames of 3 players with 6 cards each, the landlord against the
+    two others, every search starts with an empty transposition table.
+    '''
+    manager = PokerManager()
+    manager.register_patterns(PATTERNS)
+    corpus = []
+    for _ in range(size):
+        cards = ran.sample(Card.NORMAL_CARDS, 18)
+        corpus.append([HandCard(cards[idx::3]) for idx in range(3)])
+
+    def run(hands):
+        return Solver(manager).solve(hands, teams=[0, 1, 1])
+    return run, corpus
+
+
+@benchmark('poker.sort_patterns', 200)
+def poker_sort_patterns(ran, size):
+    manager = PokerManager()
+    manager.register_patterns(PATTERNS)
+    corpus = []
+    for _ in range(size):
+        patterns = []
+        while len(patterns) < 100:
+            pattern = manager.get_pattern(make_play(ran, Card.NORMAL_CARDS))
+            if pattern is not None:
+                patterns.append(pattern)
+        corpus.append(patterns)
+    return sort_patterns, corpus
+
+
+@benchmark('poker.table', 200)
+def table(ran, size):
+    cards = Card.create_cards()
+    corpus = [ran.sample(cards, 51) for _ in range(size)]
+    return lambda cards: [
+        HandCard(cards[idx:idx + 17]) for idx in range(0, 51, 17)
+    ], corpus
+
+
+def register_filter(pattern, size):
+    name = 'poker.filter.%s' % pattern.__name__.lower()
+
+    @benchmark(name)
+    def setup(ran, count):
+        corpus = []
+        for cards in make_hands(ran, count):
+            max_card = ran.choice([None] + cards)
+            corpus.append((
+                get_properties(cards), max_card, size, ran.random() < 0.5
+            ))
+        return lambda item: pattern.filter(*item), corpus
+
+
+for _pattern, _size in zip(PATTERNS, (1, 1, 1, 3, 2)):
+    register_filter(_pattern, _size)
+del _pattern, _size
@@ -0,0 +1,104 @@
+from casino.wordplate import Card, HandCard, Manager
+
+from .core import benchmark
+
+
+def make_complete_cards(ran, melds):
+    '''Return cards made of melds and an eye, at most 4 of a kind'''
+    cards = Card.NORMAL_CARDS
+    while True:
+        eye = ran.choice(cards)
+        result = [eye, eye]
+        for _ in range(melds):
+            card = ran.choice(cards)
+            if card.rank < 9 and ran.random() < 0.6:
+                result.extend([card, card + 1, card + 2])
+            else:
+                result.extend([card, card, card])
+        if all(result.count(card) <= 4 for card in result):
+            return sorted(result)
+
+
+def make_hands(ran, size, count=14):
+    '''Half complete hands, half random hands of count cards'''
+    wall = Card.NORMAL_CARDS * 4
+    hands = []
+    for idx in range(size):
+        if idx % 2:
+            hands.append(HandCard(ran.sample(wall, count)))
+        else:
+            hands.append(HandCard(make_complete_cards(ran, (count - 2) // 3)))
+    return hands
+
+
+@benchmark('wordplate.check_win', 500)
+def check_win(ran, size):
+    manager = Manager()
+    return manager.check_win, make_hands(ran, size)
+
+
+@benchmark('wordplate.check_chow', 500)
+def check_chow(ran, size):
+    manager = Manager()
+    corpus = [
+        (handcard, ran.choice(Card.NORMAL_CARDS))
+        for handcard in make_hands(ran, size, 13)
+    ]
+    return lambda item: manager.check_chow(*item), corpus
+
+
+@benchmark('wordplate.any_chow', 500)
+def any_chow(ran, size):
+    manager = Manager()
+    corpus = [
+        (handcard, ran.choice(Card.NORMAL_CARDS))
+        for handcard in make_hands(ran, size, 13)
+    ]
+    return lambda item: manager.any_chow(*item), corpus
+
+
+@benchmark('wordplate.combinations', 500)
+def wordplate_combinations(ran, size):
+    manager = Manager()
+    hands = [handcard.cards for handcard in make_hands(ran, size)]
+    return lambda cards: list(manager.combinations(cards)), hands
+
+
+@benchmark('wordplate.check_win_with_card', 500)
+def check_win_with_card(ran, size):
+    manager = Manager()
+    corpus = []
+    for handcard in make_hands(ran, size, 13):
+        handcard.used_cards['chow'].append([Card.LOWER_ONE] * 3)
+        card = ran.choice(Card.NORMAL_CARDS)
+        corpus.append((handcard, card, ran.random() < 0.5))
+    return lambda item: manager.check_win_with_card(*item), corpus
+
+
+@benchmark('wordplate.clone', 500)
+def clone(ran, size):
+    hands = make_hands(ran, size)
+    for handcard in hands:
+        handcard.used_cards['pong'].append([Card.UPPER_TWO] * 3)
+    return lambda handcard: handcard.clone(), hands
+
+
+@benchmark('wordplate.get_candidates', 500)
+def get_candidates(ran, size):
+    manager = Manager()
+    hands = []
+    for handcard in make_hands(ran, size):
+        # one card short of the hand, half of them are ready
+        if handcard.cards:
+            handcard.remove_card(ran.choice(handcard.cards))
+        hands.append(handcard)
+    return manager.get_candidates, hands
+
+
+@benchmark('wordplate.table', 200)
+def table(ran, size):
+    cards = Card.NORMAL_CARDS * 4
+    corpus = [ran.sample(cards, 60) for _ in range(size)]
+    return lambda cards: [
+        HandCard(cards[idx:idx + 20]) for idx in range(0, 60, 20)
+    ], corpus
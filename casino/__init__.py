@@ -1,7 +1,25 @@
-from . import mahjong
-from . import poker
-from . import wordplate
+import sys
+from importlib import import_module
 
 
-__all__ = ['mahjong', 'poker', 'wordplate']
+__all__ = ['dealer', 'mahjong', 'poker', 'wordplate']
 __version__ = '19.07.14'
+
+
+# the games are imported on first access, so a worker of one game does not
+# build the instances and tables of the others
+def __getattr__(name):
+    if name in __all__:
+        return import_module('.' + name, __name__)
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name)
+    )
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # module __getattr__ needs PEP 562
+    from . import dealer, mahjong, poker, wordplate  # noqa
@@ -1,6 +1,3 @@
-from collections import defaultdict
-
-
 class SuitRankBase(type):
 
     def __init__(cls, name, bases, attrs):
@@ -15,11 +12,15 @@ class SuitRankBase(type):
         cls.SUIT_NAMES = {}
         cls.RANK_NAMES = {}
 
-        cls._cached = defaultdict(dict)
+        # (suit, rank) -> instance, and the instances indexed by mask with None
+        # for the invalid masks
+        cls._cached = {}
+        cls._instances = []
         cls._initialize_suit(attrs)
         cls._initialize_rank(attrs)
         cls._initialize_properties()
         cls._initialize_instances()
+        cls._initialize_masks()
 
     def _initialize_suit(cls, attrs):
         for name, attr in attrs.items():
@@ -37,12 +38,32 @@ class SuitRankBase(type):
         cls.RANKS.sort()
         cls.RANKS = tuple(cls.RANKS)
 
+    def _initialize_masks(cls):
+        # build every valid instance up front so the mask lookups never miss
+        for suit in cls.SUITS:
+            for rank in cls.RANKS:
+                if cls.validate(suit, rank):
+                    cls(suit, rank)
+
+    def try_from_mask(cls, mask):
+        '''Return the instance of mask, None if mask is invalid'''
+        instances = cls._instances
+        if 0 <= mask < len(instances):
+            return instances[mask]
+        return None
+
     def __call__(cls, suit, rank):
-        if rank not in cls._cached[suit]:
+        card = cls._cached.get((suit, rank))
+        if card is None:
             card = super(SuitRankBase, cls).__call__(suit, rank)
-            cls._cached[suit][rank] = card
+            cls._cached[suit, rank] = card
             setattr(cls, card.suit_name + '_' + card.rank_name, card)
-        return cls._cached[suit][rank]
+
+            instances = cls._instances
+            if card.mask >= len(instances):
+                instances.extend([None] * (card.mask + 1 - len(instances)))
+            instances[card.mask] = card
+        return card
 
 
 class PatternMeta(type):
@@ -0,0 +1,153 @@
+from collections import deque, namedtuple
+from random import Random
+from timeit import default_timer
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from casino.utils import random_shuffle_algorithm
+
+__all__ = ['Dealer', 'Deal', 'DealerInfo', 'get_buffer']
+
+Deal = namedtuple('Deal', ['deck', 'hands', 'seed'])
+# the bits of the seed drawn for each deck
+SEED_BITS = 64
+DealerInfo = namedtuple(
+    'DealerInfo', ['decks', 'elapsed', 'decks_per_sec', 'ready', 'free']
+)
+
+
+def get_buffer(deck):
+    '''Return the list of the deck which the managers shuffle on reset, the
+    cards of a poker Deck, the tiles of a mahjong Deck or a list of cards.
+    '''
+    for name in ('cards', 'tiles'):
+        buffer = getattr(deck, name, None)
+        if isinstance(buffer, list):
+            return buffer
+    return deck
+
+
+class Dealer(object):
+    '''Deal shuffled decks of one configuration to many tables. The decks
+    are kept in a pool and shuffled in batches ahead of the deals, a table
+    installs its deck with manager.reset(deck, ran, shuffle=False) and gives
+    it back with release when the game is over.
+
+    A deck is shuffled by shuffle_algorithm(buffer, Random(seed)) from the
+    order of deck_factory, as manager.reset shuffles a new deck, so pass the
+    shuffle_algorithm of the managers if it is not the default one. The seed
+    of each deck is drawn from ran and kept in its Deal, a game is replayed
+    with manager.reset(deck_factory(), Random(seed)) whatever the other
+    tables dealt. With a numpy generator the permutations of a batch come
+    from numpy instead and the seed of a Deal is None.
+
+    The hands are taken out of the deck before it is installed, so the
+    joker_factory of reset sees the deck without them, the joker of a table
+    may differ from the one of a game replayed from the seed.
+    '''
+
+    def __init__(self, deck_factory, shuffle_algorithm=None, ran=None,
+                 generator=None, batch_size=32):
+        self.deck_factory = deck_factory
+        self.shuffle_algorithm = shuffle_algorithm or random_shuffle_algorithm
+        self.ran = ran or Random()
+        if generator is not None and numpy is None:
+            raise RuntimeError('numpy is not installed')
+        self.generator = generator
+        self.batch_size = batch_size
+        # the order of a new deck, every shuffle starts from it
+        self.base = None
+        self.free = []
+        self.ready = deque()
+        self.decks = 0
+        self.elapsed = 0.0
+
+    def _new_deck(self):
+        deck = self.deck_factory()
+        if self.base is None:
+            self.base = list(get_buffer(deck))
+        return deck
+
+    def preallocate(self, count):
+        '''Add count new decks to the pool'''
+        self.free.extend(self._new_deck() for _ in range(count))
+
+    def shuffle(self, count=None):
+        '''Shuffle count decks of the pool, batch_size by default, and keep
+        them for the next deals.
+        '''
+        if count is None:
+            count = self.batch_size
+        free = self.free
+        decks = [free.pop() if free else self._new_deck()
+                 for _ in range(count)]
+        base = self.base
+
+        begin = default_timer()
+        if self.generator is None:
+            getrandbits = self.ran.getrandbits
+            seeds = [getrandbits(SEED_BITS) for _ in range(count)]
+            for deck, seed in zip(decks, seeds):
+                self._shuffle_deck(deck, seed)
+        else:
+            seeds = [None] * count
+            orders = self.generator.random((count, len(base))).argsort(axis=1)
+            for deck, order in zip(decks, orders.tolist()):
+                get_buffer(deck)[:] = [base[idx] for idx in order]
+        self.elapsed += default_timer() - begin
+        self.decks += count
+        self.ready.extend(zip(decks, seeds))
+
+    def _shuffle_deck(self, deck, seed):
+        buffer = get_buffer(deck)
+        buffer[:] = self.base
+        self.shuffle_algorithm(buffer, Random(seed))
+
+    def deal(self, tables, hand_sizes=(), seeds=None):
+        '''Return a Deal for each of tables, the hands of hand_sizes are taken
+        from the top of the deck in turn and the deck keeps the rest. The
+        decks of the tables with seeds, a list of a seed for each table, are
+        shuffled from their seed instead of taken from the shuffled ones.
+        '''
+        if seeds is None:
+            lack = tables - len(self.ready)
+            if lack > 0:
+                self.shuffle(max(lack, self.batch_size))
+            popleft = self.ready.popleft
+            shuffled = [popleft() for _ in range(tables)]
+        else:
+            if len(seeds) != tables:
+                raise ValueError('seeds must have a seed for each table')
+            free = self.free
+            shuffled = [(free.pop() if free else self._new_deck(), seed)
+                        for seed in seeds]
+            begin = default_timer()
+            for deck, seed in shuffled:
+                self._shuffle_deck(deck, seed)
+            self.elapsed += default_timer() - begin
+            self.decks += tables
+        deals = []
+        for deck, seed in shuffled:
+            buffer = get_buffer(deck)
+            hands = []
+            begin = 0
+            for size in hand_sizes:
+                hands.append(buffer[begin:begin + size])
+                begin += size
+            del buffer[:begin]
+            deals.append(Deal(deck, hands, seed))
+        return deals
+
+    def release(self, deck):
+        '''Give back the deck of a finished game to the pool'''
+        self.free.append(deck)
+
+    def info(self):
+        return DealerInfo(
+            self.decks, self.elapsed,
+            self.decks / self.elapsed if self.elapsed else 0.0,
+            len(self.ready), len(self.free)
+        )
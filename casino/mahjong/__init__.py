@@ -1,10 +1,10 @@
 from .tile import Tile  # noqa
 from .deck import Deck  # noqa
-from .wall import TileWall  # noqa
+from .wall import TileWall, CompactTileWall  # noqa
 from .manager import MahjongManager  # noqa
 from . import patterns  # noqa
 from . import properties  # noqa
 
 
-__all__ = ['Tile', 'Deck', 'TileWall', 'MahjongManager']
+__all__ = ['Tile', 'Deck', 'TileWall', 'CompactTileWall', 'MahjongManager']
 __version__ = '0.1.0'
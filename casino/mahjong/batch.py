@@ -0,0 +1,226 @@
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from .lookup import (
+    SLOTS, STANDARD_TILES, GROUP_COUNT, COMPLETE, COMPLETE_WITH_EYE,
+    get_win_tables, get_lack, get_lack_of_jokers, is_complete,
+    is_complete_keys
+)
+from .tile import Tile
+
+__all__ = ['check_win_batch']
+
+KIND_COUNT = len(STANDARD_TILES)
+PADDING, OTHER, JOKER = KIND_COUNT, KIND_COUNT + 1, KIND_COUNT + 2
+SLOT_COUNT = KIND_COUNT + 3
+# tile mask -> index of the standard kinds, the padding 0 and the tiles out of
+# the standard kinds get the extra slots
+KIND_INDEX = [OTHER] * 256
+KIND_INDEX[0] = PADDING
+for _idx, _tile in enumerate(STANDARD_TILES):
+    KIND_INDEX[_tile.mask] = _idx
+del _idx, _tile
+# (begin, end, weights) of the kinds of every group
+GROUP_SLICES = []
+for _group in range(GROUP_COUNT):
+    _kinds = [
+        idx for idx, tile in enumerate(STANDARD_TILES)
+        if SLOTS[tile.mask][0] == _group
+    ]
+    GROUP_SLICES.append((
+        _kinds[0], _kinds[-1] + 1,
+        [SLOTS[STANDARD_TILES[idx].mask][1] for idx in _kinds]
+    ))
+del _group, _kinds
+
+# group -> (sorted keys, flags) of the win tables as arrays
+_table_arrays = []
+
+
+def _get_kind_index(jokers):
+    kind_index = list(KIND_INDEX)
+    for joker in jokers:
+        kind_index[joker.mask] = JOKER
+    return kind_index
+
+
+def _get_joker_kinds(jokers):
+    return [KIND_INDEX[joker.mask] for joker in jokers
+            if KIND_INDEX[joker.mask] < KIND_COUNT]
+
+
+def _check_counts(counts, joker_count, with_pairs):
+    keys = [
+        sum(count * weight
+            for count, weight in zip(counts[begin:end], weights))
+        for begin, end, weights in GROUP_SLICES
+    ]
+    tile_count = sum(counts[:KIND_COUNT])
+    if joker_count is None:
+        if with_pairs and tile_count == 14 and \
+                not any(count % 2 for count in counts[:KIND_COUNT]):
+            return True
+        return is_complete_keys(keys, [
+            sum(counts[begin:end]) for begin, end, _ in GROUP_SLICES
+        ])
+
+    if (tile_count + joker_count) % 3 != 2:
+        return False
+    if with_pairs and tile_count + joker_count == 14 and \
+            sum(count % 2 for count in counts[:KIND_COUNT]) <= joker_count:
+        return True
+    return get_lack_of_jokers(keys)[1] <= joker_count
+
+
+def _check_win_batch_python(hands, counts, jokers, with_pairs, check_win):
+    if not len(hands):
+        return []
+    if not hasattr(hands[0], '__len__'):
+        # a single hand
+        hands = [hands]
+    kind_index = _get_kind_index(jokers)
+    joker_kinds = _get_joker_kinds(jokers)
+    results = []
+    for row in hands:
+        if counts:
+            kind_counts = list(row[:KIND_COUNT]) + [0] * 3
+            for idx in joker_kinds:
+                kind_counts[JOKER] += kind_counts[idx]
+                kind_counts[idx] = 0
+        else:
+            kind_counts = [0] * SLOT_COUNT
+            for mask in row:
+                kind_counts[kind_index[mask]] += 1
+            if kind_counts[OTHER]:
+                results.append(bool(check_win(
+                    Tile.from_masks(sorted(mask for mask in row if mask))
+                )))
+                continue
+        joker_count = kind_counts[JOKER] if jokers else None
+        results.append(_check_counts(kind_counts, joker_count, with_pairs))
+    return results
+
+
+def _get_table_arrays():
+    if not _table_arrays:
+        tables = get_win_tables()
+        arrays = {}
+        for table in tables:
+            if id(table) not in arrays:
+                keys = numpy.array(sorted(table), dtype=numpy.int64)
+                flags = numpy.array(
+                    [table[key] for key in keys.tolist()], dtype=numpy.int8
+                )
+                arrays[id(table)] = (keys, flags)
+        _table_arrays[:] = [arrays[id(table)] for table in tables]
+    return _table_arrays
+
+
+def _gather_flags(group, keys):
+    table_keys, table_flags = _get_table_arrays()[group]
+    idx = numpy.searchsorted(table_keys, keys)
+    idx[idx == len(table_keys)] = 0
+    return numpy.where(table_keys[idx] == keys, table_flags[idx], 0)
+
+
+def _gather_lacks(group, keys):
+    uniques, inverse = numpy.unique(keys, return_inverse=True)
+    lacks = numpy.array(
+        [get_lack(group, key) for key in uniques.tolist()],
+        dtype=numpy.int64
+    ).reshape(-1, 2)
+    inverse = inverse.reshape(-1)
+    return lacks[inverse, 0], lacks[inverse, 1]
+
+
+def _check_win_batch_numpy(hands, counts, jokers, with_pairs, check_win):
+    hands = numpy.asarray(hands, dtype=numpy.int64)
+    if not hands.size:
+        return numpy.zeros(len(hands) if hands.ndim > 1 else 0, dtype=bool)
+    if hands.ndim == 1:
+        # a single hand
+        hands = hands.reshape(1, -1)
+    hand_count = len(hands)
+    if counts:
+        kind_counts = hands[:, :KIND_COUNT].copy()
+        others = numpy.zeros(hand_count, dtype=bool)
+        joker_kinds = _get_joker_kinds(jokers)
+        joker_counts = kind_counts[:, joker_kinds].sum(axis=1)
+        kind_counts[:, joker_kinds] = 0
+    else:
+        kinds = numpy.array(_get_kind_index(jokers), dtype=numpy.int64)[hands]
+        kinds += (numpy.arange(hand_count) * SLOT_COUNT)[:, None]
+        slot_counts = numpy.bincount(
+            kinds.ravel(), minlength=hand_count * SLOT_COUNT
+        ).reshape(hand_count, SLOT_COUNT)
+        others = slot_counts[:, OTHER] > 0
+        joker_counts = slot_counts[:, JOKER]
+        kind_counts = slot_counts[:, :KIND_COUNT]
+    if not jokers:
+        joker_counts = None
+
+    keys = []
+    sizes = []
+    for begin, end, weights in GROUP_SLICES:
+        group_counts = kind_counts[:, begin:end]
+        keys.append(group_counts.dot(numpy.array(weights, dtype=numpy.int64)))
+        sizes.append(group_counts.sum(axis=1))
+    tile_counts = kind_counts.sum(axis=1)
+
+    if joker_counts is None:
+        results = numpy.ones(hand_count, dtype=bool)
+        eyes = numpy.zeros(hand_count, dtype=numpy.int64)
+        for group in range(GROUP_COUNT):
+            remainders = sizes[group] % 3
+            flags = _gather_flags(group, keys[group])
+            results &= remainders != 1
+            results &= (remainders != 0) | (flags & COMPLETE != 0)
+            results &= (remainders != 2) | (flags & COMPLETE_WITH_EYE != 0)
+            eyes += remainders == 2
+        results &= eyes == 1
+        if with_pairs:
+            results |= (tile_counts == 14) & ~(kind_counts % 2).any(axis=1)
+    else:
+        lacks = [_gather_lacks(group, keys[group])
+                 for group in range(GROUP_COUNT)]
+        no_eye = sum(lack[0] for lack in lacks)
+        eye = no_eye + 2
+        for lack in lacks:
+            eye = numpy.minimum(eye, no_eye - lack[0] + lack[1])
+        total_counts = tile_counts + joker_counts
+        results = eye <= joker_counts
+        if with_pairs:
+            results |= (total_counts == 14) & (
+                (kind_counts % 2).sum(axis=1) <= joker_counts
+            )
+        results &= total_counts % 3 == 2
+
+    for row in numpy.nonzero(others)[0].tolist():
+        results[row] = bool(check_win(
+            Tile.from_masks(sorted(mask for mask in hands[row].tolist()
+                                   if mask))
+        ))
+    return results
+
+
+def check_win_batch(hands, counts=False, jokers=(), with_pairs=False,
+                    check_win=None):
+    '''Check many hands at once, hands is a 2-D array of tile masks (0 for
+    padding) or, with counts, of the counts of the 34 standard kinds in the
+    order of STANDARD_TILES, a 1-D array is taken as a single hand. The tiles
+    of jokers are taken as jokers.
+
+    Return a bool array with NumPy, a list of bool otherwise. The rows with
+    tiles out of the standard kinds are checked by check_win one by one.
+    '''
+    check_win = check_win or is_complete
+    jokers = list(jokers)
+    if numpy is not None:
+        return _check_win_batch_numpy(
+            hands, counts, jokers, with_pairs, check_win
+        )
+    return _check_win_batch_python(
+        hands, counts, jokers, with_pairs, check_win
+    )
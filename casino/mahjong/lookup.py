@@ -0,0 +1,270 @@
+import pickle
+
+from .properties import combinations
+from .tile import Tile
+
+__all__ = [
+    'encode', 'get_win_tables', 'is_complete', 'is_complete_keys',
+    'is_complete_with_joker', 'get_lack', 'get_lack_of_jokers',
+    'load_joker_tables', 'dump_joker_tables', 'get_singles', 'get_candidates',
+]
+
+CHARACTER, DOT, BAMBOO, HONOR = 0, 1, 2, 3
+GROUP_COUNT = 4
+NUMERIC_SIZE = 9
+HONOR_SIZE = 7
+
+COMPLETE = 1
+COMPLETE_WITH_EYE = 2
+
+# tile mask -> (group, weight) for the 34 standard kinds, a numeric suit is
+# encoded as a 9-digit key (rank one is the highest digit), winds and dragons
+# share the 7-digit honor key
+SLOTS = [None] * 256
+for _tile in Tile.NUMERIC_TILES:
+    SLOTS[_tile.mask] = (
+        Tile.NUMERIC_SUITS.index(_tile.suit),
+        10 ** (NUMERIC_SIZE - _tile.rank),
+    )
+for _tile in Tile.WIND_TILES + Tile.DRAGON_TILES:
+    SLOTS[_tile.mask] = (HONOR, 10 ** (Tile.RANK_WHITE - _tile.rank))
+del _tile
+STANDARD_TILES = Tile.NUMERIC_TILES + Tile.WIND_TILES + Tile.DRAGON_TILES
+
+_tables = []
+# group key -> (jokers needed without eye, jokers needed with eye), filled
+# lazily, the numeric suits share one table
+_joker_tables = [{}, {}]
+
+
+def _build_table(size, with_sequence):
+    '''Collect every count vector (at most 4 of a kind) of one group which is
+    made of melds only, then the ones which are made of melds and an eye.
+    '''
+    complete = set()
+    weights = [10 ** (size - 1 - pos) for pos in range(size)]
+
+    def walk(pos, key, prev2, prev1):
+        if pos == size:
+            complete.add(key)
+            return
+        base = prev2 + prev1
+        max_seq = 4 - base if with_sequence and pos < size - 2 else 0
+        for seq in range(max_seq + 1):
+            for triplet in (0, 3):
+                count = base + seq + triplet
+                if count > 4:
+                    break
+                walk(pos + 1, key + count * weights[pos], prev1, seq)
+
+    walk(0, 0, 0, 0)
+    table = dict.fromkeys(complete, COMPLETE)
+    for key in complete:
+        for pos, weight in enumerate(weights):
+            if key // weight % 10 <= 2:
+                eye_key = key + 2 * weight
+                table[eye_key] = table.get(eye_key, 0) | COMPLETE_WITH_EYE
+    return table
+
+
+def get_win_tables():
+    '''Return the lookup tables indexed by group, built on first use'''
+    if not _tables:
+        numeric = _build_table(NUMERIC_SIZE, True)
+        honor = _build_table(HONOR_SIZE, False)
+        _tables[:] = [numeric, numeric, numeric, honor]
+    return _tables
+
+
+def encode(tiles):
+    '''Encode the tiles into per group count keys and tile counts, return
+    None if any tile is out of the 34 standard kinds.
+    '''
+    keys = [0] * GROUP_COUNT
+    counts = [0] * GROUP_COUNT
+    for tile in tiles:
+        slot = SLOTS[tile.mask]
+        if slot is None:
+            return None
+        group, weight = slot
+        keys[group] += weight
+        counts[group] += 1
+    return keys, counts
+
+
+def is_complete_keys(keys, counts):
+    tables = _tables or get_win_tables()
+    has_eye = False
+    for group in range(GROUP_COUNT):
+        remainder = counts[group] % 3
+        if remainder == 1:
+            return False
+        flags = tables[group].get(keys[group], 0)
+        if remainder == 0:
+            if not flags & COMPLETE:
+                return False
+        elif has_eye or not flags & COMPLETE_WITH_EYE:
+            return False
+        else:
+            has_eye = True
+    return has_eye
+
+
+def is_complete(tiles):
+    '''Check the tiles are made of melds and exactly one eye, tiles out of the
+    standard kinds fall back to the recursive combinations.
+    '''
+    encoded = encode(tiles)
+    if encoded is None:
+        return any(combinations(tiles))
+    return is_complete_keys(*encoded)
+
+
+def _get_lack(table, key, size, with_sequence):
+    if key in table:
+        return table[key]
+    if key == 0:
+        table[key] = lack = (0, 2)
+        return lack
+
+    pos = 0
+    weight = 10 ** (size - 1)
+    while key // weight % 10 == 0:
+        pos += 1
+        weight //= 10
+    count = key // weight % 10
+
+    def rest(used, cost):
+        no_eye, eye = _get_lack(table, key - used, size, with_sequence)
+        return cost + no_eye, cost + eye
+
+    # the first tile is in a triplet, a sequence or the eye
+    options = [rest(weight * used, 3 - used)
+               for used in range(1, min(count, 3) + 1)]
+    if with_sequence:
+        for delta in (1, 2):
+            if pos + delta >= size:
+                break
+            other = weight // 10 ** delta
+            if key // other % 10:
+                options.append(rest(weight + other, 1))
+        if pos + 2 < size:
+            next1, next2 = weight // 10, weight // 100
+            if key // next1 % 10 and key // next2 % 10:
+                options.append(rest(weight + next1 + next2, 0))
+
+    no_eye = min(option[0] for option in options)
+    eye = min(option[1] for option in options)
+    eye = min(eye, rest(weight, 1)[0])
+    if count >= 2:
+        eye = min(eye, rest(weight * 2, 0)[0])
+    table[key] = lack = (no_eye, eye)
+    return lack
+
+
+def get_lack(group, key):
+    '''Return the minimum jokers to complete a group key, as a pair of
+    (without eye, with eye).
+    '''
+    if group == HONOR:
+        return _get_lack(_joker_tables[1], key, HONOR_SIZE, False)
+    return _get_lack(_joker_tables[0], key, NUMERIC_SIZE, True)
+
+
+def get_lack_of_jokers(keys):
+    '''Return the minimum jokers to complete the keys with and without an
+    eye.
+    '''
+    lacks = [get_lack(group, key) for group, key in enumerate(keys)]
+    no_eye = sum(lack[0] for lack in lacks)
+    eye = no_eye + 2
+    for lack in lacks:
+        eye = min(eye, no_eye - lack[0] + lack[1])
+    return no_eye, eye
+
+
+def load_joker_tables(path):
+    with open(path, 'rb') as f:
+        numeric, honor = pickle.load(f)
+    _joker_tables[0].update(numeric)
+    _joker_tables[1].update(honor)
+
+
+def dump_joker_tables(path):
+    with open(path, 'wb') as f:
+        pickle.dump(_joker_tables, f, 2)
+
+
+def is_complete_with_joker(tiles, joker_count):
+    '''Check the tiles (jokers excluded) with joker_count jokers are made of
+    melds and exactly one eye.
+    '''
+    if (len(tiles) + joker_count) % 3 != 2:
+        return False
+    encoded = encode(tiles)
+    if encoded is None:
+        return any(combinations(tiles, joker_count))
+    return get_lack_of_jokers(encoded[0])[1] <= joker_count
+
+
+def get_singles(keys):
+    '''Return the count of tiles left over after pairing the tiles'''
+    singles = 0
+    for key in keys:
+        while key:
+            singles += key % 2
+            key //= 10
+    return singles
+
+
+def get_candidates(tiles, joker_count=0, with_pairs=False, excludes=()):
+    '''Return the standard kinds which complete the tiles (jokers excluded)
+    with joker_count jokers, by probing every kind against the tables.
+    Return None if any tile is out of the standard kinds.
+    '''
+    encoded = encode(tiles)
+    if encoded is None:
+        return None
+    keys, counts = encoded
+    if (len(tiles) + joker_count) % 3 != 1:
+        return []
+
+    if joker_count:
+        lacks = [get_lack(group, key) for group, key in enumerate(keys)]
+    if with_pairs and len(tiles) + joker_count == 13:
+        singles = get_singles(keys)
+    else:
+        singles = None
+
+    candidates = []
+    for tile in STANDARD_TILES:
+        if tile in excludes:
+            continue
+        group, weight = SLOTS[tile.mask]
+        key = keys[group]
+        count = key // weight % 10
+        if count == 4:
+            continue
+
+        if singles is not None:
+            # a pair is made by the tile or the tile is a new single
+            if singles + (-1 if count % 2 else 1) <= joker_count:
+                candidates.append(tile)
+                continue
+
+        key += weight
+        if joker_count:
+            lack, lacks[group] = lacks[group], get_lack(group, key)
+            no_eye = sum(item[0] for item in lacks)
+            eye = min(no_eye - item[0] + item[1] for item in lacks)
+            lacks[group] = lack
+            if min(eye, no_eye + 2) <= joker_count:
+                candidates.append(tile)
+        else:
+            keys[group] = key
+            counts[group] += 1
+            if is_complete_keys(keys, counts):
+                candidates.append(tile)
+            keys[group] -= weight
+            counts[group] -= 1
+    return candidates
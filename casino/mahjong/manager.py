@@ -2,13 +2,18 @@ from collections import namedtuple, defaultdict, Counter
 from bisect import insort
 from operator import attrgetter
 
-from casino.exceptions import InvalidInstance
-from casino.utils import random_shuffle_algorithm
+from casino.utils import random_shuffle_algorithm, LRUCache
 
+from .batch import check_win_batch
+from .lookup import (
+    encode, get_lack_of_jokers, get_singles, get_candidates, is_complete,
+    is_complete_with_joker
+)
 from .patterns import Pairs
+from .shanten import get_shanten, get_shanten_batch, get_discards
 from .properties import (
     is_7_pairs, is_7_pairs_with_joker, is_same_suit, get_lack_of_joker,
-    combinations
+    combinations, unique_combinations
 )
 from .tile import Tile
 from .deck import Deck
@@ -23,6 +28,9 @@ Property = namedtuple(
 )
 
 
+_missing = object()
+
+
 class MahjongManager(object):
 
     sort_func = attrgetter('priority')
@@ -32,11 +40,15 @@ class MahjongManager(object):
         self.tile_class = tile_class
         self.patterns = []
         self.has_pairs_patterns = False
+        # bound of the combinations kept on the wall by get_pattern
+        self.max_combinations = None
         self.draw_joker = None
         self.draw_joker_mask = 0
         self.jokers = set()
         self.joker_masks = [0]
+        self.joker_key = ()
         self.joker_factory = None
+        self.cache = None
 
         self.shuffle_algorithm = shuffle_algorithm or random_shuffle_algorithm
         self._use_normal_api()
@@ -52,6 +64,8 @@ class MahjongManager(object):
         self.get_pattern_by_tile = self._get_pattern_by_tile
         self.get_candidates = self._get_candidates
         self.has_candidates = self._has_candidates
+        if self.cache is not None:
+            self._use_cached_api()
 
     def _use_joker_api(self):
         self.check_win = self._check_win_with_joker
@@ -60,6 +74,58 @@ class MahjongManager(object):
         self.get_pattern_by_tile = self._get_pattern_by_tile_with_joker
         self.get_candidates = self._get_candidates_with_joker
         self.has_candidates = self._has_candidates_with_joker
+        if self.cache is not None:
+            self._use_cached_api()
+
+    def _use_cached_api(self):
+        self.check_win = self._cache_api('check_win', self.check_win)
+        self.check_win_by_tile = self._cache_api(
+            'check_win_by_tile', self.check_win_by_tile
+        )
+        self.get_candidates = self._cache_api(
+            'get_candidates', self.get_candidates, True
+        )
+        self.has_candidates = self._cache_api(
+            'has_candidates', self.has_candidates
+        )
+
+    def _cache_api(self, name, func, is_generator=False):
+        cache = self.cache
+
+        def cached(tiles, *args, **kwargs):
+            key = (
+                name, self.joker_key,
+                tuple(sorted([tile.mask for tile in tiles])), args,
+                tuple(sorted(kwargs.items()))
+            )
+            result = cache.get(key, _missing)
+            if result is _missing:
+                result = func(tiles, *args, **kwargs)
+                if is_generator:
+                    result = tuple(result)
+                cache.set(key, result)
+            return iter(result) if is_generator else result
+        return cached
+
+    def enable_cache(self, maxsize=1024):
+        '''Memoize check_win, check_win_by_tile, get_candidates and
+        has_candidates by the hand, at most maxsize results are kept.
+        '''
+        self.cache = LRUCache(maxsize)
+        self._use_api()
+
+    def disable_cache(self):
+        self.cache = None
+        self._use_api()
+
+    def cache_info(self):
+        return self.cache.info() if self.cache is not None else None
+
+    def _use_api(self):
+        if self.joker_factory:
+            self._use_joker_api()
+        else:
+            self._use_normal_api()
 
     def _check_win(self, tiles, joker_count=0):
         count = len(tiles)
@@ -69,6 +135,28 @@ class MahjongManager(object):
         if count == 2 and tiles[0] is tiles[1]:
             return True
 
+        return (self.has_pairs_patterns and
+                is_7_pairs(tiles) or
+                is_complete(tiles))
+
+    def check_win_batch(self, hands, counts=False):
+        '''Check a 2-D array of tile masks (0 for padding) or, with counts, of
+        the counts of the standard kinds, see batch.check_win_batch.
+        '''
+        jokers = self.jokers if self.joker_factory else ()
+        return check_win_batch(
+            hands, counts, jokers, self.has_pairs_patterns, self.check_win
+        )
+
+    def _check_win_by_combinations(self, tiles, joker_count=0):
+        # reference implementation of _check_win, enumerates combinations
+        count = len(tiles)
+        if count % 3 != 2:
+            return False
+
+        if count == 2 and tiles[0] is tiles[1]:
+            return True
+
         return (self.has_pairs_patterns and
                 is_7_pairs(tiles) or
                 any(combinations(tiles)))
@@ -93,7 +181,7 @@ class MahjongManager(object):
         tiles = self._filter_joker_tiles(tiles, joker_count)
         return (self.has_pairs_patterns and
                 is_7_pairs_with_joker(tiles, joker_count) or
-                any(combinations(tiles, joker_count)))
+                is_complete_with_joker(tiles, joker_count))
 
     def _check_win_by_tile_with_joker(self, tiles, tile, joker_count=None):
         if joker_count is None:
@@ -104,7 +192,9 @@ class MahjongManager(object):
 
     def _get_pattern(self, tile_wall, joker_count=0):
         tiles = tile_wall.available_tiles
-        combinations = self.get_combinations(tiles, 0, tile_wall.used_tiles)
+        combinations = self.get_combinations(
+            tiles, 0, tile_wall.used_tiles, True, self.max_combinations
+        )
         tile_wall.used_combs = []
         tile_wall.combinations = combinations
         properties = Property(
@@ -133,7 +223,9 @@ class MahjongManager(object):
         all_tiles = self._filter_joker_tiles(tile_wall.all_tiles, joker_count)
         tiles = self._filter_joker_tiles(available_tiles, joker_count)
         used_tiles = tile_wall.used_tiles
-        combinations = self.get_combinations(tiles, joker_count, used_tiles)
+        combinations = self.get_combinations(
+            tiles, joker_count, used_tiles, True, self.max_combinations
+        )
 
         tile_wall.used_combs = []
         tile_wall.combinations = combinations
@@ -173,6 +265,33 @@ class MahjongManager(object):
         return filtered_tiles
 
     def _get_candidates(self, tiles, joker_count=0):
+        if (len(tiles) + joker_count) % 3 != 1:
+            return
+
+        encoded = encode(tiles)
+        if encoded is None:
+            for cand in self._get_candidates_by_combinations(
+                    tiles, joker_count):
+                yield cand
+            return
+
+        keys = encoded[0]
+        if joker_count and (
+                get_lack_of_jokers(keys)[0] < joker_count or
+                self.has_pairs_patterns and
+                len(tiles) + joker_count == 13 and
+                get_singles(keys) < joker_count):
+            # the free joker waits for any tile
+            for cand in self.deck.tile_set:
+                yield cand
+            return
+
+        for cand in get_candidates(
+                tiles, joker_count, self.has_pairs_patterns):
+            yield cand
+
+    def _get_candidates_by_combinations(self, tiles, joker_count=0):
+        # reference implementation of _get_candidates
         if (len(tiles) + joker_count) % 3 == 1:
             tile_set = set()
             if (self.has_pairs_patterns and
@@ -196,7 +315,6 @@ class MahjongManager(object):
                         yield cand
                     return
 
-            tile_class = self.tile_class
             for comb in combinations(tiles, joker_count + 1):
                 if comb['joker_count'] > 0:
                     tile_set = self.deck.tile_set
@@ -215,28 +333,18 @@ class MahjongManager(object):
                 for seq in comb['sequences']:
                     if len(seq) == 2:
                         if seq[1].rank - seq[0].rank == 1:
-                            mask = seq[0].mask
-                            for delta in (-1, 2):
-                                try:
-                                    tile_set.add(
-                                        tile_class.from_mask(mask + delta)
-                                    )
-                                except InvalidInstance:
-                                    pass
+                            deltas = (-1, 2)
                         else:
                             # gap
-                            tile_set.add(
-                                tile_class.from_mask(seq[0].mask + 1)
-                            )
+                            deltas = (1,)
                     elif len(seq) == 1:
-                        mask = seq[0].mask
-                        for delta in (-2, -1, 1, 2):
-                            try:
-                                tile_set.add(
-                                    tile_class.from_mask(mask - delta)
-                                )
-                            except InvalidInstance:
-                                pass
+                        deltas = (-2, -1, 1, 2)
+                    else:
+                        continue
+                    for delta in deltas:
+                        tile = seq[0].neighbor(delta)
+                        if tile is not None:
+                            tile_set.add(tile)
 
             for cand in tile_set:
                 yield cand
@@ -252,7 +360,7 @@ class MahjongManager(object):
     def _has_candidates(self, tiles, joker_count=0):
         # if it has candidates, give it a joker, should have combinations
         return (self.has_pairs_patterns and is_7_pairs_with_joker(tiles, 1) or
-                any(combinations(tiles, 1)))
+                is_complete_with_joker(tiles, 1))
 
     def _has_candidates_with_joker(self, tiles, joker_count=None):
         # if it has candidates, give it a more joker, should have combinations
@@ -262,31 +370,42 @@ class MahjongManager(object):
         return (
             self.has_pairs_patterns and
             is_7_pairs_with_joker(tiles, joker_count + 1) or
-            any(combinations(tiles, joker_count + 1))
+            is_complete_with_joker(tiles, joker_count + 1)
         )
 
     def set_joker_factory(self, joker_factory):
         self.joker_factory = joker_factory
         self._use_joker_api()
 
-    def reset(self, deck, ran):
+    def reset(self, deck, ran, shuffle=True):
         self.draw_joker = None
+        old_jokers, old_tile_set = set(self.jokers), self.deck.tile_set
         self.jokers.clear()
 
+        # the decks of casino.dealer are shuffled already
         self.deck = deck
-        self.shuffle_algorithm(deck.tiles, ran)
+        if shuffle:
+            self.shuffle_algorithm(deck.tiles, ran)
 
         if self.joker_factory:
             draw_joker, jokers = self.joker_factory(deck)
             self.draw_joker, self.draw_joker_mask = draw_joker, draw_joker.mask
             self.jokers = set(jokers)
             self.joker_masks = [tile.mask for tile in jokers]
+            self.joker_key = tuple(sorted(self.joker_masks))
+
+        # the candidates of a free joker are the tile set of the deck
+        if self.cache is not None and (
+                self.jokers != old_jokers or deck.tile_set != old_tile_set):
+            self.cache.clear()
 
     def register_pattern(self, pattern, sort_func=None):
         self.patterns.append(pattern)
         self.patterns.sort(key=sort_func or self.sort_func, reverse=True)
         if issubclass(pattern, Pairs):
             self.has_pairs_patterns = True
+        if self.cache is not None:
+            self.cache.clear()
 
     def register_patterns(self, patterns, sort_func=None):
         self.patterns.extend(patterns)
@@ -294,39 +413,36 @@ class MahjongManager(object):
         self.has_pairs_patterns = any(
             issubclass(p, Pairs) for p in self.patterns
         )
+        if self.cache is not None:
+            self.cache.clear()
 
     def check_exposed_kong(self, wall, tile):
-        return wall.available_tiles.count(tile) == 3
+        return wall.count_tile(tile) == 3
 
     def check_concealed_kong(self, wall, tile):
-        return wall.available_tiles.count(tile) == 4
+        return wall.count_tile(tile) == 4
 
     def check_additional_kong(self, wall, tile):
-        return wall.available_tiles.count(tile) == 1 and \
+        return wall.count_tile(tile) == 1 and \
             tile in {tiles[0] for tiles in wall.used_tiles['pong']}
 
     def get_concealed_kong_tiles(self, wall):
-        counter = Counter(wall.available_tiles)
-        return [tile for tile, count in counter.items() if count == 4]
+        return [tile for tile, count in wall.iter_counts() if count == 4]
 
     def get_additional_kong_tiles(self, wall):
         pong_tiles = {tiles[0] for tiles in wall.used_tiles['pong']}
-        available_tiles = wall.available_tiles
-        return [tile for tile in pong_tiles if tile in available_tiles]
+        return [tile for tile in pong_tiles if wall.count_tile(tile)]
 
     def check_pong_tile(self, wall, tile):
-        return wall.available_tiles.count(tile) >= 2
+        return wall.count_tile(tile) >= 2
 
     def check_chow_tile(self, wall, tile):
         if tile.suit not in self.tile_class.NUMERIC_SUITS:
             return False
-        available_tiles = wall.available_tiles
-        for combs in ((1, 2), (-1, 1), (-2, -1)):
-            try:
-                if all(tile + rank in available_tiles for rank in combs):
-                    return True
-            except InvalidInstance:
-                continue
+        count_tile = wall.count_tile
+        for t1, t2 in tile.CHOW_SHAPES[tile.mask]:
+            if count_tile(t1) and count_tile(t2):
+                return True
         return False
 
     def check_chow_tiles(self, tiles, tile):
@@ -343,58 +459,54 @@ class MahjongManager(object):
         return True
 
     def chow(self, wall, tiles, tile):
-        available_tiles = wall.available_tiles
         for chow_tile in tiles:
-            available_tiles.remove(chow_tile)
+            wall.take_tiles(chow_tile)
 
         wall.used_tiles['chow'].append(sorted(tiles + [tile]))
         wall.used_count += 3
         wall.suits[tile.suit] += 1
 
     def pong(self, wall, tile):
-        available_tiles = wall.available_tiles
-        idx = available_tiles.index(tile)
-        available_tiles[idx:idx + 2] = []
-        assert available_tiles.count(tile) < 2, available_tiles
+        wall.take_tiles(tile, 2)
+        assert wall.count_tile(tile) < 2, wall
         wall.used_tiles['pong'].append([tile, tile, tile])
         wall.used_count += 3
         wall.suits[tile.suit] += 1
 
     def exposed_kong(self, wall, tile):
-        available_tiles = wall.available_tiles
-        assert available_tiles.count(tile) == 3, (tile, available_tiles)
+        assert wall.count_tile(tile) == 3, (tile, wall)
 
-        idx = available_tiles.index(tile)
-        available_tiles[idx:idx + 3] = []
-        assert available_tiles.count(tile) == 0, available_tiles.count(tile)
+        wall.take_tiles(tile, 3)
         wall.used_tiles['kong']['exposed'].append([tile, tile, tile, tile])
         wall.used_count += 4
         wall.suits[tile.suit] += 1
 
     def concealed_kong(self, wall, tile):
-        available_tiles = wall.available_tiles
-        assert available_tiles.count(tile) == 4, (tile, available_tiles)
+        assert wall.count_tile(tile) == 4, (tile, wall)
 
-        idx = available_tiles.index(tile)
-        available_tiles[idx:idx + 4] = []
-        assert available_tiles.count(tile) == 0, available_tiles
+        wall.take_tiles(tile, 4)
         wall.used_tiles['kong']['concealed'].append([tile, tile, tile, tile])
         wall.used_count += 4
 
     def additional_kong(self, wall, tile):
-        wall.available_tiles.remove(tile)
-        assert wall.available_tiles.count(tile) == 0, wall.available_tiles
+        wall.take_tiles(tile)
+        assert wall.count_tile(tile) == 0, wall
 
         used_tiles = wall.used_tiles
         used_tiles['pong'].remove([tile, tile, tile])
         used_tiles['kong']['additional'].append([tile, tile, tile, tile])
         wall.used_count += 1
 
-    def get_combinations(self, tiles, joker_count=0, used_tiles=None):
+    def get_combinations(self, tiles, joker_count=0, used_tiles=None,
+                         unique=False, limit=None):
         results = []
         if used_tiles:
             kongs = sum(used_tiles['kong'].values(), [])
-        for comb in combinations(tiles, joker_count):
+        if unique:
+            combs = unique_combinations(tiles, joker_count, limit)
+        else:
+            combs = combinations(tiles, joker_count)
+        for comb in combs:
             if used_tiles:
                 comb['sequences'].extend(used_tiles['chow'])
                 comb['triplets'].extend(used_tiles['pong'])
@@ -402,6 +514,29 @@ class MahjongManager(object):
             results.append(comb)
         return results
 
+    def get_shanten(self, tiles):
+        return get_shanten(tiles, self.has_pairs_patterns)
+
+    def get_shanten_batch(self, hands):
+        return get_shanten_batch(hands, self.has_pairs_patterns)
+
+    def get_live_counts(self):
+        '''Return the tiles left in the deck as tile -> count, the tiles of
+        the hands and of the melds are out of the deck already.
+        '''
+        return Counter(self.deck.tiles)
+
+    def get_discards(self, tile_wall, live_counts=None):
+        '''Return a Discard(tile, shanten, tiles, count) for every distinct
+        available tile of the wall, the improving tiles are counted in
+        live_counts which defaults to get_live_counts.
+        '''
+        if live_counts is None:
+            live_counts = self.get_live_counts()
+        return get_discards(
+            tile_wall.available_tiles, live_counts, self.has_pairs_patterns
+        )
+
     def get_joker_count(self, tiles):
         return sum(tiles.count(joker) for joker in self.jokers)
 
@@ -416,6 +551,10 @@ class MahjongManager(object):
             if joker_count is None:
                 joker_count = self.get_joker_count(tiles)
             filtered_tiles = self._filter_joker_tiles(tiles, joker_count)
+            encoded = encode(filtered_tiles)
+            if encoded is not None:
+                return joker_count > get_lack_of_jokers(encoded[0])[0]
+
             suits = defaultdict(list)
             for tile in filtered_tiles:
                 suits[tile.suit].append(tile)
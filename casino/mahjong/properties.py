@@ -2,7 +2,7 @@ from collections import Counter
 
 __all__ = [
     'is_same_suit', 'is_7_pairs', 'is_7_pairs_with_joker', 'get_lack_of_joker',
-    'combinations'
+    'combinations', 'unique_combinations'
 ]
 
 
@@ -82,15 +82,13 @@ def sub_combinations(tiles, joker_count=0):
             comb['triplets'] = [[t1, t1, t1]] + comb['triplets']
             yield comb
 
-    if t1.rank < 8:
-        n1, n2 = t1 + 1, t1 + 2
-        ts = tiles[:]
-        try:
+    partners = t1.SEQUENCE_PARTNERS[t1.mask]
+    if len(partners) == 2:
+        n1, n2 = partners
+        if n1 in tiles and n2 in tiles:
+            ts = tiles[:]
             ts.remove(n1)
             ts.remove(n2)
-        except ValueError:
-            pass
-        else:
             for comb in sub_combinations(ts, joker_count):
                 comb['sequences'] = [[t1, n1, n2]] + comb['sequences']
                 yield comb
@@ -102,20 +100,13 @@ def sub_combinations(tiles, joker_count=0):
                 comb['triplets'] = [[t1, t1]] + comb['triplets']
                 yield comb
 
-        if t1.suit in t1.NUMERIC_SUITS:
-            for rank in (1, 2):
-                if not t1.validate_mask(t1.mask + rank):
-                    continue
-                t2 = t1 + rank
+        for t2 in partners:
+            if t2 in tiles:
                 ts = tiles[:]
-                try:
-                    ts.remove(t2)
-                except ValueError:
-                    continue
-                else:
-                    for comb in sub_combinations(ts, free_joker):
-                        comb['sequences'] = [[t1, t2]] + comb['sequences']
-                        yield comb
+                ts.remove(t2)
+                for comb in sub_combinations(ts, free_joker):
+                    comb['sequences'] = [[t1, t2]] + comb['sequences']
+                    yield comb
 
     if joker_count >= 2:
         for comb in sub_combinations(tiles[:], joker_count - 2):
@@ -151,6 +142,34 @@ def combinations(tiles, joker_count=0):
             yield comb
 
 
+def unique_combinations(tiles, joker_count=0, limit=None):
+    '''Yield every distinct combination once, with the triplets and the
+    sequences sorted, in the order they are first found by combinations. At
+    most limit combinations are yielded if it is given.
+    '''
+    if limit is not None and limit <= 0:
+        return
+
+    seen = set()
+    for comb in combinations(tiles, joker_count):
+        triplets = sorted(comb['triplets'])
+        sequences = sorted(comb['sequences'])
+        key = (
+            tuple(comb['eye']),
+            tuple(tuple(triplet) for triplet in triplets),
+            tuple(tuple(sequence) for sequence in sequences),
+            comb['joker_count'],
+        )
+        if key in seen:
+            continue
+        seen.add(key)
+        comb['triplets'] = triplets
+        comb['sequences'] = sequences
+        yield comb
+        if limit is not None and len(seen) >= limit:
+            return
+
+
 def get_lack_of_joker(suit_tiles, used_count=0, needed_count=4):
     count = len(suit_tiles)
     if count < 3:
@@ -171,17 +190,15 @@ def get_lack_of_joker(suit_tiles, used_count=0, needed_count=4):
             needed_count
         )
 
-    if needed_count != 0 and t1.rank < 8:
+    partners = t1.SEQUENCE_PARTNERS[t1.mask]
+    if needed_count != 0 and len(partners) == 2 and \
+            partners[0] in suit_tiles and partners[1] in suit_tiles:
         ts = suit_tiles[:]
-        try:
-            ts.remove(t1 + 1)
-            ts.remove(t1 + 2)
-        except ValueError:
-            pass
-        else:
-            needed_count = min(
-                get_lack_of_joker(ts, used_count, needed_count), needed_count
-            )
+        ts.remove(partners[0])
+        ts.remove(partners[1])
+        needed_count = min(
+            get_lack_of_joker(ts, used_count, needed_count), needed_count
+        )
 
     if used_count + 1 < needed_count:
         ucount = used_count + 1
@@ -191,23 +208,16 @@ def get_lack_of_joker(suit_tiles, used_count=0, needed_count=4):
                 needed_count
             )
 
-        if t1.suit in t1.NUMERIC_SUITS:
-            for rank in (1, 2):
-                if needed_count == 0:
-                    break
-                if not t1.validate_mask(t1.mask + rank):
-                    continue
-                tile = t1 + rank
+        for tile in partners:
+            if needed_count == 0:
+                break
+            if tile in suit_tiles:
                 ts = suit_tiles[:]
-                try:
-                    ts.remove(tile)
-                except ValueError:
-                    continue
-                else:
-                    needed_count = min(
-                        get_lack_of_joker(ts, ucount, needed_count),
-                        needed_count
-                    )
+                ts.remove(tile)
+                needed_count = min(
+                    get_lack_of_joker(ts, ucount, needed_count),
+                    needed_count
+                )
 
     if used_count + 2 < needed_count:
         needed_count = min(
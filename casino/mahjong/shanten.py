@@ -0,0 +1,233 @@
+from collections import namedtuple
+
+from .lookup import (
+    SLOTS, STANDARD_TILES, HONOR, GROUP_COUNT, NUMERIC_SIZE, HONOR_SIZE
+)
+
+__all__ = [
+    'encode', 'get_frontier', 'get_shanten', 'get_shanten_keys',
+    'get_shanten_batch', 'get_discards', 'Discard',
+]
+
+Discard = namedtuple('Discard', ['tile', 'shanten', 'tiles', 'count'])
+
+# group key -> non dominated (melds, partials, pair), the numeric suits share
+# one table
+_frontiers = [{}, {}]
+_empty = ((0, 0, 0),)
+
+
+def _prune(results):
+    return tuple(
+        item for item in results
+        if not any(other != item and
+                   other[0] >= item[0] and
+                   other[1] >= item[1] and
+                   other[2] >= item[2]
+                   for other in results)
+    )
+
+
+def _get_frontier(table, key, size, with_sequence):
+    frontier = table.get(key)
+    if frontier is not None:
+        return frontier
+    if key == 0:
+        return _empty
+
+    pos = 0
+    weight = 10 ** (size - 1)
+    while key // weight % 10 == 0:
+        pos += 1
+        weight //= 10
+    count = key // weight % 10
+    results = set()
+
+    def add(used, melds, partials, pair):
+        for m, t, p in _get_frontier(table, key - used, size, with_sequence):
+            if p + pair <= 1:
+                results.add((m + melds, t + partials, p + pair))
+
+    if count >= 3:
+        add(weight * 3, 1, 0, 0)
+    if count >= 2:
+        add(weight * 2, 0, 0, 1)
+        add(weight * 2, 0, 1, 0)
+    if with_sequence:
+        next1 = weight // 10 if pos + 1 < size else 0
+        next2 = weight // 100 if pos + 2 < size else 0
+        has_next1 = next1 and key // next1 % 10
+        has_next2 = next2 and key // next2 % 10
+        if has_next1 and has_next2:
+            add(weight + next1 + next2, 1, 0, 0)
+        if has_next1:
+            add(weight + next1, 0, 1, 0)
+        if has_next2:
+            add(weight + next2, 0, 1, 0)
+    # the first tile is isolated
+    add(weight, 0, 0, 0)
+
+    table[key] = frontier = _prune(results)
+    return frontier
+
+
+def get_frontier(group, key):
+    '''Return the non dominated (melds, partials, pair) decompositions of a
+    group key.
+    '''
+    if group == HONOR:
+        return _get_frontier(_frontiers[1], key, HONOR_SIZE, False)
+    return _get_frontier(_frontiers[0], key, NUMERIC_SIZE, True)
+
+
+def encode(tiles):
+    '''Encode the tiles into per group count keys, tiles out of the standard
+    kinds can never be used so they are left out.
+    '''
+    keys = [0] * GROUP_COUNT
+    for tile in tiles:
+        slot = SLOTS[tile.mask]
+        if slot is not None:
+            keys[slot[0]] += slot[1]
+    return keys
+
+
+def _get_pairs_shanten(keys):
+    kinds = pairs = 0
+    for key in keys:
+        while key:
+            digit = key % 10
+            if digit:
+                kinds += 1
+                if digit >= 2:
+                    pairs += 1
+            key //= 10
+    return 6 - pairs + max(0, 7 - kinds)
+
+
+def _combine(combined, frontier):
+    return _prune({
+        (m1 + m2, t1 + t2, p1 + p2)
+        for m1, t1, p1 in combined
+        for m2, t2, p2 in frontier
+        if p1 + p2 <= 1
+    })
+
+
+def _evaluate(combined, count):
+    needed = count // 3
+    shanten = 2 * needed
+    for melds, partials, pair in combined:
+        melds = min(melds, needed)
+        partials = min(partials, needed - melds)
+        shanten = min(shanten, 2 * (needed - melds) - partials - pair)
+    return shanten
+
+
+def get_shanten_keys(keys, count, with_pairs=False):
+    '''Return the shanten of a hand of count tiles encoded as keys, -1 for a
+    complete hand and 0 for a ready hand. As usual a hand waiting only on the
+    fifth tile of a kind is taken as ready.
+    '''
+    combined = _empty
+    for group, key in enumerate(keys):
+        if key:
+            combined = _combine(combined, get_frontier(group, key))
+
+    shanten = _evaluate(combined, count)
+    if with_pairs and count in (13, 14):
+        shanten = min(shanten, _get_pairs_shanten(keys))
+    return shanten
+
+
+def get_shanten(tiles, with_pairs=False):
+    return get_shanten_keys(encode(tiles), len(tiles), with_pairs)
+
+
+def get_shanten_batch(hands, with_pairs=False):
+    '''Return the shanten of every hand, identical hands are computed once'''
+    cached = {}
+    results = []
+    for tiles in hands:
+        keys = encode(tiles)
+        hand_key = (len(tiles),) + tuple(keys)
+        shanten = cached.get(hand_key)
+        if shanten is None:
+            shanten = cached[hand_key] = get_shanten_keys(
+                keys, len(tiles), with_pairs
+            )
+        results.append(shanten)
+    return results
+
+
+def get_discards(tiles, live_counts, with_pairs=False):
+    '''Return a Discard for every distinct tile of a hand waiting to discard,
+    with the shanten after the discard, the improving tiles and the live count
+    of them in live_counts (tile -> count).
+
+    The frontiers of the untouched groups are combined once and shared by all
+    the discard and draw pairs.
+    '''
+    count = len(tiles)
+    if count % 3 != 2:
+        return []
+
+    keys = encode(tiles)
+    combined_others = {}
+    evaluated = {}
+
+    def get_others(groups):
+        combined = combined_others.get(groups)
+        if combined is None:
+            combined = _empty
+            for group, key in enumerate(keys):
+                if key and group not in groups:
+                    combined = _combine(combined, get_frontier(group, key))
+            combined_others[groups] = combined
+        return combined
+
+    def evaluate(hand_keys, hand_count):
+        hand_key = (hand_count,) + tuple(hand_keys)
+        shanten = evaluated.get(hand_key)
+        if shanten is not None:
+            return shanten
+        groups = tuple(
+            group for group in range(GROUP_COUNT)
+            if hand_keys[group] != keys[group]
+        )
+        combined = get_others(groups)
+        for group in groups:
+            if hand_keys[group]:
+                combined = _combine(
+                    combined, get_frontier(group, hand_keys[group])
+                )
+        shanten = _evaluate(combined, hand_count)
+        if with_pairs and hand_count in (13, 14):
+            shanten = min(shanten, _get_pairs_shanten(hand_keys))
+        evaluated[hand_key] = shanten
+        return shanten
+
+    draws = [
+        (tile, SLOTS[tile.mask], live_counts.get(tile, 0))
+        for tile in STANDARD_TILES if live_counts.get(tile, 0) > 0
+    ]
+    discards = []
+    for tile in sorted(set(tiles)):
+        rest = list(keys)
+        slot = SLOTS[tile.mask]
+        if slot is not None:
+            rest[slot[0]] -= slot[1]
+        shanten = evaluate(rest, count - 1)
+
+        improving = []
+        live = 0
+        for draw, (group, weight), draw_count in draws:
+            if rest[group] // weight % 10 == 4:
+                continue
+            rest[group] += weight
+            if evaluate(rest, count) < shanten:
+                improving.append(draw)
+                live += draw_count
+            rest[group] -= weight
+        discards.append(Discard(tile, shanten, improving, live))
+    return discards
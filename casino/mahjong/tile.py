@@ -12,6 +12,8 @@ __all__ = ['Tile']
 @total_ordering
 class Tile(object):
 
+    __slots__ = ('suit', 'rank', 'mask')
+
     SUIT_SPECIAL = 0
     SUIT_CHARACTER = 1
     SUIT_DOT = 2
@@ -57,12 +59,17 @@ class Tile(object):
         self.rank = rank
         self.mask = (suit << 5) + rank
 
-        self.suit_name = self.SUIT_NAMES.get(suit, 'invalid_suit')
-        self.rank_name = self.RANK_NAMES.get(rank, 'invalid_rank')
-
         if not self.validate(suit, rank):
             raise InvalidInstance(str(self))
 
+    @property
+    def suit_name(self):
+        return self.SUIT_NAMES.get(self.suit, 'invalid_suit')
+
+    @property
+    def rank_name(self):
+        return self.RANK_NAMES.get(self.rank, 'invalid_rank')
+
     @classmethod
     def _initialize_properties(cls):
         cls.NUMERIC_SUITS = (cls.SUIT_CHARACTER, cls.SUIT_DOT, cls.SUIT_BAMBOO)
@@ -111,6 +118,27 @@ class Tile(object):
             cls(cls.SUIT_FLOWER_BLACK, rank) for rank in cls.FLOWER_BLACK_RANKS
         ]
         cls.SPECIAL_TILES = [cls(cls.SUIT_SPECIAL, cls.RANK_JOKER)]
+        # every kind, the 34 standard kinds come first
+        cls.KIND_TILES = (
+            cls.NUMERIC_TILES + cls.WIND_TILES + cls.DRAGON_TILES +
+            cls.FLOWER_RED_TILES + cls.FLOWER_BLACK_TILES + cls.SPECIAL_TILES
+        )
+
+        # tables indexed by mask: the valid tiles 1 and 2 ranks above, and the
+        # other two tiles of every chow made with the tile
+        cls.SEQUENCE_PARTNERS = [()] * 256
+        cls.CHOW_SHAPES = [()] * 256
+        for tile in cls.NUMERIC_TILES:
+            cls.SEQUENCE_PARTNERS[tile.mask] = tuple(
+                other for other in (tile.neighbor(1), tile.neighbor(2))
+                if other is not None
+            )
+            cls.CHOW_SHAPES[tile.mask] = tuple(
+                (tile.neighbor(r1), tile.neighbor(r2))
+                for r1, r2 in ((1, 2), (-1, 1), (-2, -1))
+                if tile.neighbor(r1) is not None and
+                tile.neighbor(r2) is not None
+            )
 
     @classmethod
     def create_tiles(cls, with_character=True, with_dot=True, with_bamboo=True,
@@ -153,11 +181,23 @@ class Tile(object):
 
     @classmethod
     def from_mask(cls, mask):
-        return Tile((mask & 0xe0) >> 5, mask & 0x1f)
+        tile = Tile.try_from_mask(mask)
+        if tile is None:
+            tile = Tile((mask & 0xe0) >> 5, mask & 0x1f)
+        return tile
 
     @classmethod
     def from_masks(cls, masks):
-        return [Tile((mask & 0xe0) >> 5, mask & 0x1f) for mask in masks]
+        return [Tile.from_mask(mask) for mask in masks]
+
+    def neighbor(self, delta):
+        '''Return the tile of the same suit delta ranks away, None if it is
+        invalid.
+        '''
+        other = self.__class__.try_from_mask(self.mask + delta)
+        if other is not None and other.suit == self.suit:
+            return other
+        return None
 
     def __add__(self, rank):
         # if not isinstance(rank, int):
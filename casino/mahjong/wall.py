@@ -3,7 +3,16 @@ from collections import Counter
 
 from .tile import Tile
 
-__all__ = ['TileWall']
+__all__ = ['TileWall', 'CompactTileWall']
+
+KIND_COUNT = len(Tile.KIND_TILES)
+# tile mask -> slot of the count array
+KIND_INDEX = [None] * 256
+for _idx, _tile in enumerate(Tile.KIND_TILES):
+    KIND_INDEX[_tile.mask] = _idx
+# slots in the order of the sorted tiles
+SORTED_KINDS = sorted(range(KIND_COUNT), key=lambda idx: Tile.KIND_TILES[idx])
+del _idx, _tile
 
 
 class TileWall(object):
@@ -31,7 +40,7 @@ class TileWall(object):
 
     @property
     def total_count(self):
-        return len(self.available_tiles) + self.used_count
+        return self.available_count + self.used_count
 
     @property
     def available_count(self):
@@ -54,8 +63,82 @@ class TileWall(object):
         self.available_tiles.remove(tile)
         self.suits[tile.suit] -= 1
 
+    def count_tile(self, tile):
+        return self.available_tiles.count(tile)
+
+    def take_tiles(self, tile, count=1):
+        # take the tiles out for a meld, suits is maintained by the melds
+        available_tiles = self.available_tiles
+        idx = available_tiles.index(tile)
+        available_tiles[idx:idx + count] = []
+
+    def iter_counts(self):
+        return iter(Counter(self.available_tiles).items())
+
     def __str__(self):
         return '[available_tiles|%s][used_tiles|%s]' % (
             self.available_tiles, self.used_tiles,
         )
     __unicode__ = __repr__ = __str__
+
+
+class CompactTileWall(TileWall):
+    '''TileWall keeps the available tiles as a count per tile kind, the sorted
+    available_tiles list is built on demand and should be taken as read only.
+    '''
+
+    __slots__ = ('counts', '_count', '_tiles')
+
+    @property
+    def available_tiles(self):
+        tiles = self._tiles
+        if tiles is None:
+            tiles = self._tiles = []
+            counts = self.counts
+            kind_tiles = Tile.KIND_TILES
+            for idx in SORTED_KINDS:
+                if counts[idx]:
+                    tiles.extend([kind_tiles[idx]] * counts[idx])
+        return tiles
+
+    @available_tiles.setter
+    def available_tiles(self, tiles):
+        counts = self.counts = [0] * KIND_COUNT
+        for tile in tiles:
+            counts[KIND_INDEX[tile.mask]] += 1
+        self._count = sum(counts)
+        self._tiles = None
+
+    @property
+    def available_count(self):
+        return self._count
+
+    def add_tile(self, tile):
+        self.counts[KIND_INDEX[tile.mask]] += 1
+        self._count += 1
+        self._tiles = None
+        self.suits[tile.suit] += 1
+
+    def remove_tile(self, tile):
+        self.take_tiles(tile)
+        self.suits[tile.suit] -= 1
+
+    def count_tile(self, tile):
+        idx = KIND_INDEX[tile.mask]
+        return 0 if idx is None else self.counts[idx]
+
+    def take_tiles(self, tile, count=1):
+        counts = self.counts
+        idx = KIND_INDEX[tile.mask]
+        if idx is None or counts[idx] < count:
+            raise ValueError('%s not enough in wall' % tile)
+        counts[idx] -= count
+        self._count -= count
+        self._tiles = None
+
+    def iter_counts(self):
+        counts = self.counts
+        kind_tiles = Tile.KIND_TILES
+        for idx in SORTED_KINDS:
+            if counts[idx]:
+                yield kind_tiles[idx], counts[idx]
@@ -13,6 +13,8 @@ __all__ = ['Card']
 @total_ordering
 class Card(object):
 
+    __slots__ = ('suit', 'rank', 'mask')
+
     SUIT_DIAMOND = 1
     SUIT_CLUB = 2
     SUIT_HEART = 3
@@ -41,12 +43,17 @@ class Card(object):
         self.rank = rank
         self.mask = suit * 100 + rank
 
-        self.suit_name = self.SUIT_NAMES.get(suit, suit)
-        self.rank_name = self.RANK_NAMES.get(rank, rank)
-
         if not self.validate(suit, rank):
             raise InvalidInstance(str(self))
 
+    @property
+    def suit_name(self):
+        return self.SUIT_NAMES.get(self.suit, self.suit)
+
+    @property
+    def rank_name(self):
+        return self.RANK_NAMES.get(self.rank, self.rank)
+
     @classmethod
     def _initialize_properties(cls):
         cls.NORMAL_SUITS = (
@@ -95,11 +102,23 @@ class Card(object):
 
     @classmethod
     def from_mask(cls, mask):
-        return cls(mask // 100, mask % 100)
+        card = cls.try_from_mask(mask)
+        if card is None:
+            card = cls(mask // 100, mask % 100)
+        return card
 
     @classmethod
     def from_masks(cls, masks):
-        return [cls(mask // 100, mask % 100) for mask in masks]
+        return [cls.from_mask(mask) for mask in masks]
+
+    def neighbor(self, delta):
+        '''Return the card of the same suit delta ranks away, None if it is
+        invalid.
+        '''
+        other = self.__class__.try_from_mask(self.mask + delta)
+        if other is not None and other.suit == self.suit:
+            return other
+        return None
 
     def __add__(self, rank):
         # if not isinstance(rank, int):
@@ -1,10 +1,14 @@
 from bisect import insort
 
+from .properties import get_rank_word
+
 __all__ = ['HandCard']
 
 
 class HandCard(object):
 
+    __slots__ = ('cards',)
+
     def __init__(self, cards):
         self.cards = sorted(cards)
 
@@ -12,6 +16,13 @@ class HandCard(object):
     def masks(self):
         return [card.mask for card in self.cards]
 
+    @property
+    def word(self):
+        '''The rank count word of the cards, computed on every access as the
+        cards list may be changed directly.
+        '''
+        return get_rank_word(self.cards)
+
     def add_card(self, card):
         insort(self.cards, card)
 
@@ -1,10 +1,11 @@
 from operator import attrgetter
 
-from casino.utils import random_shuffle_algorithm
+from casino.utils import random_shuffle_algorithm, LRUCache
 
 from .card import Card
 from .deck import Deck
-from .properties import get_properties
+from .patterns import BUILTIN_PATTERNS
+from .properties import WIDTHS, classify, get_moves, get_properties
 
 
 class PokerManager(object):
@@ -16,6 +17,12 @@ class PokerManager(object):
         self.card_class = card_class
         self.shuffle_algorithm = shuffle_algorithm or random_shuffle_algorithm
         self.patterns = []
+        # pattern id -> pattern if only builtin patterns are registered
+        self.classified_patterns = {}
+        # pattern id -> the registered builtin patterns
+        self.move_patterns = {}
+        # rank count word -> the plays of the builtin patterns
+        self.move_cache = LRUCache(4096)
 
         self.draw_joker = None
         self.jokers = []
@@ -25,9 +32,11 @@ class PokerManager(object):
     def left_cards(self):
         return len(self.deck)
 
-    def reset(self, deck, ran):
+    def reset(self, deck, ran, shuffle=True):
+        # the decks of casino.dealer are shuffled already
         self.deck = deck
-        self.shuffle_algorithm(deck.cards, ran)
+        if shuffle:
+            self.shuffle_algorithm(deck.cards, ran)
 
         self.draw_joker = None
         del self.jokers[:]
@@ -39,16 +48,85 @@ class PokerManager(object):
     def register_pattern(self, pattern, sort_func=None):
         self.patterns.append(pattern)
         self.patterns.sort(key=sort_func or self.sort_func, reverse=True)
+        self._update_classified_patterns()
 
     def register_patterns(self, patterns, sort_func=None):
         self.patterns.extend(patterns)
         self.patterns.sort(key=sort_func or self.sort_func, reverse=True)
+        self._update_classified_patterns()
+
+    def _update_classified_patterns(self):
+        self.move_patterns = dict(
+            (pattern.id, pattern) for pattern in self.patterns
+            if pattern in BUILTIN_PATTERNS
+        )
+        if all(pattern in BUILTIN_PATTERNS for pattern in self.patterns):
+            self.classified_patterns = dict(
+                (pattern.id, pattern) for pattern in self.patterns
+            )
+        else:
+            self.classified_patterns = None
 
     def get_pattern(self, cards):
+        classified_patterns = self.classified_patterns
+        if classified_patterns is not None:
+            result = classify(cards)
+            if result is not None:
+                pattern = classified_patterns.get(result[0])
+                if pattern is None:
+                    return None
+                return pattern.from_cards(cards, result[1], result[2])
+
         properties = get_properties(cards)
         for pattern in self.patterns:
             if pattern.validate(properties):
                 return pattern(properties)
 
+    def get_moves(self, handcard, last=None):
+        '''Return a pattern for every distinct play (by pattern, size and max
+        rank) of the registered builtin patterns in handcard, from the lowest
+        rank, a play takes the lowest cards of its ranks. With last only the
+        plays of the same pattern and size with a higher rank are returned.
+
+        The plays are cached per rank count word, which is built from the
+        cards on every call.
+        '''
+        cards = handcard.cards
+        # index of the first card of every rank in the sorted cards
+        starts = {}
+        word = 0
+        for idx, card in enumerate(cards):
+            rank = card.rank
+            if rank not in starts:
+                starts[rank] = idx
+            word += 1 << (rank << 2)
+
+        moves = self.move_cache.get(word)
+        if moves is None:
+            moves = get_moves(word)
+            self.move_cache.set(word, moves)
+
+        patterns = self.move_patterns
+        if last is not None:
+            last_pattern = patterns.get(last.id)
+            if last_pattern is not last.__class__:
+                return []
+            patterns = {last.id: last_pattern}
+            last_size, last_rank = last.size, last.max_card.rank
+
+        plays = []
+        for pattern_id, size, rank in moves:
+            pattern = patterns.get(pattern_id)
+            if pattern is None or last is not None and (
+                    size != last_size or rank <= last_rank):
+                continue
+            width = WIDTHS[pattern_id]
+            play = []
+            for idx in range(rank - size + 1, rank + 1):
+                begin = starts[idx]
+                play.extend(cards[begin:begin + width])
+            plays.append(pattern.from_cards(play, size, play[-1]))
+        return plays
+
     def set_joker_factory(self, factory):
         self.joker_factory = factory
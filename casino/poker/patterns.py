@@ -1,11 +1,35 @@
-from functools import total_ordering
-from itertools import combinations, chain
+from itertools import chain
+from numbers import Integral
+from operator import attrgetter
 
 from casino.core import PatternMeta
 from casino.utils import add_metaclass
 
+from .properties import (
+    SINGLE, PAIR, TRIPLET, PAIRS, TRIPLETS, find_rank_run, get_properties
+)
+
+# bits of the size and the max rank in the sort keys
+SIZE_BITS = RANK_BITS = 8
+
+
+def get_key(point, size, rank):
+    '''Pack point, size and rank into an int ordered as the tuple, point may
+    be any int, size and rank must fit in their bits.
+    '''
+    if not isinstance(point, Integral) or not 0 <= size < 1 << SIZE_BITS \
+            or not 0 <= rank < 1 << RANK_BITS:
+        raise ValueError(
+            'cannot pack point %r, size %r and rank %r' % (point, size, rank)
+        )
+    return (((point << SIZE_BITS) + size) << RANK_BITS) + rank
+
+
+def sort_patterns(patterns, reverse=False):
+    '''Return the patterns sorted by their keys'''
+    return sorted(patterns, key=attrgetter('key'), reverse=reverse)
+
 
-@total_ordering
 @add_metaclass(PatternMeta)
 class BasePattern(object):
 
@@ -13,9 +37,67 @@ class BasePattern(object):
     POINT = -1
 
     def __init__(self, properties):
-        self.size = 1
-        self.properties = properties
-        self.max_card = max(properties['cards'])
+        self._properties = properties
+        self.cards = properties['cards']
+        self.max_card = max(self.cards)
+        self.size = self.get_size(properties)
+
+    @classmethod
+    def from_cards(cls, cards, size, max_card):
+        '''Create the pattern of classified cards, the properties are built on
+        first access.
+        '''
+        pattern = cls.__new__(cls)
+        pattern._properties = None
+        pattern.cards = cards
+        pattern.max_card = max_card
+        pattern.size = size
+        return pattern
+
+    # the key is packed on first use, and again after size, max_card or
+    # properties are set, as the subclasses may set them after
+    # BasePattern.__init__
+    @property
+    def key(self):
+        key = self._key
+        if key is None:
+            key = self._key = get_key(
+                self.POINT, self._size, self._max_card.rank
+            )
+        return key
+
+    @property
+    def size(self):
+        return self._size
+
+    @size.setter
+    def size(self, size):
+        self._size = size
+        self._key = None
+
+    @property
+    def max_card(self):
+        return self._max_card
+
+    @max_card.setter
+    def max_card(self, max_card):
+        self._max_card = max_card
+        self._key = None
+
+    @classmethod
+    def get_size(cls, properties):
+        return 1
+
+    @property
+    def properties(self):
+        if self._properties is None:
+            self._properties = get_properties(self.cards)
+        return self._properties
+
+    @properties.setter
+    def properties(self, properties):
+        self._properties = properties
+        self._key = None
 
     @classmethod
     def validate(cls, properties):
@@ -25,24 +107,25 @@ class BasePattern(object):
     def filter(cls, properties, max_card, size=1, force=False):
         raise NotImplementedError
 
+    # the patterns are ordered by POINT, size and the rank of max_card, all
+    # packed into key
     def __eq__(self, other):
-        return (
-            self.POINT == other.POINT and
-            self.size == other.size and
-            self.max_card.rank == other.max_card.rank
-        )
+        return self.key == other.key
 
     def __ne__(self, other):
-        return not self == other
+        return self.key != other.key
 
     def __lt__(self, other):
-        return (
-            self.POINT < other.POINT or
-            (self.POINT == other.POINT and
-                (self.size < other.size or
-                    (self.size == other.size and
-                        self.max_card.rank < other.max_card.rank)))
-        )
+        return self.key < other.key
+
+    def __le__(self, other):
+        return self.key <= other.key
+
+    def __gt__(self, other):
+        return self.key > other.key
+
+    def __ge__(self, other):
+        return self.key >= other.key
 
     def __str__(self):
         return '[{},{}]'.format(self.__class__.__name__, self.max_card)
@@ -51,7 +134,7 @@ class BasePattern(object):
 
 class Single(BasePattern):
 
-    id = 101
+    id = SINGLE
     POINT = 0
 
     @classmethod
@@ -74,7 +157,7 @@ class Single(BasePattern):
 
 class Pair(BasePattern):
 
-    id = 102
+    id = PAIR
     POINT = 10
 
     @classmethod
@@ -98,7 +181,7 @@ class Pair(BasePattern):
 
 class Triplet(BasePattern):
 
-    id = 103
+    id = TRIPLET
     POINT = 20
 
     @classmethod
@@ -122,12 +205,12 @@ class Triplet(BasePattern):
 
 class Pairs(Pair):
 
-    id = 104
+    id = PAIRS
     POINT = 30
 
-    def __init__(self, properties):
-        super(Pairs, self).__init__(properties)
-        self.size = len(properties['pair'])
+    @classmethod
+    def get_size(cls, properties):
+        return len(properties['pair'])
 
     @classmethod
     def _validate(cls, ranks):
@@ -150,29 +233,21 @@ class Pairs(Pair):
     def filter(cls, properties, max_card, size=3, force=False):
         max_rank = max_card.rank if max_card else 0
         pairs = properties['pair']
-        for combs in combinations(sum(pairs, []), size * 2):
-            ranks = [card.rank for card in combs]
-            if ranks[-1] <= max_rank or not cls._validate(ranks):
-                continue
-            return combs
-        if force:
-            cards = chain(pairs, properties['triplet'], properties['multiple'])
-            for combs in combinations(sorted(sum(cards, [])), size * 2):
-                ranks = [card.rank for card in combs]
-                if ranks[-1] <= max_rank or not cls._validate(ranks):
-                    continue
-                return combs
-        return ()
+        combs = find_rank_run(pairs, max_rank, size, 2)
+        if not combs and force:
+            cards = pairs + properties['triplet'] + properties['multiple']
+            combs = find_rank_run(cards, max_rank, size, 2, True)
+        return combs
 
 
 class Triplets(Triplet):
 
-    id = 105
+    id = TRIPLETS
     POINT = 40
 
-    def __init__(self, properties):
-        super(Triplets, self).__init__(properties)
-        self.size = len(properties['triplet'])
+    @classmethod
+    def get_size(cls, properties):
+        return len(properties['triplet'])
 
     @classmethod
     def _validate(cls, ranks):
@@ -195,17 +270,14 @@ class Triplets(Triplet):
     @classmethod
     def filter(cls, properties, max_card, size=2, force=False):
         max_rank = max_card.rank if max_card else 0
-        cards = properties['triplet']
-        for combs in combinations(sum(cards, []), size * 3):
-            ranks = [card.rank for card in combs]
-            if ranks[-1] <= max_rank or not cls._validate(ranks):
-                continue
-            return combs
-        if force:
-            cards = chain(cards, properties['multiple'])
-            for combs in combinations(sorted(sum(cards, [])), size * 3):
-                ranks = [card.rank for card in combs]
-                if ranks[-1] <= max_rank or not cls._validate(ranks):
-                    continue
-                return combs
-        return ()
+        triplets = properties['triplet']
+        combs = find_rank_run(triplets, max_rank, size, 3)
+        if not combs and force:
+            cards = triplets + properties['multiple']
+            combs = find_rank_run(cards, max_rank, size, 3, True)
+        return combs
+
+
+# the builtin patterns never overlap, so the managers may classify the cards
+# instead of validating them one by one
+BUILTIN_PATTERNS = (Single, Pair, Triplet, Pairs, Triplets)
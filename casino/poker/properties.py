@@ -1,11 +1,24 @@
 from collections import defaultdict
 
 __all__ = [
-    'is_same_rank', 'is_same_suit', 'is_rank_consecutive', 'is_rank_one_gap'
+    'is_same_rank', 'is_same_suit', 'is_rank_consecutive', 'is_rank_one_gap',
+    'encode', 'classify', 'find_rank_run', 'get_rank_word', 'get_moves',
 ]
 
 transformation = {1: 'single', 2: 'pair', 3: 'triplet', 4: 'multiple'}
 
+# ids of the builtin patterns
+SINGLE, PAIR, TRIPLET, PAIRS, TRIPLETS = 101, 102, 103, 104, 105
+
+# cards of a play of the builtin patterns per rank
+WIDTHS = {SINGLE: 1, PAIR: 2, TRIPLET: 3, PAIRS: 2, TRIPLETS: 3}
+# the least sizes of the runs
+MIN_PAIRS, MIN_TRIPLETS = 3, 2
+
+# card class -> (card bit by mask, cards by bit), the bits follow the sort
+# order of the cards so the highest bit is the max card
+_tables = {}
+
 
 def is_same_rank(cards):
     if not cards:
@@ -58,6 +71,33 @@ def is_rank_consecutive(cards):
     return True
 
 
+def find_rank_run(groups, max_rank, size, width, sort=False):
+    '''Find the lowest run of size consecutive ranks in groups (the cards of
+    a rank) with the top rank above max_rank, in one pass over a rank array.
+    Return the first width cards of every rank of the run, sorted first if
+    sort, or () if there is no such run.
+    '''
+    if size <= 0 or len(groups) < size:
+        return ()
+    top = max(group[0].rank for group in groups)
+    by_rank = [None] * (top + 1)
+    for group in groups:
+        by_rank[group[0].rank] = group
+
+    run = 0
+    for rank in range(max(0, max_rank - size + 2), top + 1):
+        if by_rank[rank] is None:
+            run = 0
+            continue
+        run += 1
+        if run >= size and rank > max_rank:
+            cards = []
+            for group in by_rank[rank - size + 1:rank + 1]:
+                cards.extend((sorted(group) if sort else group)[:width])
+            return tuple(cards)
+    return ()
+
+
 def get_properties(cards):
     counter = defaultdict(list)
     for card in cards:
@@ -74,3 +114,107 @@ def get_properties(cards):
     for cards in counter.values():
         properties[transformation.get(len(cards), 'multiple')].append(cards)
     return properties
+
+
+def _get_table(card_class):
+    table = _tables.get(card_class)
+    if table is None:
+        cards = sorted(card_class.create_cards())
+        bits = [0] * (max(card.mask for card in cards) + 1)
+        for idx, card in enumerate(cards):
+            bits[card.mask] = 1 << idx
+        table = _tables[card_class] = (bits, cards)
+    return table
+
+
+def encode(cards):
+    '''Encode the cards into a bit per distinct card and a word of the rank
+    counts, 4 bits per rank. Return None if a card is out of the deck.
+    '''
+    if not cards:
+        return 0, 0
+    bits = _get_table(cards[0].__class__)[0]
+    size = len(bits)
+    hand = word = 0
+    for card in cards:
+        mask = card.mask
+        if mask >= size or not bits[mask]:
+            return None
+        hand |= bits[mask]
+        word += 1 << (card.rank << 2)
+    return hand, word
+
+
+def get_rank_word(cards):
+    '''Return the word of the rank counts of the cards, 4 bits per rank'''
+    word = 0
+    for card in cards:
+        word += 1 << (card.rank << 2)
+    return word
+
+
+def classify(cards):
+    '''Classify the cards into the builtin patterns by their rank count word,
+    return (pattern id, size, max card) with None as the id if no builtin
+    pattern matches. Return None if a card is out of the deck.
+
+    A rank of more than 15 cards carries into the next rank and lowers the
+    total of the word, so it never matches a pattern of len(cards).
+    '''
+    encoded = encode(cards)
+    if encoded is None:
+        return None
+    hand, word = encoded
+    count = len(cards)
+    if not count:
+        return None, 0, None
+
+    max_card = _get_table(cards[0].__class__)[1][hand.bit_length() - 1]
+    # the counts from the lowest rank, a run of n equal counts c is n hex
+    # digits of c
+    counts = word >> (((word & -word).bit_length() - 1) & ~3)
+    if count == 1:
+        return SINGLE, 1, max_card
+    if count == 2:
+        return (PAIR if counts == 2 else None), 1, max_card
+    if count == 3:
+        return (TRIPLET if counts == 3 else None), 1, max_card
+    if count >= 6:
+        if count % 2 == 0 and \
+                counts == ((1 << (count << 1)) - 1) // 15 * 2:
+            return PAIRS, count // 2, max_card
+        if count % 3 == 0 and \
+                counts == ((1 << (count // 3 << 2)) - 1) // 15 * 3:
+            return TRIPLETS, count // 3, max_card
+    return None, 0, max_card
+
+
+def get_moves(word):
+    '''Return (pattern id, size, top rank) of every distinct play of the
+    builtin patterns in a rank count word, in one pass from the lowest rank.
+    '''
+    moves = []
+    rank = pairs = triplets = 0
+    while word:
+        count = word & 0xf
+        if count >= 2:
+            pairs += 1
+            if count >= 3:
+                triplets += 1
+            else:
+                triplets = 0
+        else:
+            pairs = triplets = 0
+        if count:
+            moves.append((SINGLE, 1, rank))
+            if count >= 2:
+                moves.append((PAIR, 1, rank))
+            if count >= 3:
+                moves.append((TRIPLET, 1, rank))
+            for size in range(MIN_PAIRS, pairs + 1):
+                moves.append((PAIRS, size, rank))
+            for size in range(MIN_TRIPLETS, triplets + 1):
+                moves.append((TRIPLETS, size, rank))
+        word >>= 4
+        rank += 1
+    return moves
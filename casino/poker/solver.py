@@ -0,0 +1,223 @@
+from collections import namedtuple
+from timeit import default_timer
+
+from .properties import WIDTHS, get_moves
+
+__all__ = ['Solver', 'SolveResult', 'WIN', 'DRAW', 'LOSS']
+
+SolveResult = namedtuple(
+    'SolveResult',
+    ['value', 'move', 'nodes', 'elapsed', 'nodes_per_sec', 'complete']
+)
+
+WIN, DRAW, LOSS = 1, 0, -1
+# flags of the transposition table entries
+EXACT, LOWER, UPPER = 0, 1, 2
+# nodes between two looks at the clock
+CLOCK_INTERVAL = 1024
+
+
+class BudgetExceeded(Exception):
+    pass
+
+
+class Solver(object):
+    '''Alpha-beta search of a shedding endgame with the builtin patterns
+    registered in a PokerManager. A play beats the last one of the same
+    pattern and size with a higher rank, when all the others pass the last
+    player leads again with any play, and the team of the player who plays
+    all the cards first wins.
+
+    As the suits never matter a position is the rank count words of the hands,
+    the player to move and the last play with its player, which with the
+    teams and the team to win for is the key of the transposition table.
+    '''
+
+    def __init__(self, manager, max_nodes=None, time_limit=None):
+        self.manager = manager
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        # word -> [(move, word delta)], the plays of most cards first
+        self.moves = {}
+        # position -> (value, flag)
+        self.table = {}
+        self.nodes = 0
+        self.deadline = None
+
+    def clear(self):
+        self.moves.clear()
+        self.table.clear()
+
+    def get_moves(self, word):
+        moves = self.moves.get(word)
+        if moves is None:
+            manager = self.manager
+            cached = manager.move_cache.get(word)
+            if cached is None:
+                cached = get_moves(word)
+                manager.move_cache.set(word, cached)
+            patterns = manager.move_patterns
+            items = []
+            for move in cached:
+                pattern_id, size, rank = move
+                if pattern_id not in patterns:
+                    continue
+                width = WIDTHS[pattern_id]
+                delta = 0
+                for idx in range(rank - size + 1, rank + 1):
+                    delta += width << (idx << 2)
+                items.append((width * size, move, delta))
+            items.sort(key=lambda item: -item[0])
+            moves = self.moves[word] = [item[1:] for item in items]
+        return moves
+
+    def get_plays(self, word, last):
+        '''Return the (move, word delta) of the plays after last, with a None
+        move to pass if last is not None.
+        '''
+        if last is None:
+            return list(self.get_moves(word))
+        plays = [
+            (move, delta) for move, delta in self.get_moves(word)
+            if move[0] == last[0] and move[1] == last[1] and move[2] > last[2]
+        ]
+        plays.append((None, 0))
+        return plays
+
+    def solve(self, hands, player=0, last=None, last_player=None,
+              teams=None):
+        '''Search the best play of player with hands (the HandCard of every
+        player in turn order) after last, a pattern played by last_player
+        which defaults to the previous player. teams is the team of every
+        player, by default the player plays against all the others.
+
+        Return a SolveResult, the value is WIN, DRAW or LOSS for the team of
+        player and the move is the pattern to play from the hand of player,
+        None to pass. When the budget runs out the search is not complete,
+        the value is None and the move is the best one found so far.
+        '''
+        count = len(hands)
+        if teams is None:
+            teams = [int(idx != player) for idx in range(count)]
+        teams = tuple(teams)
+        if last is not None:
+            if last_player is None:
+                last_player = (player - 1) % count
+            if last_player == player:
+                last = None
+            else:
+                last = (last.id, last.size, last.max_card.rank)
+        words = tuple(hand.word for hand in hands)
+
+        self.nodes = 0
+        begin = default_timer()
+        self.deadline = None
+        if self.time_limit is not None:
+            self.deadline = begin + self.time_limit
+
+        plays = self.get_plays(words[player], last)
+        move = plays[0][0] if plays else None
+        value = DRAW if not plays else None
+        complete = True
+        alpha = LOSS
+        try:
+            for play, delta in plays:
+                score = self.evaluate(
+                    words, player, play, delta, last, last_player, teams,
+                    teams[player], alpha, WIN
+                )
+                if value is None or score > value:
+                    value, move = score, play
+                    alpha = max(alpha, value)
+                if value == WIN:
+                    break
+        except BudgetExceeded:
+            value, complete = None, False
+        elapsed = default_timer() - begin
+
+        if move is not None:
+            for pattern in self.manager.get_moves(hands[player]):
+                if (pattern.id, pattern.size, pattern.max_card.rank) == move:
+                    move = pattern
+                    break
+        return SolveResult(
+            value, move, self.nodes, elapsed,
+            self.nodes / elapsed if elapsed else 0.0, complete
+        )
+
+    def evaluate(self, words, player, move, delta, last, last_player, teams,
+                 team, alpha, beta):
+        '''Return the value of player making move, None to pass'''
+        next_player = (player + 1) % len(words)
+        if move is None:
+            return self.search(
+                words, next_player, last, last_player, teams, team, alpha,
+                beta
+            )
+        word = words[player] - delta
+        if not word:
+            return WIN if teams[player] == team else LOSS
+        played = list(words)
+        played[player] = word
+        return self.search(
+            tuple(played), next_player, move, player, teams, team, alpha,
+            beta
+        )
+
+    def search(self, words, player, last, last_player, teams, team, alpha,
+               beta):
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise BudgetExceeded
+        if self.deadline is not None and \
+                self.nodes % CLOCK_INTERVAL == 0 and \
+                default_timer() > self.deadline:
+            raise BudgetExceeded
+
+        if last_player == player:
+            last = last_player = None
+        # the values are for team, which keeps the table right when the
+        # solver is reused for another player
+        key = (words, player, last, last_player, teams, team)
+        entry = self.table.get(key)
+        if entry is not None:
+            value, flag = entry
+            if flag == EXACT:
+                return value
+            if flag == LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+
+        plays = self.get_plays(words[player], last)
+        if not plays:
+            # nothing to lead with, no one can finish
+            return DRAW
+
+        origin_alpha, origin_beta = alpha, beta
+        maximizing = teams[player] == team
+        best = LOSS if maximizing else WIN
+        for move, delta in plays:
+            value = self.evaluate(
+                words, player, move, delta, last, last_player, teams, team,
+                alpha, beta
+            )
+            if maximizing:
+                best = max(best, value)
+                alpha = max(alpha, best)
+            else:
+                best = min(best, value)
+                beta = min(beta, best)
+            if alpha >= beta:
+                break
+
+        if best <= origin_alpha:
+            flag = UPPER
+        elif best >= origin_beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table[key] = (best, flag)
+        return best
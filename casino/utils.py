@@ -1,6 +1,12 @@
+from collections import namedtuple, OrderedDict
 from random import Random
 
 
+CacheInfo = namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize']
+)
+
+
 # copied from six
 def add_metaclass(metaclass):
     """Class decorator for creating a class with a metaclass."""
@@ -25,3 +31,93 @@ def random_shuffle_algorithm(objs, ran=Random()):
         other = ran.randrange(idx, count)
         objs[idx], objs[other] = objs[other], objs[idx]
     objs[:] = objs[::3] + objs[1::3] + objs[2::3]
+
+
+# length -> cycles of the interleave of random_shuffle_algorithm, a cycle is
+# kept as its first position and the tuple of the rest
+_interleave_cycles = {}
+
+
+def _get_interleave_cycles(count):
+    cycles = _interleave_cycles.get(count)
+    if cycles is None:
+        # objs[idx] takes objs[sources[idx]]
+        sources = list(range(0, count, 3)) + list(range(1, count, 3)) + \
+            list(range(2, count, 3))
+        seen = [False] * count
+        cycles = []
+        for begin in range(count):
+            if seen[begin] or sources[begin] == begin:
+                continue
+            cycle = []
+            idx = begin
+            while not seen[idx]:
+                seen[idx] = True
+                cycle.append(idx)
+                idx = sources[idx]
+            cycles.append((cycle[0], tuple(cycle[1:])))
+        cycles = _interleave_cycles[count] = tuple(cycles)
+    return cycles
+
+
+def inplace_random_shuffle_algorithm(objs, ran=Random()):
+    '''Same permutation as random_shuffle_algorithm with the same ran, the
+    interleave is done in place along its cycles, which are cached by length.
+    '''
+    count = len(objs)
+    for idx in range(count - 1):  # noqa
+        other = ran.randrange(idx, count)
+        objs[idx], objs[other] = objs[other], objs[idx]
+    for prev, rest in _get_interleave_cycles(count):
+        first = objs[prev]
+        for idx in rest:
+            objs[prev] = objs[idx]
+            prev = idx
+        objs[prev] = first
+
+
+class LRUCache(object):
+    '''Bounded mapping which evicts the least recently used key'''
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, default=None):
+        data = self.data
+        try:
+            value = data.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        data[key] = value
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        if self.maxsize <= 0:
+            # nothing is kept
+            return
+        data = self.data
+        if key in data:
+            del data[key]
+        elif len(data) >= self.maxsize:
+            data.popitem(last=False)
+            self.evictions += 1
+        data[key] = value
+
+    def clear(self):
+        self.data.clear()
+
+    def info(self):
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize,
+            len(self.data)
+        )
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, key):
+        return key in self.data
@@ -9,6 +9,8 @@ from casino.utils import add_metaclass
 @total_ordering
 class Card(object):
 
+    __slots__ = ('suit', 'rank', 'mask')
+
     SUIT_LOWER = 1
     SUIT_UPPER = 2
 
@@ -28,12 +30,17 @@ class Card(object):
         self.rank = rank
         self.mask = suit * 100 + rank
 
-        self.suit_name = self.SUIT_NAMES.get(suit, 'invalid_suit')
-        self.rank_name = self.RANK_NAMES.get(rank, 'invalid_rank')
-
         if not self.validate(suit, rank):
             raise InvalidInstance(str(self))
 
+    @property
+    def suit_name(self):
+        return self.SUIT_NAMES.get(self.suit, 'invalid_suit')
+
+    @property
+    def rank_name(self):
+        return self.RANK_NAMES.get(self.rank, 'invalid_rank')
+
     @classmethod
     def _initialize_properties(cls):
         pass
@@ -51,6 +58,45 @@ class Card(object):
             for rank in (cls.RANK_TWO, cls.RANK_SEVEN, cls.RANK_TEN)
         ]
 
+        # tables indexed by mask: the sorted sequences made with the card, the
+        # sorted pairs waiting a joker for a sequence, the card of the other
+        # suit, and the (sequence, pairs) of the 2-7-10 and 1-5-10 sequences
+        size = max(card.mask for card in cls.NORMAL_CARDS) + 1
+        cls.SEQUENCES = [()] * size
+        cls.PARTIAL_SEQUENCES = [()] * size
+        cls.INVERSE_CARDS = [None] * size
+        cls.SEQUENCES_2_7_10 = [None] * size
+        cls.SEQUENCES_1_5_10 = [None] * size
+        for card in cls.NORMAL_CARDS:
+            mask = card.mask
+            neighbors = dict(
+                (delta, card.neighbor(delta)) for delta in (-2, -1, 1, 2)
+            )
+            cls.SEQUENCES[mask] = tuple(
+                tuple(sorted([card, neighbors[r1], neighbors[r2]]))
+                for r1, r2 in ((-2, -1), (-1, 1), (1, 2))
+                if neighbors[r1] is not None and neighbors[r2] is not None
+            )
+            cls.PARTIAL_SEQUENCES[mask] = tuple(
+                tuple(sorted([card, neighbors[delta]]))
+                for delta in (-2, -1, 1, 2) if neighbors[delta] is not None
+            )
+            cls.INVERSE_CARDS[mask] = cls(
+                cls.SUIT_UPPER if card.suit == cls.SUIT_LOWER
+                else cls.SUIT_LOWER,
+                card.rank
+            )
+            for ranks, table in (((2, 7, 10), cls.SEQUENCES_2_7_10),
+                                 ((1, 5, 10), cls.SEQUENCES_1_5_10)):
+                if card.rank in ranks:
+                    table[mask] = (
+                        tuple(cls(card.suit, rank) for rank in ranks),
+                        tuple(
+                            tuple(sorted([card, cls(card.suit, rank)]))
+                            for rank in set(ranks) - {card.rank}
+                        ),
+                    )
+
     @classmethod
     def validate(cls, suit, rank):
         return suit in cls.SUITS and rank in cls.RANKS
@@ -61,11 +107,23 @@ class Card(object):
 
     @classmethod
     def from_mask(cls, mask):
-        return cls(mask // 100, mask % 100)
+        card = cls.try_from_mask(mask)
+        if card is None:
+            card = cls(mask // 100, mask % 100)
+        return card
 
     @classmethod
     def from_masks(cls, masks):
-        return [cls(mask // 100, mask % 100) for mask in masks]
+        return [cls.from_mask(mask) for mask in masks]
+
+    def neighbor(self, delta):
+        '''Return the card of the same suit delta ranks away, None if it is
+        invalid.
+        '''
+        other = self.__class__.try_from_mask(self.mask + delta)
+        if other is not None and other.suit == self.suit:
+            return other
+        return None
 
     def __add__(self, rank):
         return self.__class__(self.suit, self.rank + rank)
@@ -84,11 +142,7 @@ class Card(object):
 
     def __invert__(self):
         """return the instance of logical negation"""
-        if self.suit == self.SUIT_LOWER:
-            return self.__class__(self.SUIT_UPPER, self.rank)
-        elif self.suit == self.SUIT_UPPER:
-            return self.__class__(self.SUIT_LOWER, self.rank)
-        assert False, ('unknown suit', self)
+        return self.INVERSE_CARDS[self.mask]
 
     def __hash__(self):
         return self.mask
@@ -0,0 +1,341 @@
+from .card import Card
+from .properties import (
+    filter_sequence, filter_sequence_1_5_10, filter_sequence_2_7_10,
+    filter_triplet, filter_triplet_rank
+)
+
+__all__ = ['Engine', 'encode', 'settle', 'get_engine', 'MELD_FILTERS']
+
+# the filters whose melds only need the cards in hand, the engine reproduces
+# them with the melds yielded for a hand of 3 cards of every kind
+MELD_FILTERS = (
+    filter_sequence, filter_triplet_rank, filter_sequence_2_7_10,
+    filter_sequence_1_5_10, filter_triplet,
+)
+
+KIND_CARDS = sorted(Card.NORMAL_CARDS)
+KIND_COUNT = len(KIND_CARDS)
+# the count of every kind takes 3 bits of a state, in the sort order
+KIND_BITS = 3
+KIND_MASK = (1 << KIND_BITS) - 1
+UNITS = [1 << (idx * KIND_BITS) for idx in range(KIND_COUNT)]
+# card mask -> kind index and the shift of its count in a state
+KINDS = [None] * (max(card.mask for card in KIND_CARDS) + 1)
+SHIFTS = list(KINDS)
+for _idx, _card in enumerate(KIND_CARDS):
+    KINDS[_card.mask] = _idx
+    SHIFTS[_card.mask] = _idx * KIND_BITS
+del _idx, _card
+FULL_HAND = sorted(KIND_CARDS * 3)
+# the bits of the count fields, a count of 3 or more has the high bit or
+# both low bits set
+LOW_BITS = sum(UNITS)
+HIGH_BITS = LOW_BITS << 2
+# the memos are dropped once they hold so many states
+MEMO_SIZE = 1 << 18
+
+# chow_filter -> engine
+_engines = {}
+
+
+def encode(cards, ordered=False):
+    '''Return the state of the cards, None if a card is out of the kinds,
+    there are more than 7 cards of a kind or, with ordered, the cards are not
+    sorted.
+    '''
+    state = last = 0
+    shifts = SHIFTS
+    size = len(shifts)
+    for card in cards:
+        mask = card.mask
+        if mask >= size or shifts[mask] is None:
+            return None
+        if ordered:
+            if mask < last:
+                return None
+            last = mask
+        shift = shifts[mask]
+        if (state >> shift) & KIND_MASK == KIND_MASK:
+            return None
+        state += 1 << shift
+    return state
+
+
+def settle(cards, fixed_cards):
+    '''Return the (state, count, changed) of the cards grouped with the
+    fixed cards as HandCard.set_cards, which takes the kinds of 3 or more
+    cards and the kinds of fixed_cards out of the cards, changed is if any
+    card is taken out. None if the cards cannot be encoded or a fixed kind
+    has less than 3 cards.
+    '''
+    state = encode(cards)
+    if state is None:
+        return None
+    count = len(cards)
+    changed = False
+    for card, fixed_count in fixed_cards.items():
+        mask = card.mask
+        if fixed_count < 3 or mask >= len(SHIFTS) or SHIFTS[mask] is None:
+            return None
+        have = (state >> SHIFTS[mask]) & KIND_MASK
+        if have:
+            state -= have << SHIFTS[mask]
+            count -= have
+            changed = True
+    if state & HIGH_BITS or state & (state >> 1) & LOW_BITS:
+        for shift in range(0, KIND_COUNT * KIND_BITS, KIND_BITS):
+            have = (state >> shift) & KIND_MASK
+            if have >= 3:
+                state -= have << shift
+                count -= have
+                changed = True
+    return state, count, changed
+
+
+def measure(comb, exact=False):
+    '''Return the state of comb and the (shift, count, exact) checks of its
+    kinds, with exact the state must hold just count cards of the kind.
+    '''
+    counts = {}
+    for card in comb:
+        counts[KINDS[card.mask]] = counts.get(KINDS[card.mask], 0) + 1
+    checks = tuple(
+        (idx * KIND_BITS, count, exact)
+        for idx, count in sorted(counts.items())
+    )
+    return sum(UNITS[idx] * count for idx, count in counts.items()), checks
+
+
+def contains(state, checks):
+    '''Return if the state passes the checks of measure'''
+    for shift, count, exact in checks:
+        have = (state >> shift) & KIND_MASK
+        if have < count or exact and have != count:
+            return False
+    return True
+
+
+def get_engine(chow_filter):
+    '''Return the engine of the filters, None if one of them is unknown'''
+    key = tuple(chow_filter)
+    engine = _engines.get(key)
+    if engine is None:
+        if not all(comb_filter in MELD_FILTERS for comb_filter in key):
+            return None
+        engine = _engines[key] = Engine(key)
+    return engine
+
+
+class Engine(object):
+    '''Decompose the cards into melds over the count of every kind, which
+    gives the combinations of Manager.combinations of sorted cards in the same
+    order. The decompositions of every (state, joker count) are computed once.
+    '''
+
+    def __init__(self, chow_filter):
+        self.chow_filter = tuple(chow_filter)
+        # kind -> [(comb, delta, used joker, checks, is triplet)]
+        self.shapes = [self._get_shapes(card) for card in KIND_CARDS]
+        # kind -> [(comb, delta, checks, exact)], the chows of a card
+        self.chow_shapes = [
+            self._get_chow_shapes(card) for card in KIND_CARDS
+        ]
+        # (state, joker count) -> ((sequences, triplets), ...)
+        self.melds = {}
+        # (state, joker count) -> bool
+        self.has_melds = {}
+        # (state, card mask) -> bool
+        self.has_chows = {}
+
+    def _get_shapes(self, card):
+        shapes = []
+        # the melds of chow_filter are sequences, even with filter_triplet
+        filters = [(comb_filter, False) for comb_filter in self.chow_filter]
+        filters.append((filter_triplet, True))
+        for comb_filter, is_triplet in filters:
+            for comb, used in comb_filter(FULL_HAND, card, 1):
+                comb = tuple(comb)
+                # filter_triplet takes exactly 3 cards of the kind
+                exact = comb_filter is filter_triplet and not used
+                delta, checks = measure(comb, exact)
+                shapes.append((comb, delta, used, checks, is_triplet))
+        return shapes
+
+    def _get_chow_shapes(self, card):
+        shapes = []
+        for comb_filter in self.chow_filter:
+            exact = comb_filter is filter_triplet
+            for comb, _ in comb_filter(FULL_HAND, card):
+                comb = tuple(comb)
+                delta, checks = measure(comb, exact)
+                shapes.append((comb, delta, checks, exact))
+        return shapes
+
+    def _iter_shapes(self, state, joker_count):
+        # the lowest kind in hand is the first card of the reference
+        kind = ((state & -state).bit_length() - 1) // KIND_BITS
+        for shape in self.shapes[kind]:
+            if shape[2] <= joker_count and contains(state, shape[3]):
+                yield shape
+
+    def get_melds(self, state, count, joker_count):
+        '''Return the (sequences, triplets) of every decomposition of the
+        state of count cards as Manager.sub_combinations.
+        '''
+        if not state or (count + joker_count) % 3:
+            return ()
+        key = (state, joker_count)
+        results = self.melds.get(key)
+        if results is not None:
+            return results
+
+        results = []
+        for comb, delta, used, _, is_triplet in self._iter_shapes(
+                state, joker_count):
+            rest = state - delta
+            if not rest:
+                results.append(((), (comb,)) if is_triplet else ((comb,), ()))
+                continue
+            for sequences, triplets in self.get_melds(
+                    rest, count - len(comb), joker_count - used):
+                if is_triplet:
+                    results.append((sequences, (comb,) + triplets))
+                else:
+                    results.append(((comb,) + sequences, triplets))
+
+        if len(self.melds) >= MEMO_SIZE:
+            self.melds.clear()
+        results = self.melds[key] = tuple(results)
+        return results
+
+    def check_melds(self, state, count, joker_count):
+        '''Return if the state of count cards has any decomposition'''
+        if not state or (count + joker_count) % 3:
+            return False
+        key = (state, joker_count)
+        result = self.has_melds.get(key)
+        if result is not None:
+            return result
+
+        result = False
+        for comb, delta, used, _, _ in self._iter_shapes(state, joker_count):
+            rest = state - delta
+            if not rest or self.check_melds(
+                    rest, count - len(comb), joker_count - used):
+                result = True
+                break
+
+        if len(self.has_melds) >= MEMO_SIZE:
+            self.has_melds.clear()
+        self.has_melds[key] = result
+        return result
+
+    def _iter_eyes(self, state, joker_count):
+        '''Yield (eye, rest) as Manager.combinations_with_eye'''
+        for idx in range(KIND_COUNT):
+            have = (state >> (idx * KIND_BITS)) & KIND_MASK
+            if not have:
+                continue
+            card = KIND_CARDS[idx]
+            if have >= 2:
+                yield [card, card], state - 2 * UNITS[idx], joker_count
+            if joker_count == 1:
+                yield [card], state - UNITS[idx], 0
+
+    def combinations(self, state, count, joker_count=0):
+        '''Yield the combinations of the state of count cards as
+        Manager.combinations.
+        '''
+        if (count + joker_count) % 3 == 2:
+            for eye, rest, rest_jokers in self._iter_eyes(state, joker_count):
+                if not rest:
+                    yield {'eye': eye, 'triplets': [], 'sequences': []}
+                    continue
+                for sequences, triplets in self.get_melds(
+                        rest, count - len(eye), rest_jokers):
+                    yield {
+                        'eye': list(eye),
+                        'triplets': [list(comb) for comb in triplets],
+                        'sequences': [list(comb) for comb in sequences],
+                    }
+        elif count:
+            for sequences, triplets in self.get_melds(
+                    state, count, joker_count):
+                yield {
+                    'eye': [],
+                    'triplets': [list(comb) for comb in triplets],
+                    'sequences': [list(comb) for comb in sequences],
+                }
+
+    def has_combinations(self, state, count, joker_count=0):
+        '''Return if there is any combination of the state of count cards'''
+        if (count + joker_count) % 3 == 2:
+            for eye, rest, rest_jokers in self._iter_eyes(state, joker_count):
+                if not rest or self.check_melds(
+                        rest, count - len(eye), rest_jokers):
+                    return True
+            return False
+        return self.check_melds(state, count, joker_count)
+
+    def get_candidates(self, state, count, separate=True, fixed=False):
+        '''Return the cards which complete the state of count cards as
+        Manager.check_win_with_card, fixed is if the hand has fixed or used
+        cards. The states of all the cards share the memos.
+        '''
+        count += 1
+        if count % 3 == 1:
+            return []
+        candidates = []
+        for idx, card in enumerate(KIND_CARDS):
+            have = (state >> (idx * KIND_BITS)) & KIND_MASK
+            if have == KIND_MASK:
+                # the 3 bits of the kind are full, one more card would carry
+                # into the count of the next kind
+                continue
+            rest, rest_count, rest_fixed = state + UNITS[idx], count, fixed
+            if not separate and have == 2:
+                # the triplet is fixed as in check_win_with_card
+                rest -= 3 * UNITS[idx]
+                rest_count -= 3
+                rest_fixed = True
+            if not rest_count and rest_fixed or \
+                    self.has_combinations(rest, rest_count):
+                candidates.append(card)
+        return candidates
+
+    def iter_chows(self, state, card):
+        '''Yield the chows of card as Manager._check_chow, the tuples of the
+        combs which use all of card in the state, which holds the card.
+        '''
+        shift = SHIFTS[card.mask]
+        shapes = self.chow_shapes[KINDS[card.mask]]
+        stack = [(state, None, (), False)]
+        while stack:
+            state, last, combs, done = stack.pop()
+            if done:
+                yield combs
+                continue
+            children = []
+            for comb, delta, checks, exact in shapes:
+                if last is not None and not exact and comb < last:
+                    continue
+                if not contains(state, checks):
+                    continue
+                rest = state - delta
+                children.append((
+                    rest, comb, combs + (comb,),
+                    not (rest >> shift) & KIND_MASK
+                ))
+            # pop the children in the order of the filters
+            stack.extend(reversed(children))
+
+    def has_chow(self, state, card):
+        '''Return if card has any chow in the state'''
+        key = (state, card.mask)
+        result = self.has_chows.get(key)
+        if result is None:
+            result = next(self.iter_chows(state, card), None) is not None
+            if len(self.has_chows) >= MEMO_SIZE:
+                self.has_chows.clear()
+            self.has_chows[key] = result
+        return result
@@ -1,11 +1,15 @@
 from bisect import insort
 from collections import Counter
-from copy import deepcopy
 from itertools import chain
 
 
 class HandCard(object):
 
+    # used_combs and combinations are set by the manager on check_win
+    __slots__ = (
+        'cards', 'fixed_cards', 'used_cards', 'used_combs', 'combinations',
+    )
+
     def __init__(self, cards):
         self.used_cards = {
             'chow': [],
@@ -55,8 +59,15 @@ class HandCard(object):
             self.cards.remove(card)
 
     def clone(self):
-        ins = self.__class__(self.cards + list(self.fixed_cards.elements()))
-        ins.used_cards = deepcopy(self.used_cards)
+        '''Return a copy of the hand which shares the melds of used_cards,
+        they are only added and removed as a whole.
+        '''
+        ins = self.__class__.__new__(self.__class__)
+        ins.cards = self.cards[:]
+        ins.fixed_cards = self.fixed_cards.copy()
+        ins.used_cards = dict(
+            (key, value[:]) for key, value in self.used_cards.items()
+        )
         return ins
 
     def __str__(self):
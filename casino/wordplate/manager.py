@@ -1,8 +1,10 @@
 from bisect import insort
 from collections import Counter
+from itertools import chain
 
 from casino.utils import random_shuffle_algorithm
 
+from .engine import KIND_CARDS, encode, get_engine, settle
 from .properties import filter_sequence, filter_sequence_2_7_10
 from .properties import filter_triplet, filter_triplet_rank
 
@@ -17,9 +19,11 @@ class Manager(object):
             filter_sequence, filter_triplet_rank, filter_sequence_2_7_10
         ]
 
-    def reset(self, cards, ran):
+    def reset(self, cards, ran, shuffle=True):
+        # the decks of casino.dealer are shuffled already
         self.cards = cards
-        self.shuffle_algorithm(cards, ran)
+        if shuffle:
+            self.shuffle_algorithm(cards, ran)
 
     def register_patterns(self, patterns):
         self.patterns.extend(patterns)
@@ -51,7 +55,7 @@ class Manager(object):
         return pattern
 
     def check_win(self, handcard):
-        cards = handcard.cards[:]
+        cards = handcard.cards
         count = len(cards)
         if count % 3 not in {2, 0}:
             return False
@@ -62,38 +66,91 @@ class Manager(object):
         if count == 0 and (handcard.fixed_cards or handcard.used_cards):
             return True
 
-        return any(self.combinations(cards))
+        return self.has_combinations(cards)
 
     def check_win_with_card(self, handcard, card, separate=True):
-        handcard = handcard.clone()
+        settled = settle(handcard.cards, handcard.fixed_cards)
+        if settled is None or settled[2]:
+            # group the triplets in cards into fixed_cards first
+            handcard = handcard.clone()
+            handcard.set_cards(
+                handcard.cards + list(handcard.fixed_cards.elements())
+            )
+
+        # apply the card to the hand and roll it back after the check
         cards = handcard.cards
-        insort(cards, card)
-        if not separate and cards.count(card) == 3:
-            cards.remove(card)
+        fixed = not separate and cards.count(card) == 2
+        if fixed:
             cards.remove(card)
             cards.remove(card)
             handcard.fixed_cards[card] = 3
-        return self.check_win(handcard)
+        else:
+            insort(cards, card)
+        try:
+            return self.check_win(handcard)
+        finally:
+            if fixed:
+                handcard.fixed_cards.pop(card)
+                insort(cards, card)
+                insort(cards, card)
+            else:
+                cards.remove(card)
+
+    def get_candidates(self, handcard, separate=True):
+        '''Return the sorted cards with which check_win_with_card is True'''
+        engine = get_engine(self.chow_filter)
+        settled = settle(handcard.cards, handcard.fixed_cards)
+        if engine is None or settled is None:
+            return [
+                card for card in KIND_CARDS
+                if self.check_win_with_card(handcard, card, separate)
+            ]
+        state, count, changed = settled
+        fixed = bool(changed or handcard.fixed_cards or handcard.used_cards)
+        return engine.get_candidates(state, count, separate, fixed)
 
     def has_candidates(self, cards):
         # if it has candidates, give it a joker, should have combinations
-        return any(self.combinations(cards, 1))
+        return self.has_combinations(cards, 1)
 
     def check_chow(self, handcard, card):
+        '''Return the chows of card, every grouping of the combs once'''
+        found = self._get_state(chain(handcard.cards, (card,)))
+        if found is not None:
+            engine, state = found
+            return [
+                list(chain.from_iterable(combs))
+                for combs in engine.iter_chows(state, card)
+            ]
         cards = handcard.cards[:]
         insort(cards, card)
         return list(self._check_chow(cards, card))
 
-    def _check_chow(self, cards, card):
+    def any_chow(self, handcard, card):
+        '''Return if card has any chow, as bool(check_chow)'''
+        found = self._get_state(chain(handcard.cards, (card,)))
+        if found is not None:
+            engine, state = found
+            return engine.has_chow(state, card)
+        cards = handcard.cards[:]
+        insort(cards, card)
+        return any(True for _ in self._check_chow(cards, card))
+
+    def _check_chow(self, cards, card, last=None):
+        # the combs are in order so a grouping is yielded once, but the
+        # triplet of filter_triplet takes all of card and is the last one
         if len(cards) <= 2:
             return
         for comb_filter in self.chow_filter:
             for comb, _ in comb_filter(cards, card):
+                if last is not None and comb_filter is not filter_triplet \
+                        and comb < last:
+                    continue
                 cs = cards[:]
                 for c in comb:
                     cs.remove(c)
                 if cs.count(card) > 0:
-                    for next_comb in self._check_chow(cs, card):
+                    for next_comb in self._check_chow(cs, card, comb):
                         yield comb + next_comb
                 else:
                     yield comb
@@ -248,7 +305,34 @@ class Manager(object):
                 else:
                     yield {'eye': [eye], 'triplets': [], 'sequences': []}
 
+    def _get_state(self, cards, ordered=False):
+        # the engine of chow_filter and the state of cards, None if the
+        # engine cannot take them
+        engine = get_engine(self.chow_filter)
+        if engine is not None:
+            state = encode(cards, ordered)
+            if state is not None:
+                return engine, state
+        return None
+
+    def has_combinations(self, cards, joker_count=0):
+        found = self._get_state(cards)
+        if found is not None:
+            engine, state = found
+            return engine.has_combinations(state, len(cards), joker_count)
+        return any(self._combinations(cards, joker_count))
+
     def combinations(self, cards, joker_count=0):
+        '''Yield the combinations of cards, with the memoized engine when the
+        cards are sorted and all the filters of chow_filter are known to it.
+        '''
+        found = self._get_state(cards, True)
+        if found is not None:
+            engine, state = found
+            return engine.combinations(state, len(cards), joker_count)
+        return self._combinations(cards, joker_count)
+
+    def _combinations(self, cards, joker_count=0):
         count = len(cards)
         if (count + joker_count) % 3 == 2:
             for comb in self.combinations_with_eye(cards, joker_count):
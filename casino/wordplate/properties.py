@@ -1,25 +1,15 @@
 from collections import Counter
 
-from casino.exceptions import InvalidInstance
-
 
 def filter_sequence(cards, card, joker_count=0):
-    for r1, r2 in ((-2, -1), (-1, 1), (1, 2),):
-        try:
-            comb = sorted([card, card + r1, card + r2])
-            if all(c in cards for c in comb):
-                yield comb, 0
-        except InvalidInstance:
-            continue
+    for comb in card.SEQUENCES[card.mask]:
+        if all(c in cards for c in comb):
+            yield list(comb), 0
 
     if joker_count > 0:
-        for delta in (-2, -1, 1, 2):
-            try:
-                comb = sorted([card, card + delta])
-                if all(c in cards for c in comb):
-                    yield comb, 1
-            except InvalidInstance:
-                continue
+        for comb in card.PARTIAL_SEQUENCES[card.mask]:
+            if all(c in cards for c in comb):
+                yield list(comb), 1
 
 
 def filter_triplet(cards, card, joker_count=0):
@@ -49,33 +39,26 @@ def filter_triplet_rank(cards, card, joker_count=0):
             yield sorted([card, c]), 1
 
 
-def filter_sequence_2_7_10(cards, card, joker_count=0):
-    if card.rank not in {2, 7, 10}:
+def _filter_special_sequence(sequences, cards, joker_count):
+    if sequences is None:
         return
-    suit = card.suit
-    cls = card.__class__
-    comb = [cls(suit, rank) for rank in (2, 7, 10)]
+    comb, partials = sequences
     if all(c in cards for c in comb):
-        yield comb, 0
+        yield list(comb), 0
 
     if joker_count > 0:
-        for rank in {2, 7, 10} - {card.rank}:
-            comb = sorted([card, cls(suit, rank)])
+        for comb in partials:
             if all(c in cards for c in comb):
-                yield comb, 1
+                yield list(comb), 1
 
 
-def filter_sequence_1_5_10(cards, card, joker_count=0):
-    if card.rank not in {1, 5, 10}:
-        return
-    suit = card.suit
-    cls = card.__class__
-    comb = [cls(suit, rank) for rank in (1, 5, 10)]
-    if all(c in cards for c in comb):
-        yield comb, 0
+def filter_sequence_2_7_10(cards, card, joker_count=0):
+    return _filter_special_sequence(
+        card.SEQUENCES_2_7_10[card.mask], cards, joker_count
+    )
 
-    if joker_count > 0:
-        for rank in {1, 5, 10} - {card.rank}:
-            comb = sorted([card, cls(suit, rank)])
-            if all(c in cards for c in comb):
-                yield comb, 1
+
+def filter_sequence_1_5_10(cards, card, joker_count=0):
+    return _filter_special_sequence(
+        card.SEQUENCES_1_5_10[card.mask], cards, joker_count
+    )
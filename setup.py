@@ -51,5 +51,8 @@ if __name__ == '__main__':
             'Programming Language :: Python :: 3',
         ],
 
-        packages=find_packages(exclude=('tests.*',)),
+        packages=find_packages(
+            exclude=('tests.*', 'benchmarks', 'benchmarks.*')
+        ),
+        extras_require={'numpy': ['numpy']},
     )
@@ -0,0 +1,145 @@
+import random
+from unittest import TestCase, skipIf
+
+from casino.mahjong import Tile
+from casino.mahjong import batch
+from casino.mahjong.batch import check_win_batch
+from casino.mahjong.deck import Deck
+from casino.mahjong.lookup import STANDARD_TILES, is_complete
+from casino.mahjong.manager import MahjongManager
+from casino.mahjong.patterns import Pairs
+
+
+def to_masks(hands, width=14):
+    return [
+        [tile.mask for tile in hand] + [0] * (width - len(hand))
+        for hand in hands
+    ]
+
+
+def to_counts(hands):
+    return [[hand.count(tile) for tile in STANDARD_TILES] for hand in hands]
+
+
+class BatchTest(TestCase):
+
+    def setUp(self):
+        self.hands = [Tile.from_masks(masks) for masks in (
+            [33, 34, 35, 38, 38],
+            [33, 34, 35, 38, 39],
+            [33, 33, 34, 34, 35, 35, 36, 36, 66, 66, 68, 68, 99, 99],
+            [33, 33, 209, 209, 209],
+            [138, 138, 138, 174, 174],
+            [33, 33, 33],
+            [36, 37, 38, 65, 66, 66, 66, 66, 67, 139, 139],
+        )]
+        self.standard_hands = self.hands[:3] + self.hands[4:]
+
+    def test_check_win_batch(self):
+        results = check_win_batch(to_masks(self.hands))
+        self.assertListEqual(
+            [bool(result) for result in results],
+            [True, False, False, True, True, False, True]
+        )
+
+        results = check_win_batch(to_counts(self.standard_hands), True)
+        self.assertListEqual(
+            [bool(result) for result in results],
+            [True, False, False, True, False, True]
+        )
+
+        results = check_win_batch(to_masks(self.hands[2:3]), with_pairs=True)
+        self.assertListEqual([bool(result) for result in results], [True])
+
+    def test_check_win_batch_with_joker(self):
+        jokers = Tile.from_masks([39, 209])
+        results = check_win_batch(to_masks(self.hands), jokers=jokers)
+        self.assertListEqual(
+            [bool(result) for result in results],
+            [True, True, False, True, True, False, True]
+        )
+
+        results = check_win_batch(
+            to_counts(self.standard_hands), True, jokers
+        )
+        self.assertListEqual(
+            [bool(result) for result in results],
+            [True, True, False, True, False, True]
+        )
+
+    def test_shapes(self):
+        def check_win_batch_python(hands):
+            return batch._check_win_batch_python(
+                hands, False, [], False, is_complete
+            )
+
+        masks = to_masks(self.hands)
+        for check in (check_win_batch, check_win_batch_python):
+            # no hands, then a single hand as a 1-D array
+            self.assertListEqual(list(check([])), [])
+            self.assertListEqual(
+                [bool(result) for result in check(masks[0])], [True]
+            )
+            self.assertListEqual(
+                [bool(result) for result in check(masks[1])], [False]
+            )
+        self.assertListEqual(list(check_win_batch([], True)), [])
+
+    def test_python_fallback(self):
+        for counts, hands in ((False, to_masks(self.hands)),
+                              (True, to_counts(self.standard_hands))):
+            for jokers in ([], Tile.from_masks([39, 209])):
+                for with_pairs in (False, True):
+                    self.assertListEqual(
+                        batch._check_win_batch_python(
+                            hands, counts, jokers, with_pairs, is_complete
+                        ),
+                        [bool(result) for result in check_win_batch(
+                            hands, counts, jokers, with_pairs
+                        )]
+                    )
+
+    def test_manager(self):
+        ran = random.Random(5)
+        tiles = [tile for tile in Tile.create_tiles() if tile.suit in (1, 5)]
+        tiles += Tile.from_masks([209, 210])
+        hands = []
+        for _ in range(300):
+            hands.append(sorted(ran.sample(tiles, ran.choice([2, 5, 8, 14]))))
+        for _ in range(100):
+            eye = ran.choice(tiles)
+            hand = [eye, eye]
+            for tile in ran.sample(tiles, 2):
+                if tile.suit == 1 and tile.rank < 8:
+                    hand.extend([tile, tile + 1, tile + 2])
+                else:
+                    hand.extend([tile, tile, tile])
+            if max(hand.count(tile) for tile in hand) <= 4:
+                hands.append(sorted(hand))
+
+        manager = MahjongManager()
+        manager.register_pattern(Pairs)
+        for joker_factory in (None, lambda deck: (
+                Tile.from_mask(33), Tile.from_masks([34, 209]))):
+            if joker_factory:
+                manager.set_joker_factory(joker_factory)
+                manager.reset(Deck(Tile.create_tiles()), ran)
+            expected = [bool(manager.check_win(hand)) for hand in hands]
+            self.assertListEqual(
+                [bool(result) for result in manager.check_win_batch(
+                    to_masks(hands)
+                )],
+                expected
+            )
+
+    @skipIf(batch.numpy is None, 'numpy is not installed')
+    def test_numpy(self):
+        numpy = batch.numpy
+        results = check_win_batch(numpy.array(to_masks(self.hands)))
+        self.assertIsInstance(results, numpy.ndarray)
+        self.assertEqual(results.dtype, bool)
+        self.assertListEqual(
+            results.tolist(), [True, False, False, True, True, False, True]
+        )
+        results = check_win_batch(numpy.zeros((0, 14), dtype=numpy.int64))
+        self.assertEqual(results.shape, (0,))
@@ -0,0 +1,210 @@
+import os
+import random
+import shutil
+import tempfile
+from collections import Counter
+from unittest import TestCase
+
+from casino.mahjong import Tile
+from casino.mahjong import lookup
+from casino.mahjong.lookup import (
+    encode, get_win_tables, is_complete, is_complete_with_joker, get_lack,
+    get_lack_of_jokers, dump_joker_tables, load_joker_tables, get_singles,
+    get_candidates
+)
+from casino.mahjong.manager import MahjongManager
+from casino.mahjong.properties import combinations, get_lack_of_joker
+
+
+class LookupTest(TestCase):
+
+    def test_encode(self):
+        tiles = Tile.from_masks([33, 33, 41, 65, 99, 138, 174])
+        keys, counts = encode(tiles)
+        self.assertListEqual(keys, [200000001, 100000000, 1000000, 1000100])
+        self.assertListEqual(counts, [3, 1, 1, 2])
+
+        self.assertIsNone(encode(Tile.from_masks([33, 209])))
+
+    def test_win_tables(self):
+        numeric, _, _, honor = get_win_tables()
+        self.assertEqual(numeric[0], 1)
+        self.assertEqual(numeric[111000000], 1)
+        self.assertEqual(numeric[200000000], 2)
+        self.assertEqual(numeric[311000000], 2)
+        self.assertEqual(numeric[111222000], 1)
+        self.assertNotIn(110000000, numeric)
+        self.assertEqual(honor[3000000], 1)
+        self.assertNotIn(1110000, honor)
+
+    def test_is_complete(self):
+        tiles = Tile.from_masks([
+            33, 33, 37, 37, 38, 38, 39, 39, 70, 71, 71, 72, 72, 73
+        ])
+        self.assertTrue(is_complete(tiles))
+
+        tiles = Tile.from_masks([33, 34, 35, 138, 138, 138, 174, 174])
+        self.assertTrue(is_complete(tiles))
+
+        tiles = Tile.from_masks([33, 34, 35, 138, 138, 174, 174, 174])
+        self.assertTrue(is_complete(tiles))
+
+        tiles = Tile.from_masks([33, 33, 65, 65])
+        self.assertFalse(is_complete(tiles))
+
+        tiles = Tile.from_masks([33, 34, 35, 36])
+        self.assertFalse(is_complete(tiles))
+
+        # flowers fall back to the combinations
+        tiles = Tile.from_masks([33, 33, 209, 209, 209])
+        self.assertTrue(is_complete(tiles))
+
+    def test_same_as_combinations(self):
+        ran = random.Random(7)
+        kinds = Tile.NUMERIC_TILES + Tile.WIND_TILES + Tile.DRAGON_TILES
+        manager = MahjongManager()
+        for _ in range(2000):
+            counter = Counter({ran.choice(kinds): 2})
+            for _ in range(ran.randint(0, 4)):
+                tile = ran.choice(kinds)
+                if tile.rank < 8 and ran.random() < 0.6:
+                    counter.update([tile, tile + 1, tile + 2])
+                else:
+                    counter[tile] += 3
+            tiles = sorted(counter.elements())
+            if ran.random() < 0.5:
+                tiles.remove(ran.choice(tiles))
+                tiles.append(ran.choice(kinds))
+                tiles.sort()
+            if max(Counter(tiles).values()) > 4:
+                continue
+            self.assertEqual(
+                is_complete(tiles), any(combinations(tiles)), tiles
+            )
+            self.assertEqual(
+                manager.check_win(tiles),
+                manager._check_win_by_combinations(tiles),
+                tiles
+            )
+
+    def test_get_lack(self):
+        self.assertTupleEqual(get_lack(0, 0), (0, 2))
+        self.assertTupleEqual(get_lack(0, 111100000), (2, 1))
+        self.assertTupleEqual(get_lack(0, 100100300), (4, 3))
+        self.assertTupleEqual(get_lack(0, 300001100), (1, 3))
+        self.assertTupleEqual(get_lack(3, 2000000), (1, 0))
+        self.assertTupleEqual(get_lack(3, 1100000), (4, 3))
+
+        for masks in ([33, 34, 35, 36, 38, 38, 38], [33, 36, 38, 38, 38],
+                      [33, 33, 33, 36, 38, 39], [33, 33, 33]):
+            tiles = Tile.from_masks(masks)
+            self.assertEqual(
+                get_lack(0, encode(tiles)[0][0])[0],
+                get_lack_of_joker(tiles[:])
+            )
+
+    def test_get_lack_of_jokers(self):
+        keys = encode(Tile.from_masks([33, 34, 65, 65, 138]))[0]
+        self.assertTupleEqual(get_lack_of_jokers(keys), (4, 3))
+
+    def test_is_complete_with_joker(self):
+        tiles = Tile.from_masks([33, 34, 38, 38, 71, 71])
+        self.assertTrue(is_complete_with_joker(tiles, 2))
+        self.assertFalse(is_complete_with_joker(tiles, 1))
+
+        tiles = Tile.from_masks([36, 38, 40, 41, 68])
+        self.assertTrue(is_complete_with_joker(tiles, 3))
+
+        tiles = Tile.from_masks([33, 65, 97])
+        self.assertFalse(is_complete_with_joker(tiles, 2))
+
+        # more jokers than the recursive combinations could place
+        tiles = Tile.from_masks([36, 40, 176])
+        self.assertTrue(is_complete_with_joker(tiles, 5))
+
+    def test_joker_same_as_combinations(self):
+        ran = random.Random(11)
+        kinds = Tile.NUMERIC_TILES + Tile.WIND_TILES + Tile.DRAGON_TILES
+        for _ in range(3000):
+            joker_count = ran.randint(0, 4)
+            suits = ran.sample(range(1, 6), ran.randint(1, 3))
+            pool = [tile for tile in kinds if tile.suit in suits] * 4
+            count = ran.choice([2, 5, 8, 11, 14]) - joker_count
+            if not 0 <= count <= len(pool):
+                continue
+            tiles = sorted(ran.sample(pool, count))
+            self.assertEqual(
+                is_complete_with_joker(tiles, joker_count),
+                any(combinations(tiles, joker_count)),
+                (tiles, joker_count)
+            )
+
+    def test_dump_joker_tables(self):
+        get_lack(0, 123000000)
+        path = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(path, 'jokers.pickle')
+            dump_joker_tables(filename)
+            numeric, honor = lookup._joker_tables
+            backup = dict(numeric)
+            numeric.clear()
+            load_joker_tables(filename)
+            self.assertDictEqual(numeric, backup)
+            self.assertIn(123000000, numeric)
+        finally:
+            shutil.rmtree(path)
+
+    def test_get_singles(self):
+        keys = encode(Tile.from_masks([33, 33, 34, 36, 36, 36, 138]))[0]
+        self.assertEqual(get_singles(keys), 3)
+
+    def test_get_candidates(self):
+        tiles = Tile.from_masks([33, 34, 35, 36, 38, 38, 38])
+        self.assertListEqual(
+            get_candidates(tiles), Tile.from_masks([33, 36, 37])
+        )
+
+        tiles = Tile.from_masks([33, 34, 35, 38, 38, 38])
+        self.assertListEqual(get_candidates(tiles), [])
+
+        # the fifth tile is never waited
+        tiles = Tile.from_masks([138, 138, 138, 138, 139, 139, 139])
+        self.assertListEqual(get_candidates(tiles), [])
+
+        tiles = Tile.from_masks([
+            33, 33, 34, 34, 35, 35, 36, 36, 66, 66, 68, 68, 99
+        ])
+        self.assertListEqual(get_candidates(tiles), [])
+        self.assertListEqual(
+            get_candidates(tiles, with_pairs=True), Tile.from_masks([99])
+        )
+
+        tiles = Tile.from_masks([33, 38, 38, 71, 71])
+        self.assertListEqual(
+            get_candidates(tiles, 2, excludes={Tile.from_mask(37)}),
+            Tile.from_masks([33, 34, 35, 38, 71])
+        )
+
+        self.assertIsNone(get_candidates(Tile.from_masks([33, 209])))
+
+    def test_candidates_are_exact(self):
+        ran = random.Random(13)
+        manager = MahjongManager()
+        kinds = Tile.NUMERIC_TILES + Tile.WIND_TILES + Tile.DRAGON_TILES
+        for _ in range(300):
+            suits = ran.sample(range(1, 6), ran.randint(1, 2))
+            pool = [tile for tile in kinds if tile.suit in suits] * 4
+            tiles = sorted(ran.sample(pool, min(13, len(pool))))
+            candidates = get_candidates(tiles)
+            counter = Counter(tiles)
+            for tile in kinds:
+                if counter[tile] == 4:
+                    continue
+                self.assertEqual(
+                    tile in candidates,
+                    manager._check_win_by_combinations(sorted(tiles + [tile])),
+                    (tiles, tile)
+                )
+            self.assertTrue(set(candidates).issubset(
+                manager._get_candidates_by_combinations(tiles)
+            ))
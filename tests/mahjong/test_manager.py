@@ -1,7 +1,7 @@
 import random
 from unittest import TestCase
 
-from casino.mahjong import Tile, TileWall
+from casino.mahjong import Tile, TileWall, CompactTileWall
 from casino.mahjong.deck import Deck
 from casino.mahjong.manager import MahjongManager
 from casino.mahjong.patterns import Pairs, Normal
@@ -10,11 +10,13 @@ from casino.mahjong.properties import combinations
 
 class MahjongTest(TestCase):
 
+    wall_class = TileWall
+
     def setUp(self):
         self.deck = Deck(Tile.create_tiles())
         self.mahjong_manager = MahjongManager()
         self.mahjong_manager.reset(self.deck, random)
-        self.wall = TileWall.from_mask([
+        self.wall = self.wall_class.from_mask([
             33, 33, 33, 37, 38, 39, 66, 68, 98, 98, 99, 100, 101,
         ])
 
@@ -107,7 +109,7 @@ class MahjongTest(TestCase):
 
     def test_wall_actions(self):
         # 1w2w2w4w5w8w 5t6t6t 1T6T7T7T
-        wall = TileWall.from_mask([
+        wall = self.wall_class.from_mask([
             33, 34, 34, 36, 37, 40, 69, 70, 70, 97, 102, 103, 103
         ])
         self.assertEqual(wall.used_count, 0)
@@ -181,13 +183,38 @@ class MahjongTest(TestCase):
             list(self.mahjong_manager.get_combinations(tiles, 1))
         )
 
+        tiles = Tile.from_masks([33, 33, 33, 34, 34, 34, 35, 35, 35, 36, 36])
+        self.assertEqual(
+            len(self.mahjong_manager.get_combinations(tiles, 3)), 275
+        )
+        self.assertEqual(
+            len(self.mahjong_manager.get_combinations(tiles, 3, None, True)),
+            132
+        )
+        self.assertEqual(
+            len(self.mahjong_manager.get_combinations(
+                tiles, 3, None, True, 8
+            )),
+            8
+        )
+
     def test_get_pattern(self):
         manager = self.mahjong_manager
         manager.register_patterns([Pairs, Normal])
-        wall = TileWall.from_mask([33, 34, 35, 36, 36, 38, 38, 38])
+        wall = self.wall_class.from_mask([33, 34, 35, 36, 36, 38, 38, 38])
         self.assertEqual(manager.get_pattern(wall), Normal)
 
-        wall = TileWall.from_mask([
+        wall = self.wall_class.from_mask([
+            33, 33, 33, 34, 34, 34, 35, 35, 35, 36, 36
+        ])
+        self.assertEqual(manager.get_pattern(wall), Normal)
+        self.assertEqual(len(wall.combinations), 3)
+        manager.max_combinations = 1
+        self.assertEqual(manager.get_pattern(wall), Normal)
+        self.assertListEqual(wall.combinations, wall.used_combs)
+        self.assertEqual(len(wall.combinations), 1)
+
+        wall = self.wall_class.from_mask([
             33, 33, 34, 34, 35, 35, 38, 38, 39, 39, 40, 40, 41, 41
         ])
         self.assertEqual(manager.get_pattern(wall), Pairs)
@@ -195,12 +222,12 @@ class MahjongTest(TestCase):
     def test_get_pattern_by_tile(self):
         manager = self.mahjong_manager
         manager.register_patterns([Pairs, Normal])
-        wall = TileWall.from_mask([33, 34, 35, 36, 38, 38, 38])
+        wall = self.wall_class.from_mask([33, 34, 35, 36, 38, 38, 38])
         self.assertEqual(
             manager.get_pattern_by_tile(wall, Tile.from_mask(36)), Normal
         )
 
-        wall = TileWall.from_mask([
+        wall = self.wall_class.from_mask([
             33, 33, 34, 34, 35, 35, 38, 38, 39, 39, 40, 40, 41
         ])
         self.assertEqual(
@@ -214,10 +241,10 @@ class MahjongTest(TestCase):
         def func(deck):
             return Tile.from_mask(33), {Tile.from_mask(33)}
         manager.set_joker_factory(func)
-        wall = TileWall.from_mask([33, 34, 35, 36, 36, 38, 38, 38])
+        wall = self.wall_class.from_mask([33, 34, 35, 36, 36, 38, 38, 38])
         self.assertEqual(manager.get_pattern(wall), Normal)
 
-        wall = TileWall.from_mask([
+        wall = self.wall_class.from_mask([
             33, 33, 34, 34, 35, 35, 38, 38, 39, 39, 40, 40, 41, 41
         ])
         self.assertEqual(manager.get_pattern(wall), Pairs)
@@ -229,12 +256,12 @@ class MahjongTest(TestCase):
         def func(deck):
             return Tile.from_mask(33), {Tile.from_mask(33)}
         manager.set_joker_factory(func)
-        wall = TileWall.from_mask([33, 34, 35, 36, 38, 38, 38])
+        wall = self.wall_class.from_mask([33, 34, 35, 36, 38, 38, 38])
         self.assertEqual(
             manager.get_pattern_by_tile(wall, Tile.from_mask(36)), Normal
         )
 
-        wall = TileWall.from_mask([
+        wall = self.wall_class.from_mask([
             33, 33, 34, 34, 35, 35, 38, 38, 39, 39, 40, 40, 41
         ])
         self.assertEqual(
@@ -343,6 +370,28 @@ class MahjongTest(TestCase):
         mm.has_pairs_patterns = True
         self.assertTrue(mm.has_candidates(tiles))
 
+    def test_joker_candidates(self):
+        mm = self.mahjong_manager
+        mm._use_joker_api()
+        mm.jokers = {Tile.from_mask(34)}
+        # the tile of a joker is a candidate as well
+        tiles = Tile.from_masks([33, 35, 36, 36, 37, 38, 39])
+        self.assertListEqual(
+            list(mm.get_candidates(tiles)), Tile.from_masks([34])
+        )
+        self.assertTrue(mm.has_candidates(tiles))
+
+        ran = random.Random(3)
+        deck = [tile for tile in Tile.create_tiles() if tile.suit in (1, 5)]
+        for jokers in ([34], [34, 209]):
+            mm.jokers = set(Tile.from_masks(jokers))
+            for _ in range(500):
+                tiles = sorted(ran.sample(deck, ran.choice([4, 7, 10, 13])))
+                self.assertEqual(
+                    bool(list(mm.get_candidates(tiles))),
+                    mm.has_candidates(tiles), tiles
+                )
+
     def test_check_win(self):
         mm = self.mahjong_manager
         tiles = Tile.from_masks([
@@ -427,3 +476,80 @@ class MahjongTest(TestCase):
 
         tiles = Tile.from_masks([37, 37, 37, 71, 71, 97, 103])
         self.assertFalse(mm.has_free_joker(tiles))
+
+
+class CompactWallMahjongTest(MahjongTest):
+
+    wall_class = CompactTileWall
+
+
+class CachedMahjongTest(MahjongTest):
+
+    def setUp(self):
+        super(CachedMahjongTest, self).setUp()
+        self.mahjong_manager.enable_cache(64)
+
+    def test_cache_info(self):
+        mm = self.mahjong_manager
+        tiles = Tile.from_masks([33, 34, 35, 38, 38])
+        self.assertTrue(mm.check_win(tiles))
+        self.assertTrue(mm.check_win(tiles[::-1]))
+        info = mm.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+        tiles = Tile.from_masks([33, 34, 35, 38])
+        self.assertListEqual(
+            list(mm.get_candidates(tiles)), Tile.from_masks([38])
+        )
+        self.assertListEqual(
+            list(mm.get_candidates(tiles)), Tile.from_masks([38])
+        )
+        self.assertTrue(mm.check_win_by_tile(tiles, Tile.from_mask(38)))
+        self.assertTrue(mm.has_candidates(tiles))
+        self.assertEqual(mm.cache_info().hits, 2)
+
+        mm.disable_cache()
+        self.assertIsNone(mm.cache_info())
+        self.assertTrue(mm.check_win(Tile.from_masks([33, 34, 35, 38, 38])))
+
+    def test_cache_evictions(self):
+        mm = self.mahjong_manager
+        mm.enable_cache(2)
+        for mask in (33, 34, 35):
+            mm.check_win(Tile.from_masks([mask, mask]))
+        info = mm.cache_info()
+        self.assertEqual((info.evictions, info.currsize), (1, 2))
+        mm.check_win(Tile.from_masks([33, 33]))
+        self.assertEqual(mm.cache_info().misses, 4)
+
+    def test_cache_zero_size(self):
+        mm = self.mahjong_manager
+        mm.enable_cache(0)
+        tiles = Tile.from_masks([33, 33])
+        self.assertTrue(mm.check_win(tiles))
+        self.assertTrue(mm.check_win(tiles))
+        info = mm.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 2, 0))
+
+    def test_cache_invalidation(self):
+        mm = self.mahjong_manager
+        tiles = Tile.from_masks([
+            33, 33, 34, 34, 35, 35, 36, 36, 66, 66, 68, 68, 99, 99
+        ])
+        self.assertFalse(mm.check_win(tiles))
+        mm.register_pattern(Pairs)
+        self.assertEqual(mm.cache_info().currsize, 0)
+        self.assertTrue(mm.check_win(tiles))
+
+        def func(deck):
+            return Tile.from_mask(33), {Tile.from_mask(33)}
+        mm.set_joker_factory(func)
+        tiles = Tile.from_masks([33, 35, 35, 36, 37])
+        self.assertFalse(mm.check_win(tiles))
+        mm.reset(self.deck, random)
+        self.assertEqual(mm.cache_info().currsize, 0)
+        self.assertTrue(mm.check_win(tiles))
+
+        # same jokers and deck keep the results
+        mm.reset(self.deck, random)
+        self.assertEqual(mm.cache_info().currsize, 1)
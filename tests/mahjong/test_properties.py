@@ -3,7 +3,7 @@ from unittest import TestCase
 from casino.mahjong import Tile
 from casino.mahjong.properties import (
     is_same_suit, is_7_pairs, is_7_pairs_with_joker, get_lack_of_joker,
-    combinations
+    combinations, unique_combinations
 )
 
 
@@ -222,3 +222,28 @@ class PropertiesTest(TestCase):
 
         tiles = Tile.from_masks([33, 33, 34, 34, 35, 35, 36, 36, 37, 37])
         self.assertEqual(len(list(combinations(tiles, 4))), 359)
+
+    def test_unique_combinations(self):
+        tiles = Tile.from_masks([33, 34, 35, 38, 38, 38, 71, 71])
+        self.assertListEqual(
+            list(unique_combinations(tiles)), list(combinations(tiles))
+        )
+
+        tiles = Tile.from_masks([33, 33, 34, 34, 35, 35, 66, 66, 67, 67])
+        combs = list(unique_combinations(tiles, 4))
+        self.assertEqual(len(list(combinations(tiles, 4))), 72)
+        self.assertEqual(len(combs), 52)
+        keys = set()
+        for comb in combs:
+            self.assertListEqual(comb['triplets'], sorted(comb['triplets']))
+            self.assertListEqual(
+                comb['sequences'], sorted(comb['sequences'])
+            )
+            keys.add(repr(sorted(comb.items())))
+        self.assertEqual(len(keys), 52)
+
+        self.assertEqual(len(list(unique_combinations(tiles, 4, 10))), 10)
+        self.assertListEqual(list(unique_combinations(tiles, 4, 0)), [])
+        self.assertListEqual(
+            list(unique_combinations(tiles, 4, 5)), combs[:5]
+        )
@@ -0,0 +1,129 @@
+from collections import Counter
+from unittest import TestCase
+
+from casino.mahjong import Tile
+from casino.mahjong.manager import MahjongManager
+from casino.mahjong.patterns import Pairs
+from casino.mahjong.deck import Deck
+from casino.mahjong.lookup import STANDARD_TILES
+from casino.mahjong.shanten import (
+    encode, get_frontier, get_shanten, get_shanten_batch, get_discards
+)
+from casino.mahjong.wall import TileWall
+
+
+class ShantenTest(TestCase):
+
+    def test_encode(self):
+        tiles = Tile.from_masks([33, 65, 99, 138, 209])
+        self.assertListEqual(
+            encode(tiles), [100000000, 100000000, 1000000, 1000000]
+        )
+
+    def test_get_frontier(self):
+        self.assertTupleEqual(get_frontier(0, 0), ((0, 0, 0),))
+        self.assertSetEqual(
+            set(get_frontier(0, 111100000)), {(1, 0, 0), (0, 2, 0)}
+        )
+        self.assertSetEqual(
+            set(get_frontier(3, 2100000)), {(0, 1, 0), (0, 0, 1)}
+        )
+
+    def test_get_shanten(self):
+        # complete
+        tiles = Tile.from_masks([
+            33, 33, 37, 37, 38, 38, 39, 39, 70, 71, 71, 72, 72, 73
+        ])
+        self.assertEqual(get_shanten(tiles), -1)
+
+        # ready
+        tiles = Tile.from_masks([
+            33, 33, 33, 34, 35, 36, 37, 38, 39, 40, 41, 41, 41
+        ])
+        self.assertEqual(get_shanten(tiles), 0)
+
+        tiles = Tile.from_masks([
+            33, 34, 36, 40, 65, 68, 71, 97, 101, 105, 138, 139, 174
+        ])
+        self.assertEqual(get_shanten(tiles), 7)
+
+        tiles = Tile.from_masks([33, 34, 35, 38, 38, 38, 71])
+        self.assertEqual(get_shanten(tiles), 0)
+
+        tiles = Tile.from_masks([33, 34])
+        self.assertEqual(get_shanten(tiles), 0)
+
+    def test_get_shanten_with_pairs(self):
+        tiles = Tile.from_masks([
+            33, 33, 34, 34, 35, 35, 36, 36, 66, 66, 68, 68, 99, 102
+        ])
+        self.assertEqual(get_shanten(tiles), 1)
+        self.assertEqual(get_shanten(tiles, True), 0)
+
+        tiles = Tile.from_masks([
+            33, 33, 34, 34, 35, 35, 36, 36, 66, 66, 68, 68, 99, 99
+        ])
+        self.assertEqual(get_shanten(tiles, True), -1)
+
+    def test_get_shanten_batch(self):
+        hands = [
+            Tile.from_masks([33, 34, 35, 38, 38, 38, 71]),
+            Tile.from_masks([33, 34]),
+            Tile.from_masks([33, 34, 35, 38, 38, 38, 71]),
+        ]
+        self.assertListEqual(get_shanten_batch(hands), [0, 0, 0])
+
+    def test_manager(self):
+        manager = MahjongManager()
+        tiles = Tile.from_masks([
+            33, 33, 34, 34, 35, 35, 36, 36, 66, 66, 68, 68, 99, 102
+        ])
+        self.assertEqual(manager.get_shanten(tiles), 1)
+        manager.register_pattern(Pairs)
+        self.assertEqual(manager.get_shanten(tiles), 0)
+        self.assertListEqual(manager.get_shanten_batch([tiles]), [0])
+
+    def test_get_discards(self):
+        tiles = Tile.from_masks([
+            33, 33, 33, 34, 35, 36, 37, 38, 39, 40, 41, 41, 41, 138
+        ])
+        live_counts = Counter(STANDARD_TILES * 4)
+        discards = get_discards(tiles, live_counts)
+        self.assertListEqual(
+            [discard.tile for discard in discards], sorted(set(tiles))
+        )
+        discard = discards[-1]
+        self.assertEqual(discard.tile, Tile.from_mask(138))
+        self.assertEqual(discard.shanten, 0)
+        self.assertListEqual(discard.tiles, Tile.from_masks(range(33, 42)))
+        self.assertEqual(discard.count, 9 * 4)
+
+        live_counts[Tile.from_mask(33)] = 0
+        discard = get_discards(tiles, live_counts)[-1]
+        self.assertListEqual(discard.tiles, Tile.from_masks(range(34, 42)))
+        self.assertEqual(discard.count, 8 * 4)
+
+        for discard in discards:
+            rest = tiles[:]
+            rest.remove(discard.tile)
+            self.assertEqual(discard.shanten, get_shanten(rest))
+
+        self.assertListEqual(get_discards(tiles[1:], live_counts), [])
+
+    def test_manager_get_discards(self):
+        manager = MahjongManager()
+        manager.deck = Deck(Tile.from_masks([33, 36, 36, 37, 138]))
+        wall = TileWall.from_mask([33, 34, 35, 36, 138])
+        wall.used_tiles['chow'].append(Tile.from_masks([35, 36, 37]))
+        # the tiles of the chow were never in the deck
+        self.assertDictEqual(
+            manager.get_live_counts(),
+            {Tile.from_mask(33): 1, Tile.from_mask(36): 2,
+             Tile.from_mask(37): 1, Tile.from_mask(138): 1}
+        )
+        discards = manager.get_discards(wall)
+        discard = discards[-1]
+        self.assertEqual(discard.tile, Tile.from_mask(138))
+        self.assertEqual(discard.shanten, 0)
+        self.assertListEqual(discard.tiles, Tile.from_masks([33, 36]))
+        self.assertEqual(discard.count, 3)
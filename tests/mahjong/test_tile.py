@@ -38,6 +38,13 @@ class TileTest(TestCase):
         tile = Tile(Tile.SUIT_BAMBOO, Tile.RANK_ONE)
         self.assertEqual(str(tile), '[BAMBOO,ONE]')
 
+    def test_tile_slots(self):
+        tile = Tile.from_mask(97)
+        self.assertFalse(hasattr(tile, '__dict__'))
+        self.assertEqual(tile.suit_name, 'BAMBOO')
+        self.assertEqual(tile.rank_name, 'ONE')
+        self.assertIs(Tile.BAMBOO_ONE, tile)
+
     def test_tile_sort_order(self):
         # 4w, 2w, 7w
         tiles = [Tile.from_mask(36), Tile.from_mask(34), Tile.from_mask(39)]
@@ -67,3 +74,33 @@ class TileTest(TestCase):
         self.assertEqual(len(tile_set), 1)
         self.assertIn(Tile.from_mask(33), tile_set)
         self.assertNotIn(Tile.from_mask(34), tile_set)
+
+    def test_try_from_mask(self):
+        self.assertIs(Tile.try_from_mask(33), Tile(1, 1))
+        self.assertIs(Tile.try_from_mask(209), Tile.from_mask(209))
+        for mask in (-1, 0, 32, 42, 256, 1000):
+            self.assertIsNone(Tile.try_from_mask(mask))
+        for tile in Tile.KIND_TILES:
+            self.assertIs(Tile.try_from_mask(tile.mask), tile)
+
+    def test_neighbor(self):
+        tile = Tile.from_mask(40)
+        self.assertIs(tile.neighbor(1), Tile.from_mask(41))
+        self.assertIs(tile.neighbor(-2), Tile.from_mask(38))
+        self.assertIsNone(tile.neighbor(2))
+        self.assertIsNone(Tile.from_mask(33).neighbor(-1))
+        self.assertIsNone(Tile.from_mask(141).neighbor(1))
+
+    def test_sequence_tables(self):
+        c1, c2, c3, c8, c9 = Tile.from_masks([33, 34, 35, 40, 41])
+        self.assertTupleEqual(Tile.SEQUENCE_PARTNERS[c1.mask], (c2, c3))
+        self.assertTupleEqual(Tile.SEQUENCE_PARTNERS[c8.mask], (c9,))
+        self.assertTupleEqual(Tile.SEQUENCE_PARTNERS[c9.mask], ())
+        self.assertTupleEqual(Tile.SEQUENCE_PARTNERS[138], ())
+
+        self.assertTupleEqual(Tile.CHOW_SHAPES[c1.mask], ((c2, c3),))
+        self.assertTupleEqual(
+            Tile.CHOW_SHAPES[c2.mask], ((c3, Tile.from_mask(36)), (c1, c3))
+        )
+        self.assertEqual(len(Tile.CHOW_SHAPES[37]), 3)
+        self.assertTupleEqual(Tile.CHOW_SHAPES[174], ())
@@ -1,14 +1,16 @@
 from unittest import TestCase
 
-from casino.mahjong import Tile, TileWall
+from casino.mahjong import Tile, TileWall, CompactTileWall
 from casino.mahjong.manager import MahjongManager
 
 
 class MahjongTest(TestCase):
 
+    wall_class = TileWall
+
     def setUp(self):
         # 1w1w1w5w 1t2t4t7t 2T2T3T4T7T
-        self.wall = TileWall.from_mask([
+        self.wall = self.wall_class.from_mask([
             33, 33, 33, 37, 65, 66, 68, 71, 98, 98, 99, 100, 103
         ])
         self.mahjong_manager = MahjongManager()
@@ -29,6 +31,10 @@ class MahjongTest(TestCase):
             33, 33, 33, 37, 65, 66, 68, 71, 98, 98, 99, 100, 103
         ])
 
+        # the callers may keep their own attributes on a wall
+        wall.seat = 2
+        self.assertEqual(wall.seat, 2)
+
     def test_wall_add_tile(self):
         wall = self.wall
         tile = Tile.from_mask(35)
@@ -59,3 +65,43 @@ class MahjongTest(TestCase):
         self.assertEqual(wall.total_count, 11)
         self.assertEqual(wall.available_count, 11)
         self.assertEqual(wall.suits[1], 2)
+
+    def test_wall_count_tile(self):
+        wall = self.wall
+        self.assertEqual(wall.count_tile(Tile.from_mask(33)), 3)
+        self.assertEqual(wall.count_tile(Tile.from_mask(34)), 0)
+
+        wall.take_tiles(Tile.from_mask(33), 2)
+        self.assertEqual(wall.count_tile(Tile.from_mask(33)), 1)
+        self.assertEqual(wall.available_count, 11)
+        self.assertEqual(wall.suits[1], 4)
+
+        with self.assertRaises(ValueError):
+            wall.take_tiles(Tile.from_mask(34))
+
+    def test_wall_iter_counts(self):
+        self.assertListEqual(list(self.wall.iter_counts()), [
+            (Tile.from_mask(33), 3), (Tile.from_mask(37), 1),
+            (Tile.from_mask(65), 1), (Tile.from_mask(66), 1),
+            (Tile.from_mask(68), 1), (Tile.from_mask(71), 1),
+            (Tile.from_mask(98), 2), (Tile.from_mask(99), 1),
+            (Tile.from_mask(100), 1), (Tile.from_mask(103), 1),
+        ])
+
+
+class CompactMahjongTest(MahjongTest):
+
+    wall_class = CompactTileWall
+
+    def test_counts(self):
+        wall = self.wall
+        self.assertEqual(len(wall.counts), 43)
+        self.assertEqual(sum(wall.counts), 13)
+        self.assertEqual(wall.counts[0], 3)
+
+        tiles = wall.available_tiles
+        self.assertIs(wall.available_tiles, tiles)
+        wall.add_tile(Tile.from_mask(25))
+        self.assertIsNot(wall.available_tiles, tiles)
+        self.assertEqual(wall.available_tiles[0], Tile.from_mask(25))
+        self.assertEqual(wall.counts[42], 1)
@@ -104,3 +104,16 @@ class CardTest(TestCase):
 
         tile_set = set([d3, h4])
         self.assertEqual(len(tile_set), 2)
+
+    def test_try_from_mask(self):
+        self.assertIs(Card.try_from_mask(d3.mask), d3)
+        self.assertIsNone(Card.try_from_mask(102))
+        self.assertIsNone(Card.try_from_mask(-1))
+        self.assertIsNone(Card.try_from_mask(10000))
+
+    def test_neighbor(self):
+        self.assertIs(d3.neighbor(1), d4)
+        self.assertIs(d4.neighbor(-1), d3)
+        self.assertIsNone(d3.neighbor(-1))
+        self.assertIs(Card.DIAMOND_ACE.neighbor(2), d2)
+        self.assertIsNone(Card.DIAMOND_ACE.neighbor(1))
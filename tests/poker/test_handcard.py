@@ -1,6 +1,8 @@
 from unittest import TestCase
 
-from casino.poker import Card, HandCard
+from casino.poker import Card, HandCard, PokerManager
+from casino.poker.patterns import Pair, Single
+from casino.poker.properties import get_rank_word
 
 d3 = Card.DIAMOND_THREE
 d4 = Card.DIAMOND_FOUR
@@ -92,3 +94,44 @@ class HandCardTest(TestCase):
 
         handcard[0] = d4
         self.assertIsNot(handcard[0], card)
+
+    def test_word(self):
+        handcard = self.handcard
+        self.assertEqual(handcard.word, get_rank_word(handcard.cards))
+        handcard.add_cards([dq, d3])
+        handcard.remove_cards([d5, dk])
+        handcard.remove_card(d3)
+        handcard.add_card(d8)
+        self.assertEqual(handcard.word, get_rank_word(handcard.cards))
+        handcard[0] = dk
+        self.assertEqual(handcard.word, get_rank_word(handcard.cards))
+
+    def test_word_of_changed_cards(self):
+        manager = PokerManager()
+        manager.register_patterns([Single])
+        handcard = self.handcard
+        handcard.cards.append(dq)
+        self.assertEqual(handcard.word, get_rank_word(handcard.cards))
+        handcard.cards.remove(d3)
+        self.assertEqual(handcard.word, get_rank_word(handcard.cards))
+        handcard.add_card(d3)
+        self.assertEqual(handcard.word, get_rank_word(handcard.cards))
+        handcard.cards = [d3, d4]
+        self.assertEqual(handcard.word, get_rank_word([d3, d4]))
+        self.assertEqual(len(manager.get_moves(handcard)), 2)
+
+    def test_moves_of_replaced_card(self):
+        manager = PokerManager()
+        manager.register_patterns([Single, Pair])
+        handcard = HandCard([d3, Card.CLUB_THREE, Card.SPADE_KING])
+        self.assertEqual(len(manager.get_moves(handcard)), 3)
+        # the size of the cards is kept
+        handcard.cards[0] = d5
+        handcard.cards.sort()
+        self.assertEqual(handcard.word, get_rank_word(handcard.cards))
+        moves = manager.get_moves(handcard)
+        self.assertListEqual(
+            [list(move.cards) for move in moves],
+            [[Card.CLUB_THREE], [d5], [Card.SPADE_KING]]
+        )
+        self.assertTrue(all(isinstance(move, Single) for move in moves))
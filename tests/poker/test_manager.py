@@ -1,10 +1,12 @@
 import random
 from unittest import TestCase
 
-from casino.poker import Card
+from casino.poker import Card, HandCard
 from casino.poker.deck import Deck
 from casino.poker.manager import PokerManager
-from casino.poker.patterns import Pair, Triplet
+from casino.poker.patterns import (
+    BasePattern, Single, Pair, Triplet, Pairs, Triplets
+)
 
 d3 = Card.DIAMOND_THREE
 d4 = Card.DIAMOND_FOUR
@@ -47,3 +49,86 @@ class MahjongTest(TestCase):
         self.assertIsNone(manager.get_pattern(cards))
 
         self.assertIsNone(manager.get_pattern([]))
+
+    def test_get_pattern_classified(self):
+        manager = self.poker_manager
+        manager.register_patterns([Single, Pair, Triplet, Pairs, Triplets])
+        self.assertIsNotNone(manager.classified_patterns)
+
+        pattern = manager.get_pattern([d3, d3, d4, d4, d5, d5])
+        self.assertIsInstance(pattern, Pairs)
+        self.assertEqual(pattern.size, 3)
+        self.assertIs(pattern.max_card, d5)
+        self.assertListEqual(pattern.properties['pair'], [
+            [d3, d3], [d4, d4], [d5, d5]
+        ])
+        self.assertIsNone(manager.get_pattern([d3, d4]))
+        self.assertIsNone(manager.get_pattern([]))
+
+        special = Card(Card.SUIT_SPECIAL, Card.RANK_THREE)
+        self.assertIsInstance(manager.get_pattern([special]), Single)
+
+    def test_get_pattern_custom(self):
+
+        class Bomb(BasePattern):
+
+            POINT = 100
+
+            @classmethod
+            def validate(cls, properties):
+                cards = properties['cards']
+                return len(cards) == 4 and len(properties['multiple']) == 1
+
+        manager = self.poker_manager
+        manager.register_patterns([Pair, Bomb])
+        self.assertIsNone(manager.classified_patterns)
+        self.assertIsInstance(manager.get_pattern([d3] * 4), Bomb)
+        self.assertIsInstance(manager.get_pattern([d3] * 2), Pair)
+
+    def test_get_moves(self):
+        manager = self.poker_manager
+        manager.register_patterns([Single, Pair, Triplet, Pairs, Triplets])
+        c3, c4, c5 = Card.CLUB_THREE, Card.CLUB_FOUR, Card.CLUB_FIVE
+        h3, h4 = Card.HEART_THREE, Card.HEART_FOUR
+        handcard = HandCard([d3, c3, h3, d4, c4, h4, d5, c5])
+
+        moves = [
+            (move.__class__, move.size, move.max_card)
+            for move in manager.get_moves(handcard)
+        ]
+        self.assertListEqual(moves, [
+            (Single, 1, d3), (Pair, 1, c3), (Triplet, 1, h3),
+            (Single, 1, d4), (Pair, 1, c4), (Triplet, 1, h4),
+            (Triplets, 2, h4),
+            (Single, 1, d5), (Pair, 1, c5), (Pairs, 3, c5),
+        ])
+        pairs = manager.get_moves(handcard)[-1]
+        self.assertListEqual(list(pairs.cards), [d3, c3, d4, c4, d5, c5])
+
+        last = manager.get_pattern([Card.SPADE_THREE, Card.SPADE_THREE])
+        self.assertListEqual(
+            [move.max_card for move in manager.get_moves(handcard, last)],
+            [c4, c5]
+        )
+        last = manager.get_pattern(
+            [d4, c4, d5, c5, Card.DIAMOND_SIX, Card.CLUB_SIX]
+        )
+        self.assertListEqual(manager.get_moves(handcard, last), [])
+
+        handcard.remove_cards([d5, c5])
+        self.assertEqual(len(manager.get_moves(handcard)), 7)
+        handcard.add_cards([d5, c5])
+        manager.get_moves(handcard)
+        self.assertEqual(manager.move_cache.info().misses, 2)
+
+    def test_get_moves_registered(self):
+        manager = self.poker_manager
+        manager.register_patterns([Pair])
+        handcard = HandCard([d3, d3, d4])
+        self.assertListEqual(
+            [move.__class__ for move in manager.get_moves(handcard)], [Pair]
+        )
+        last = manager.get_pattern([d4, d4])
+        self.assertListEqual(manager.get_moves(handcard, last), [])
+        last = Triplet.from_cards([d3, d3, d3], 1, d3)
+        self.assertListEqual(manager.get_moves(handcard, last), [])
@@ -1,7 +1,9 @@
 from unittest import TestCase
 
 from casino.poker import Card
-from casino.poker.patterns import Pair, Pairs, Triplet, Triplets
+from casino.poker.patterns import (
+    Single, Pair, Pairs, Triplet, Triplets, get_key, sort_patterns
+)
 from casino.poker.properties import get_properties
 
 d3 = Card.DIAMOND_THREE
@@ -268,3 +270,90 @@ class PatternTest(TestCase):
                                  d4, force=True)),
             [d4, d4, c4, d5, d5, c5]
         )
+
+    def test_filter_large_hand(self):
+        cards = sorted(
+            card for card in Card.NORMAL_CARDS if card.suit < Card.SUIT_SPADE
+        )[:21]
+        properties = get_properties(cards)
+
+        combs = Pairs.filter(properties, d4, 5, force=True)
+        self.assertIsInstance(combs, tuple)
+        self.assertListEqual(
+            [card.rank for card in combs], [3, 3, 4, 4, 5, 5, 6, 6, 7, 7]
+        )
+        self.assertListEqual(list(combs[:2]), [d3, c3])
+        self.assertTupleEqual(Pairs.filter(properties, d4, 5), ())
+
+        combs = Triplets.filter(properties, d5, 4)
+        self.assertListEqual(
+            [card.rank for card in combs],
+            [3] * 3 + [4] * 3 + [5] * 3 + [6] * 3
+        )
+        self.assertTupleEqual(Triplets.filter(properties, dj, 4), ())
+        self.assertTupleEqual(Pairs.filter(properties, dq, 3, force=True), ())
+
+    def test_key(self):
+        self.assertLess(get_key(-1, 20, 99), get_key(0, 1, 3))
+        self.assertLess(get_key(30, 3, 14), get_key(30, 4, 3))
+        self.assertLess(get_key(30, 3, 5), get_key(30, 3, 6))
+        self.assertLess(get_key(30, 255, 255), get_key(1 << 70, 0, 0))
+        for args in ((1.5, 1, 3), (0, 256, 3), (0, 1, -1), (0, 1, 256)):
+            self.assertRaises(ValueError, get_key, *args)
+
+        pairs = Pairs(get_properties([d3, d3, d4, d4, d5, d5]))
+        self.assertEqual(pairs.size, 3)
+        self.assertEqual(pairs.key, get_key(Pairs.POINT, 3, d5.rank))
+        self.assertEqual(
+            pairs, Pairs.from_cards([c3, c3, c4, c4, c5, c5], 3, c5)
+        )
+
+    def test_key_of_subclass(self):
+        # the size set after BasePattern.__init__ is in the key
+        class Sequence(Single):
+
+            POINT = 10
+
+            def __init__(self, properties):
+                super(Sequence, self).__init__(properties)
+                self.size = len(self.cards)
+
+        short = Sequence(get_properties([d3, d4, d5, d6]))
+        longer = Sequence(get_properties([d3, d4, d5, d6, dj]))
+        self.assertEqual(short.key, get_key(10, 4, d6.rank))
+        self.assertLess(short, longer)
+        self.assertGreater(longer, short)
+        self.assertNotEqual(short, Sequence.from_cards([d6], 1, d6))
+
+        short.size = 5
+        self.assertEqual(short.key, get_key(10, 5, d6.rank))
+
+    def test_properties_of_subclass(self):
+        # a subclass may set properties and size in its own __init__
+        class Sequence(Single):
+
+            POINT = 10
+
+            def __init__(self, properties):
+                super(Sequence, self).__init__(properties)
+                self.properties = get_properties(self.cards[1:])
+                self.size = len(self.properties['cards'])
+
+        pattern = Sequence(get_properties([d3, d4, d5, d6]))
+        self.assertListEqual(pattern.properties['cards'], [d4, d5, d6])
+        self.assertEqual(pattern.key, get_key(10, 3, d6.rank))
+
+    def test_sort_patterns(self):
+        patterns = [
+            Triplets(get_properties([d3, d3, d3, d4, d4, d4])),
+            Single(get_properties([d2])),
+            Pairs(get_properties([d4, d4, d5, d5, d6, d6])),
+            Pair(get_properties([d4, c4])),
+            Single(get_properties([dj])),
+            Pairs(get_properties([d3, d3, d4, d4, d5, d5, d6, d6])),
+        ]
+        self.assertListEqual(sort_patterns(patterns), sorted(patterns))
+        self.assertListEqual(
+            [pattern.max_card for pattern in sort_patterns(patterns, True)],
+            [d4, d6, d6, c4, d2, dj]
+        )
@@ -3,7 +3,7 @@ from unittest import TestCase
 from casino.poker import Card
 from casino.poker.properties import (
     is_same_suit, is_same_rank, is_rank_one_gap, is_rank_consecutive,
-    get_properties,
+    get_properties, encode, classify, SINGLE, PAIR, TRIPLET, PAIRS, TRIPLETS,
 )
 
 d3 = Card.DIAMOND_THREE
@@ -99,3 +99,34 @@ class PropertiesTest(TestCase):
              'single': [[d6]], 'pair': [[d5, d5]],
              'triplet': [], 'multiple': [[d3, d3, d3, c3, c3]]}
         )
+
+    def test_encode(self):
+        self.assertTupleEqual(encode([]), (0, 0))
+        hand, word = encode([d3, c3, d3, d4])
+        self.assertEqual(word, 0x13 << 12)
+        self.assertEqual(bin(hand).count('1'), 3)
+        special = Card(Card.SUIT_SPECIAL, Card.RANK_THREE)
+        self.assertIsNone(encode([special]))
+
+    def test_classify(self):
+        self.assertTupleEqual(classify([]), (None, 0, None))
+        self.assertTupleEqual(classify([d4]), (SINGLE, 1, d4))
+        self.assertTupleEqual(classify([c3, d3]), (PAIR, 1, c3))
+        self.assertTupleEqual(classify([d3, d4]), (None, 1, d4))
+        self.assertTupleEqual(classify([d3, c3, d3]), (TRIPLET, 1, c3))
+        self.assertTupleEqual(
+            classify([d3, c3, d4, c4, d5, c5]), (PAIRS, 3, c5)
+        )
+        self.assertTupleEqual(
+            classify([d3, c3, d3, d4, c4, d4]), (TRIPLETS, 2, c4)
+        )
+        self.assertTupleEqual(
+            classify([d3, c3, d4, c4, d6, d6]), (None, 0, d6)
+        )
+        self.assertTupleEqual(
+            classify([d3, d3, d3, d3, d4, d4]), (None, 0, d4)
+        )
+        # 16 cards of a rank carry into the next rank
+        self.assertEqual(classify([d3] * 16)[0], None)
+        special = Card(Card.SUIT_SPECIAL, Card.RANK_THREE)
+        self.assertIsNone(classify([d3, special]))
@@ -0,0 +1,94 @@
+from unittest import TestCase
+
+from casino.poker import Card, HandCard, PokerManager
+from casino.poker.patterns import Single, Pair, Triplet, Pairs, Triplets
+from casino.poker.solver import Solver, WIN, LOSS
+
+d3 = Card.DIAMOND_THREE
+d4 = Card.DIAMOND_FOUR
+d5 = Card.DIAMOND_FIVE
+d9 = Card.DIAMOND_NINE
+c3 = Card.CLUB_THREE
+c4 = Card.CLUB_FOUR
+c9 = Card.CLUB_NINE
+dk = Card.DIAMOND_KING
+da = Card.DIAMOND_ACE
+d2 = Card.DIAMOND_TWO
+
+
+class SolverTest(TestCase):
+
+    def setUp(self):
+        self.manager = PokerManager()
+        self.manager.register_patterns(
+            [Single, Pair, Triplet, Pairs, Triplets]
+        )
+        self.solver = Solver(self.manager)
+
+    def test_play_out(self):
+        result = self.solver.solve([HandCard([d3, c3]), HandCard([d2])])
+        self.assertEqual(result.value, WIN)
+        self.assertIsInstance(result.move, Pair)
+        self.assertListEqual(list(result.move.cards), [d3, c3])
+        self.assertTrue(result.complete)
+
+    def test_lead_order(self):
+        # leading a single 3 loses to the king
+        hands = [HandCard([d3, c3, da]), HandCard([dk])]
+        result = self.solver.solve(hands)
+        self.assertEqual(result.value, WIN)
+        self.assertFalse(
+            isinstance(result.move, Single) and result.move.max_card is d3
+        )
+
+    def test_loss(self):
+        hands = [HandCard([d3, d5]), HandCard([d2])]
+        result = self.solver.solve(hands)
+        self.assertEqual(result.value, LOSS)
+
+    def test_last(self):
+        hands = [HandCard([d3, d9, c9]), HandCard([d4, c4])]
+        last = self.manager.get_pattern([d5])
+        result = self.solver.solve(hands, 0, last, 1)
+        self.assertEqual(result.value, WIN)
+        self.assertIs(result.move.max_card, d9)
+
+        last = self.manager.get_pattern([d2])
+        result = self.solver.solve(hands, 0, last, 1)
+        self.assertIsNone(result.move)
+        self.assertEqual(result.value, LOSS)
+
+    def test_teams(self):
+        hands = [HandCard([d3, d5]), HandCard([d4]), HandCard([d2, dk])]
+        self.assertEqual(self.solver.solve(hands).value, LOSS)
+        self.solver.clear()
+        result = self.solver.solve(hands, teams=[0, 0, 1])
+        self.assertEqual(result.value, WIN)
+
+    def test_reuse(self):
+        # one solver for the players of both sides
+        hands = [
+            HandCard([Card.DIAMOND_SEVEN, Card.HEART_TWO, Card.SPADE_QUEEN]),
+            HandCard([Card.DIAMOND_QUEEN, Card.SPADE_TWO, Card.CLUB_TEN,
+                      Card.HEART_THREE]),
+        ]
+        self.assertEqual(Solver(self.manager).solve(hands, 1).value, LOSS)
+        self.solver.solve(hands, 0)
+        self.assertEqual(self.solver.solve(hands, 1).value, LOSS)
+        self.solver.solve(hands, 1, teams=[0, 0])
+        self.assertEqual(self.solver.solve(hands, 1).value, LOSS)
+
+    def test_budget(self):
+        cards = sorted(Card.NORMAL_CARDS)[:30]
+        hands = [HandCard(cards[idx::3]) for idx in range(3)]
+        solver = Solver(self.manager, max_nodes=50)
+        result = solver.solve(hands)
+        self.assertFalse(result.complete)
+        self.assertIsNone(result.value)
+        self.assertIsNotNone(result.move)
+        self.assertLessEqual(result.nodes, 51)
+        self.assertGreater(result.nodes_per_sec, 0)
+
+        solver = Solver(self.manager, time_limit=0.0)
+        result = solver.solve(hands)
+        self.assertFalse(result.complete)
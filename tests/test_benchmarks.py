@@ -0,0 +1,65 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from benchmarks import get_benchmarks, run_benchmark
+from benchmarks.core import (
+    Result, compare, percentile, load_results, save_results
+)
+
+
+class BenchmarksTest(TestCase):
+
+    def test_get_benchmarks(self):
+        names = get_benchmarks()
+        for name in ('mahjong.check_win', 'poker.get_pattern',
+                     'poker.filter.pairs', 'wordplate.check_chow'):
+            self.assertIn(name, names)
+        self.assertListEqual(
+            get_benchmarks(['wordplate']),
+            [name for name in names if 'wordplate' in name]
+        )
+        self.assertIn('import.wordplate', get_benchmarks(['wordplate']))
+
+    def test_percentile(self):
+        values = list(range(101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_run_benchmark(self):
+        for name in ('mahjong.check_win.joker', 'poker.filter.triplets',
+                     'wordplate.check_win'):
+            result = run_benchmark(name, scale=0.01, repeat=1)
+            self.assertEqual(result.name, name)
+            self.assertGreater(result.count, 0)
+            self.assertGreater(result.ops_per_sec, 0)
+            self.assertLessEqual(result.p50, result.p99)
+
+    def test_footprint(self):
+        result = run_benchmark('poker.table', scale=0.05, repeat=1)
+        self.assertGreater(result.footprint, 0)
+        result = run_benchmark(
+            'poker.table', scale=0.05, repeat=1, memory=False
+        )
+        self.assertIsNone(result.footprint)
+
+    def test_compare(self):
+        results = [Result('a', [0.1, 0.1]), Result('b', [0.1, 0.1])]
+        path = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(path, 'baseline.json')
+            save_results(results, filename)
+            baseline = load_results(filename)
+        finally:
+            shutil.rmtree(path)
+        self.assertListEqual(list(baseline), ['a', 'b'])
+        self.assertEqual(baseline['a'].ops_per_sec, results[0].ops_per_sec)
+
+        baseline['b'].ops_per_sec *= 2
+        current = results + [Result('c', [0.1])]
+        lines, regressions = compare(current, baseline)
+        self.assertListEqual(regressions, ['b'])
+        self.assertEqual(len(lines), 3)
+        self.assertIn('new', lines[2])
@@ -0,0 +1,114 @@
+import random
+from unittest import TestCase, skipIf
+
+from casino import dealer
+from casino.dealer import Dealer, get_buffer
+from casino.mahjong import Tile, Deck, MahjongManager
+from casino.poker import Card, Deck as PokerDeck, PokerManager
+from casino.wordplate import Card as WordplateCard
+
+
+def new_deck():
+    return Deck(Tile.create_tiles())
+
+
+class DealerTest(TestCase):
+
+    def test_get_buffer(self):
+        deck = new_deck()
+        self.assertIs(get_buffer(deck), deck.tiles)
+        deck = PokerDeck(Card.create_cards())
+        self.assertIs(get_buffer(deck), deck.cards)
+        cards = WordplateCard.NORMAL_CARDS * 4
+        self.assertIs(get_buffer(cards), cards)
+
+    def test_shuffle_algorithm(self):
+        # a dealt deck is the deck shuffled by manager.reset from its seed
+        deals = Dealer(new_deck, ran=random.Random(3)).deal(1, [13, 13])
+        deck = new_deck()
+        MahjongManager().reset(deck, random.Random(deals[0].seed))
+        tiles = deals[0].hands[0] + deals[0].hands[1] + deals[0].deck.tiles
+        self.assertListEqual(tiles, deck.tiles)
+
+        manager = MahjongManager()
+        manager.reset(deals[0].deck, random, shuffle=False)
+        self.assertIs(manager.deck, deals[0].deck)
+        self.assertListEqual(deals[0].deck.tiles, deck.tiles[26:])
+
+        calls = []
+        shuffler = Dealer(
+            new_deck, lambda tiles, ran: calls.append(len(tiles)),
+            batch_size=2
+        )
+        shuffler.deal(1)
+        self.assertListEqual(calls, [136, 136])
+
+    def test_deal(self):
+        shuffler = Dealer(new_deck, ran=random.Random(5), batch_size=4)
+        shuffler.preallocate(2)
+        deals = shuffler.deal(3, [13] * 4)
+        self.assertEqual(len(deals), 3)
+        for deck, hands, _ in deals:
+            self.assertEqual(len(deck), 136 - 52)
+            self.assertListEqual([len(hand) for hand in hands], [13] * 4)
+            self.assertListEqual(
+                sorted(sum(hands, deck.tiles)), sorted(Tile.create_tiles())
+            )
+        self.assertNotEqual(deals[0].hands, deals[1].hands)
+        info = shuffler.info()
+        self.assertEqual(info.decks, 4)
+        self.assertEqual(info.ready, 1)
+        self.assertEqual(info.free, 0)
+        self.assertGreater(info.decks_per_sec, 0)
+
+        # the released decks are shuffled again from the full deck
+        for deal in deals:
+            shuffler.release(deal.deck)
+        self.assertEqual(shuffler.info().free, 3)
+        deals = shuffler.deal(4)
+        self.assertEqual(shuffler.info().free, 0)
+        self.assertTrue(all(len(deal.deck) == 136 for deal in deals))
+
+    def test_seeds(self):
+        # a deal is replayed from its seed whatever the order of the deals
+        shuffler = Dealer(new_deck, ran=random.Random(9), batch_size=4)
+        deals = shuffler.deal(3, [13])
+        self.assertEqual(len(set(deal.seed for deal in deals)), 3)
+        other = Dealer(new_deck, ran=random.Random(1))
+        other.deal(2)
+        for deal in deals[::-1]:
+            replay, = other.deal(1, [13], [deal.seed])
+            self.assertEqual(replay.seed, deal.seed)
+            self.assertListEqual(replay.hands, deal.hands)
+            self.assertListEqual(replay.deck.tiles, deal.deck.tiles)
+
+        deck = new_deck()
+        MahjongManager().reset(deck, random.Random(42))
+        replay, = shuffler.deal(1, seeds=[42])
+        self.assertListEqual(replay.deck.tiles, deck.tiles)
+        self.assertEqual(shuffler.info().decks, 5)
+        self.assertRaises(ValueError, shuffler.deal, 2, (), [42])
+
+    def test_poker(self):
+        shuffler = Dealer(
+            lambda: PokerDeck(Card.create_cards()), ran=random.Random(7)
+        )
+        deal = shuffler.deal(1, [17, 17, 17])[0]
+        self.assertEqual(len(deal.deck), 3)
+        manager = PokerManager()
+        manager.reset(deal.deck, random, shuffle=False)
+        self.assertEqual(manager.left_cards, 3)
+
+    @skipIf(dealer.numpy is None, 'numpy is not installed')
+    def test_numpy(self):
+        generator = dealer.numpy.random.default_rng(0)
+        shuffler = Dealer(new_deck, generator=generator, batch_size=8)
+        deals = shuffler.deal(8, [13])
+        self.assertEqual(shuffler.info().decks, 8)
+        orders = set()
+        for deck, hands, seed in deals:
+            self.assertIsNone(seed)
+            tiles = hands[0] + deck.tiles
+            self.assertListEqual(sorted(tiles), sorted(Tile.create_tiles()))
+            orders.add(tuple(tile.mask for tile in tiles))
+        self.assertEqual(len(orders), 8)
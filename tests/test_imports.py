@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase, skipIf
+
+import casino
+from benchmarks.imports import fresh_import
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_games(name):
+    code = (
+        'import sys; import {0}; '
+        'print(",".join(sorted(key for key in sys.modules '
+        'if key.count(".") == 1 and key.startswith("casino."))))'
+    ).format(name)
+    output = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT)
+    return output.decode().strip().split(',')
+
+
+@skipIf(sys.version_info < (3, 7), 'module __getattr__ needs PEP 562')
+class ImportsTest(TestCase):
+
+    def test_lazy_games(self):
+        self.assertListEqual(
+            loaded_games('casino.poker'),
+            ['casino.core', 'casino.exceptions', 'casino.poker',
+             'casino.utils']
+        )
+        self.assertNotIn('casino.poker', loaded_games('casino.mahjong'))
+        self.assertNotIn('casino.mahjong', loaded_games('casino.wordplate'))
+
+    def test_fresh_import(self):
+        loaded = fresh_import('casino')
+        self.assertListEqual(loaded, ['casino'])
+        self.assertIs(sys.modules['casino'], casino)
+
+    def test_getattr(self):
+        self.assertIs(casino.poker, sys.modules['casino.poker'])
+        self.assertIn('wordplate', dir(casino))
+        with self.assertRaises(AttributeError):
+            casino.blackjack
@@ -0,0 +1,33 @@
+import random
+from unittest import TestCase
+
+from casino.utils import (
+    random_shuffle_algorithm, inplace_random_shuffle_algorithm
+)
+
+
+class ShuffleTest(TestCase):
+
+    def test_same_permutation(self):
+        for count in (0, 1, 2, 3, 4, 54, 80, 108, 136, 144):
+            for seed in range(3):
+                objs = list(range(count))
+                random_shuffle_algorithm(objs, random.Random(seed))
+                inplace_objs = list(range(count))
+                inplace_random_shuffle_algorithm(
+                    inplace_objs, random.Random(seed)
+                )
+                self.assertListEqual(inplace_objs, objs)
+
+    def test_inplace(self):
+        objs = list(range(136))
+        origin = objs
+        ran = random.Random(0)
+        inplace_random_shuffle_algorithm(objs, ran)
+        self.assertIs(objs, origin)
+        self.assertListEqual(sorted(objs), list(range(136)))
+
+        # the replay goes on with the same random state
+        other = random.Random(0)
+        random_shuffle_algorithm(list(range(136)), other)
+        self.assertEqual(ran.random(), other.random())
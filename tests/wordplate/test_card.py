@@ -83,3 +83,37 @@ class CardTest(TestCase):
 
         tile_set = set([l3, l4])
         self.assertEqual(len(tile_set), 2)
+
+    def test_try_from_mask(self):
+        self.assertIs(Card.try_from_mask(l3.mask), l3)
+        self.assertIsNone(Card.try_from_mask(111))
+        self.assertIsNone(Card.try_from_mask(-1))
+
+    def test_neighbor(self):
+        self.assertIs(l3.neighbor(1), l4)
+        self.assertIs(l3.neighbor(-1), l2)
+        self.assertIsNone(Card.LOWER_TEN.neighbor(1))
+        self.assertIsNone(Card.LOWER_ONE.neighbor(-1))
+
+    def test_tables(self):
+        self.assertIs(~l3, Card.UPPER_THREE)
+        self.assertIs(~Card.UPPER_THREE, l3)
+        self.assertTupleEqual(
+            Card.SEQUENCES[l3.mask],
+            ((Card.LOWER_ONE, l2, l3), (l2, l3, l4),
+             (l3, l4, Card.LOWER_FIVE))
+        )
+        self.assertTupleEqual(
+            Card.SEQUENCES[Card.LOWER_ONE.mask],
+            ((Card.LOWER_ONE, l2, l3),)
+        )
+        self.assertTupleEqual(
+            Card.PARTIAL_SEQUENCES[Card.LOWER_TEN.mask],
+            ((Card.LOWER_EIGHT, Card.LOWER_TEN),
+             (Card.LOWER_NINE, Card.LOWER_TEN))
+        )
+        comb, partials = Card.SEQUENCES_2_7_10[l2.mask]
+        self.assertTupleEqual(comb, (l2, Card.LOWER_SEVEN, Card.LOWER_TEN))
+        self.assertEqual(len(partials), 2)
+        self.assertIsNone(Card.SEQUENCES_2_7_10[l3.mask])
+        self.assertIsNotNone(Card.SEQUENCES_1_5_10[Card.LOWER_ONE.mask])
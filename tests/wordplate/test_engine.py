@@ -0,0 +1,102 @@
+import random
+from collections import Counter
+from unittest import TestCase
+
+from casino.wordplate.card import Card
+from casino.wordplate.engine import encode, get_engine, settle
+from casino.wordplate.manager import Manager
+from casino.wordplate.properties import filter_sequence_1_5_10
+from casino.wordplate.properties import filter_triplet
+
+l1 = Card.LOWER_ONE
+l2 = Card.LOWER_TWO
+l3 = Card.LOWER_THREE
+l5 = Card.LOWER_FIVE
+l10 = Card.LOWER_TEN
+u1 = Card.UPPER_ONE
+
+
+def make_hands(ran, size):
+    wall = Card.NORMAL_CARDS * 4
+    return [
+        sorted(ran.sample(wall, ran.randint(1, 14))) for _ in range(size)
+    ]
+
+
+class EngineTest(TestCase):
+
+    def setUp(self):
+        self.manager = Manager()
+
+    def test_encode(self):
+        self.assertEqual(encode([]), 0)
+        self.assertEqual(encode([l1, l1, l2]), encode([l2, l1, l1]))
+        self.assertNotEqual(encode([l1, l1, l2]), encode([l1, l2, l2]))
+        self.assertIsNone(encode([l2, l1], True))
+        self.assertIsNone(encode([l1] * 8))
+        self.assertIsNotNone(encode([l1] * 7))
+
+    def test_settle(self):
+        cards = [l1, l2, l2, l3]
+        self.assertEqual(settle(cards, Counter()), (encode(cards), 4, False))
+        self.assertEqual(
+            settle([l1, l2, l2, l2, l3], Counter()),
+            (encode([l1, l3]), 2, True)
+        )
+        self.assertEqual(
+            settle(cards, Counter({l2: 3})), (encode([l1, l3]), 2, True)
+        )
+        self.assertEqual(
+            settle(cards, Counter({l5: 3})), (encode(cards), 4, False)
+        )
+        self.assertIsNone(settle(cards, Counter({l5: 2})))
+
+    def test_get_engine(self):
+        chow_filter = self.manager.chow_filter
+        engine = get_engine(chow_filter)
+        self.assertIs(get_engine(list(chow_filter)), engine)
+        self.assertIsNot(
+            get_engine(chow_filter + [filter_sequence_1_5_10]), engine
+        )
+        self.assertIsNone(get_engine(chow_filter + [lambda *args: ()]))
+
+    def test_combinations(self):
+        manager = self.manager
+        cards = [l1, l2, l3, l3, l3]
+        self.assertListEqual(
+            list(manager.combinations(cards)),
+            list(manager._combinations(cards))
+        )
+        self.assertTrue(manager.has_combinations(cards))
+        # the lists of a combination are not shared with the others
+        comb = next(manager.combinations(cards))
+        comb['sequences'][0].append(u1)
+        self.assertNotIn(u1, next(manager.combinations(cards))['sequences'][0])
+
+    def test_filters(self):
+        manager = self.manager
+        cards = [l1, l5, l10]
+        self.assertFalse(manager.has_combinations(cards))
+        manager.chow_filter.append(filter_sequence_1_5_10)
+        self.assertTrue(manager.has_combinations(cards))
+        # a triplet of chow_filter is a sequence of the reference
+        manager.chow_filter.append(filter_triplet)
+        cards = [l1, l1, l1, l2, l2]
+        self.assertListEqual(
+            list(manager.combinations(cards)),
+            list(manager._combinations(cards))
+        )
+
+    def test_random_hands(self):
+        manager = self.manager
+        manager.chow_filter.append(filter_sequence_1_5_10)
+        for cards in make_hands(random.Random(7), 500):
+            for joker_count in (0, 1):
+                expected = list(manager._combinations(cards, joker_count))
+                self.assertListEqual(
+                    list(manager.combinations(cards, joker_count)), expected
+                )
+                self.assertEqual(
+                    manager.has_combinations(cards[::-1], joker_count),
+                    bool(expected)
+                )
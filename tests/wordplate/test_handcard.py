@@ -94,3 +94,20 @@ class HandCardTest(TestCase):
         self.assertEqual(handcard.cards.count(card), 0)
         self.assertIn(card, handcard.fixed_cards)
         self.assertEqual(handcard.fixed_cards[card], 3)
+
+    def test_clone(self):
+        handcard = self.handcard
+        handcard.used_cards['pong'].append([u8, u8, u8])
+        ins = handcard.clone()
+        self.assertListEqual(ins.cards, handcard.cards)
+        self.assertEqual(ins.fixed_cards, handcard.fixed_cards)
+        self.assertDictEqual(ins.used_cards, handcard.used_cards)
+
+        ins.add_card(l1)
+        ins.fixed_cards.pop(l7)
+        ins.used_cards['pong'].pop()
+        ins.used_cards['chow'].append([l1, l2, l3])
+        self.assertEqual(handcard.cards.count(l1), 1)
+        self.assertEqual(handcard.fixed_cards[l7], 3)
+        self.assertListEqual(handcard.used_cards['pong'], [[u8, u8, u8]])
+        self.assertListEqual(handcard.used_cards['chow'], [])
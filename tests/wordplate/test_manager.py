@@ -12,10 +12,17 @@ l2 = Card.LOWER_TWO
 l3 = Card.LOWER_THREE
 l4 = Card.LOWER_FOUR
 l5 = Card.LOWER_FIVE
+l6 = Card.LOWER_SIX
 l7 = Card.LOWER_SEVEN
+l8 = Card.LOWER_EIGHT
+l9 = Card.LOWER_NINE
 l10 = Card.LOWER_TEN
 
 u3 = Card.UPPER_THREE
+u4 = Card.UPPER_FOUR
+u5 = Card.UPPER_FIVE
+u6 = Card.UPPER_SIX
+u7 = Card.UPPER_SEVEN
 
 
 class ManagerTest(TestCase):
@@ -101,6 +108,54 @@ class ManagerTest(TestCase):
         cards = [l3]
         self.assertFalse(self.manager.check_win_with_card(HandCard(cards), u3))
 
+        # the triplet in cards is fixed as HandCard.set_cards does
+        handcard = HandCard([l8, l9, l10, u5, u6, u7, u7])
+        handcard.add_card(u7)
+        self.assertFalse(self.manager.check_win_with_card(handcard, l7))
+        self.assertTrue(self.manager.check_win_with_card(handcard, u4))
+        self.assertEqual(handcard.cards.count(u7), 3)
+
+        # the card is rolled back
+        handcard = HandCard([l3, l3, l4, l5])
+        for separate in (True, False):
+            for card in (l3, l6):
+                self.manager.check_win_with_card(handcard, card, separate)
+                self.assertListEqual(handcard.cards, [l3, l3, l4, l5])
+                self.assertEqual(len(handcard.fixed_cards), 0)
+
+    def test_get_candidates(self):
+        manager = self.manager
+        get_candidates = manager.get_candidates
+
+        self.assertListEqual(get_candidates(HandCard([l3])), [l3])
+        self.assertListEqual(get_candidates(HandCard([l3, l3])), [l3, u3])
+        # the triplet cannot be separated
+        cards = [l3, l3, l4, l5]
+        self.assertListEqual(get_candidates(HandCard(cards)), [l3, l6])
+        self.assertListEqual(get_candidates(HandCard(cards), False), [l6])
+        self.assertListEqual(get_candidates(HandCard([l3, l4])), [l2, l5])
+        self.assertListEqual(get_candidates(HandCard([l2, l7])), [l10])
+        self.assertListEqual(get_candidates(HandCard([l1, l5])), [])
+        manager.chow_filter.append(filter_sequence_1_5_10)
+        self.assertListEqual(get_candidates(HandCard([l1, l5])), [l10])
+
+        # the triplet in cards is fixed as in check_win_with_card
+        handcard = HandCard([l8, l9, l10, u5, u6, u7, u7])
+        handcard.add_card(u7)
+        self.assertListEqual(get_candidates(handcard), [u4, u7])
+
+        ran = random.Random(3)
+        wall = Card.NORMAL_CARDS * 4
+        for _ in range(200):
+            handcard = HandCard(ran.sample(wall, 10))
+            handcard.add_cards(ran.sample(Card.NORMAL_CARDS, 2))
+            for separate in (True, False):
+                self.assertListEqual(
+                    get_candidates(handcard, separate),
+                    [card for card in sorted(Card.NORMAL_CARDS)
+                     if manager.check_win_with_card(handcard, card, separate)]
+                )
+
     def test_has_candidate(self):
         manager = self.manager
         manager.chow_filter.append(filter_sequence_1_5_10)
@@ -135,6 +190,34 @@ class ManagerTest(TestCase):
         cards = [l3]
         self.assertListEqual(check_chow(HandCard(cards), u3), [])
 
+        # the same combs in another order are the same chow
+        cards = [l2, l3, l4, l4, l5]
+        self.assertListEqual(
+            check_chow(HandCard(cards), l3), [[l2, l3, l4, l3, l4, l5]]
+        )
+
+    def test_any_chow(self):
+        manager = self.manager
+        any_chow = manager.any_chow
+
+        self.assertTrue(any_chow(HandCard([l3, l3]), u3))
+        self.assertTrue(any_chow(HandCard([l3, l4]), l5))
+        # every l5 must be in the chow
+        self.assertFalse(any_chow(HandCard([l3, l4, l5, l5]), l5))
+        self.assertFalse(any_chow(HandCard([l1, l5]), l10))
+        manager.chow_filter.append(filter_sequence_1_5_10)
+        self.assertTrue(any_chow(HandCard([l1, l5]), l10))
+
+        ran = random.Random(5)
+        wall = Card.NORMAL_CARDS * 4
+        for _ in range(200):
+            handcard = HandCard(ran.sample(wall, 13))
+            card = ran.choice(Card.NORMAL_CARDS)
+            self.assertEqual(
+                any_chow(handcard, card),
+                bool(manager.check_chow(handcard, card))
+            )
+
     def test_check_chow_cards(self):
         check_chow_cards = self.manager.check_chow_cards
 